@@ -0,0 +1,68 @@
+"""Benchmark of DateValue.parse cache.
+
+Parses all DATE values of a generated corpus without cache and with
+cache, and reports cache hit rate. Results are appended to
+bench_output.txt in the top directory.
+
+Usage::
+
+    python bench/bench_parse_cache.py [--size 50000]
+"""
+
+import argparse
+import os
+import tempfile
+import time
+
+from corpus import date_strings, make_corpus, report
+
+from ged4py import date
+from ged4py.date import DateValue
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--size", type=int, default=50000,
+                        help="Number of individuals in corpus, default: %(default)s")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = os.path.join(tmpdir, "corpus.ged")
+        make_corpus(path, args.size)
+        dates = date_strings(path)
+
+    # uncached parser
+    start = time.perf_counter()
+    for datestr in dates:
+        date._parse(datestr)
+    uncached = time.perf_counter() - start
+
+    DateValue.parse_cache_clear()
+    start = time.perf_counter()
+    values = [DateValue.parse(datestr) for datestr in dates]
+    cached = time.perf_counter() - start
+    info = DateValue.parse_cache_info()
+
+    # all strings are in cache now
+    start = time.perf_counter()
+    for datestr in dates:
+        DateValue.parse(datestr)
+    warm = time.perf_counter() - start
+
+    # cached results are the same as uncached
+    assert all(repr(value) == repr(date._parse(datestr))
+               for datestr, value in zip(dates, values))
+
+    report("DateValue.parse cache", [
+        "corpus: {} DATE values, {} distinct".format(len(dates), len(set(dates))),
+        "uncached: {:.3f} s, cached: {:.3f} s, speedup {:.2f}x".format(
+            uncached, cached, uncached / cached),
+        "second pass with all strings cached: {:.3f} s".format(warm),
+        "cache: {} hits, {} misses, hit rate {:.1%}, {} entries of {}".format(
+            info.hits, info.misses, info.hits / (info.hits + info.misses),
+            info.currsize, info.maxsize),
+    ])
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+"""Benchmark of sorting DateValue instances.
+
+Parses DATE values of a generated corpus and sorts them twice, first
+sort computes ordering keys, second sort uses keys cached on instances.
+Results are appended to bench_output.txt in the top directory.
+
+To measure speedup against an older version run it again with
+``GED4PY_LIB`` set to the ``lib`` directory of that version, e.g.::
+
+    git worktree add /tmp/old <commit>
+    python bench/bench_sort.py
+    GED4PY_LIB=/tmp/old/lib python bench/bench_sort.py
+
+Usage::
+
+    python bench/bench_sort.py [--size 50000] [--dates 10000]
+"""
+
+import argparse
+import os
+import tempfile
+import time
+
+from corpus import date_strings, make_corpus, report
+
+import ged4py
+from ged4py.date import DateValue
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--size", type=int, default=50000,
+                        help="Number of individuals in corpus, default: %(default)s")
+    parser.add_argument("--dates", type=int, default=10000,
+                        help="Number of dates to sort, default: %(default)s")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = os.path.join(tmpdir, "corpus.ged")
+        make_corpus(path, args.size)
+        dates = date_strings(path)[:args.dates]
+
+    # parse without cache so that every instance computes its keys
+    if hasattr(DateValue, "parse_cache_clear"):
+        DateValue.parse_cache_clear()
+    values = [DateValue.parse(datestr) for datestr in dates]
+
+    start = time.perf_counter()
+    first = sorted(values)
+    cold = time.perf_counter() - start
+    start = time.perf_counter()
+    second = sorted(values)
+    warm = time.perf_counter() - start
+
+    assert [str(value) for value in first] == [str(value) for value in second]
+    assert all(not later < earlier for earlier, later in zip(first, first[1:]))
+
+    report("DateValue sort", [
+        "package: {}".format(os.path.dirname(ged4py.__file__)),
+        "sorted {} dates: first sort {:.3f} s, second sort {:.3f} s".format(
+            len(values), cold, warm),
+    ])
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+"""Benchmark of GedcomWriter throughput.
+
+Reads all level 0 records of a generated corpus and writes them
+repeatedly until about a million records are written, by default.
+Results are appended to bench_output.txt in the top directory.
+
+Usage::
+
+    python bench/bench_writer.py [--size 50000] [--records 1000000]
+"""
+
+import argparse
+import io
+import os
+import tempfile
+import time
+
+from corpus import make_corpus, report
+
+from ged4py.parser import GedcomReader
+from ged4py.writer import GedcomWriter
+
+
+def _rewrite(data):
+    """Read all records from GEDCOM data and write them to new data.
+    """
+    buffer = io.BytesIO()
+    with GedcomReader(io.BytesIO(data)) as reader, GedcomWriter(buffer) as writer:
+        writer.write_records(reader.records0())
+    return buffer.getvalue()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--size", type=int, default=50000,
+                        help="Number of individuals in corpus, default: %(default)s")
+    parser.add_argument("--records", type=int, default=1000000,
+                        help="Minimum number of records to write, default: %(default)s")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = os.path.join(tmpdir, "corpus.ged")
+        make_corpus(path, args.size)
+        with GedcomReader(path) as reader:
+            records = list(reader.records0())
+        with open(path, "rb") as file:
+            original = file.read()
+
+        # sanity check, records read back from output are written the same
+        data = _rewrite(original)
+        assert _rewrite(data) == data
+
+        repeat = -(-args.records // len(records))
+        output = os.path.join(tmpdir, "output.ged")
+        start = time.perf_counter()
+        with GedcomWriter(output) as writer:
+            for _ in range(repeat):
+                writer.write_records(records)
+        elapsed = time.perf_counter() - start
+        size = os.path.getsize(output)
+
+    report("GedcomWriter throughput", [
+        "corpus: {} records, {} lines".format(len(records), original.count(b"\n")),
+        "wrote {} records ({:.1f} MB) in {:.2f} s, {:.0f} records/s, {:.1f} MB/s".format(
+            repeat * len(records), size / 1e6, elapsed, repeat * len(records) / elapsed,
+            size / elapsed / 1e6),
+    ])
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,195 @@
+"""Generator of synthetic GEDCOM files for benchmarks.
+
+Generated files look like typical genealogy exports: individuals with
+names, birth and death events with dates of all kinds and places, source
+citations, notes with CONT/CONC lines, families with two to five members,
+sources and repositories. Output is deterministic for a given seed.
+
+Importing this module makes the package importable from the source tree.
+To run benchmarks against another version of the package set ``GED4PY_LIB``
+environment variable to its ``lib`` directory, e.g. of a ``git worktree``
+checkout of an older commit.
+"""
+
+__all__ = ["OUTPUT", "date_strings", "make_corpus", "make_date", "report"]
+
+import os
+import random
+import sys
+
+sys.path.insert(0, os.environ.get("GED4PY_LIB") or
+                os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "lib"))
+
+OUTPUT = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "bench_output.txt")
+"""File to which benchmark results are appended."""
+
+_MONTHS = ["JAN", "FEB", "MAR", "APR", "MAY", "JUN", "JUL", "AUG", "SEP",
+           "OCT", "NOV", "DEC"]
+
+_PLACES = ["Leeds, Yorkshire, England", "York, Yorkshire, England",
+           "Bradford,  yorkshire , England", "Manchester, Lancashire, England",
+           "Paris, France", "Boston, Suffolk, Massachusetts, USA", "", "Wien"]
+
+
+def make_date(rng, year):
+    """Return random date string in a given year.
+
+    Parameters
+    ----------
+    rng : `random.Random`
+        Random number generator.
+    year : `int`
+        Year number.
+
+    Returns
+    -------
+    date : `str`
+        Date string, most dates are simple, some are ranges, periods,
+        phrases, or dates in other calendars.
+    """
+    r = rng.random()
+    day, month = rng.randint(1, 28), rng.choice(_MONTHS)
+    if r < .3:
+        return "%d %s %d" % (day, month, year)
+    if r < .4:
+        return "%s %d" % (month, year)
+    if r < .5:
+        return "%d" % year
+    if r < .6:
+        return "ABT %d" % year
+    if r < .65:
+        return "BEF %d %s %d" % (day, month, year)
+    if r < .7:
+        return "AFT %d" % year
+    if r < .75:
+        return "BET %d AND %d" % (year, year + 2)
+    if r < .78:
+        return "FROM %d TO %d" % (year, year + 3)
+    if r < .8:
+        return "(sometime in spring)"
+    if r < .82:
+        return "@#DJULIAN@ %d %s %d" % (day, month, year)
+    if r < .84:
+        return "@#DHEBREW@ %d TSH %d" % (day, year + 3760)
+    if r < .85:
+        return "@#DFRENCH R@ %d VEND %d" % (day, rng.randint(1, 14))
+    if r < .87:
+        return "%d %s %d/%02d" % (day, month, year, (year + 1) % 100)
+    if r < .88:
+        return "INT %d (about then)" % year
+    return "%d %s %d" % (day, month, year)
+
+
+def make_corpus(path, size, seed=1):
+    """Write synthetic GEDCOM file.
+
+    Parameters
+    ----------
+    path : `str`
+        Output file name.
+    size : `int`
+        Number of individuals, file also has about ``size / 3`` families
+        and ``size / 50`` sources.
+    seed : `int`, optional
+        Seed for random number generator.
+    """
+    rng = random.Random(seed)
+    lines = ["0 HEAD", "1 SOUR TEST", "1 GEDC", "2 VERS 5.5.1",
+             "2 FORM LINEAGE-LINKED", "1 CHAR UTF-8"]
+    n_sources = max(1, size // 50)
+    born = {i: rng.randint(1700, 1950) for i in range(1, size + 1)}
+
+    # individuals from 3 on get parents from earlier individuals
+    famc = {}
+    fams = {}
+    families = []
+    i = 3
+    while i <= size:
+        family = len(families) + 1
+        husband = rng.randint(1, max(1, i - 2))
+        wife = rng.randint(1, max(1, i - 2))
+        if wife == husband:
+            wife = (husband % (i - 1)) + 1
+        children = list(range(i, min(size, i + rng.randint(1, 4)) + 1))
+        families.append((family, husband, wife, children))
+        for child in children:
+            famc[child] = family
+        fams.setdefault(husband, []).append(family)
+        fams.setdefault(wife, []).append(family)
+        i = children[-1] + 1
+
+    for i in range(1, size + 1):
+        lines += ["0 @I%d@ INDI" % i,
+                  "1 NAME John%d /Smith%d/" % (i, i % 97),
+                  "2 GIVN John%d" % i,
+                  "1 SEX %s" % rng.choice("MF"),
+                  "1 BIRT",
+                  "2 DATE " + make_date(rng, born[i]),
+                  "2 PLAC " + rng.choice(_PLACES)]
+        if rng.random() < .7:
+            lines += ["2 SOUR @S%d@" % rng.randint(1, n_sources),
+                      "3 PAGE p. %d" % rng.randint(1, 300),
+                      "3 QUAY %d" % rng.randint(0, 3)]
+        if rng.random() < .6:
+            lines += ["1 DEAT",
+                      "2 DATE " + make_date(rng, born[i] + rng.randint(0, 90)),
+                      "2 AGE %d" % rng.randint(0, 90),
+                      "2 PLAC " + rng.choice(_PLACES)]
+        if i in famc:
+            lines.append("1 FAMC @F%d@" % famc[i])
+        lines += ["1 FAMS @F%d@" % family for family in fams.get(i, [])]
+        if rng.random() < .1:
+            lines += ["1 NOTE a long note " + "x" * 50,
+                      "2 CONT second line",
+                      "2 CONC  continued"]
+    for family, husband, wife, children in families:
+        lines += ["0 @F%d@ FAM" % family,
+                  "1 HUSB @I%d@" % husband,
+                  "1 WIFE @I%d@" % wife]
+        lines += ["1 CHIL @I%d@" % child for child in children]
+        lines += ["1 MARR",
+                  "2 DATE " + make_date(rng, born[children[0]] - 1),
+                  "2 PLAC " + rng.choice(_PLACES)]
+    for source in range(1, n_sources + 1):
+        lines += ["0 @S%d@ SOUR" % source,
+                  "1 TITL Census %d" % source,
+                  "1 REPO @R%d@" % (source % 3 + 1)]
+    for repo in range(1, 4):
+        lines += ["0 @R%d@ REPO" % repo, "1 NAME Archive %d" % repo]
+    lines.append("0 TRLR")
+    with open(path, "w", encoding="utf-8", newline="\n") as file:
+        file.write("\n".join(lines) + "\n")
+
+
+def date_strings(path):
+    """Return values of all DATE records in a file.
+
+    Parameters
+    ----------
+    path : `str`
+        Name of a file made by `make_corpus`.
+
+    Returns
+    -------
+    dates : `list` [ `str` ]
+        Date strings in file order.
+    """
+    with open(path, encoding="utf-8") as file:
+        return [line.rstrip("\n").split(" ", 2)[2] for line in file
+                if line.split(" ", 2)[1] == "DATE"]
+
+
+def report(name, results):
+    """Print benchmark results and append them to `OUTPUT` file.
+
+    Parameters
+    ----------
+    name : `str`
+        Benchmark name.
+    results : `list` [ `str` ]
+        Lines of results.
+    """
+    text = "\n".join(["== " + name] + results) + "\n"
+    print(text, end="")
+    with open(OUTPUT, "a") as file:
+        file.write(text)
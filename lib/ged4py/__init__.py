@@ -6,10 +6,22 @@ Most of the code in the s package is located in individual modules:
 
 - :py:mod:`ged4py.parser` - defines :py:class:`~ged4py.parser.GedcomReader`
   class which is the main entry point for the whole package;
+- :py:mod:`ged4py.writer` - defines :py:class:`~ged4py.writer.GedcomWriter`
+  class for writing records back to GEDCOM files;
 - :py:mod:`ged4py.model` - collection of classes constituting ``ged4py`` data
   model;
 - :py:mod:`ged4py.calendar` - classes for working with calendar dates;
 - :py:mod:`ged4py.date` - parsing and handling of GEDCOM dates;
+- :py:mod:`ged4py.batch` - vectorized conversion of many calendar dates
+  (needs ``numpy``);
+- :py:mod:`ged4py.packed` - compact integer encoding of dates;
+- :py:mod:`ged4py.sorting` - helpers for sorting individuals;
+- :py:mod:`ged4py.query` - selector language for extracting records;
+- :py:mod:`ged4py.graph` - compact graph of family relations;
+- :py:mod:`ged4py.kinship` - relationships and kinship between individuals;
+- :py:mod:`ged4py.events` - flat table of events of all records;
+- :py:mod:`ged4py.index` - in-memory indices for fast queries over records;
+- :py:mod:`ged4py.subset` - extracting subsets of files without parsing;
 - :py:mod:`ged4py.detail` - few modules for implementation details.
 
 :py:class:`~ged4py.parser.GedcomReader` class can be imported directly from
@@ -17,9 +29,12 @@ top-level package as::
 
     from ged4py import GedcomReader
 
+:py:class:`~ged4py.writer.GedcomWriter` is also available from top-level
+package.
 """
 
 from .parser import GedcomReader  # noqa: F401
+from .writer import GedcomWriter  # noqa: F401
 
 # register ansel encoding
 import ansel as _ansel
@@ -0,0 +1,263 @@
+"""Module for batch conversion of calendar dates using NumPy.
+
+This module requires ``numpy`` package which is not a mandatory dependency
+of ``ged4py``, methods in this module raise `ImportError` if ``numpy`` is not
+installed.
+"""
+
+__all__ = ["CALENDAR_CODES", "date_arrays", "calendar_keys"]
+
+from .calendar import (CalendarType, FrenchDate, GregorianDate, HebrewDate,
+                       JulianDate, MONTHS_FREN, MONTHS_GREG, MONTHS_HEBR)
+from .detail import caltables
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+CALENDAR_CODES = {
+    CalendarType.GREGORIAN: 0,
+    CalendarType.JULIAN: 1,
+    CalendarType.HEBREW: 2,
+    CalendarType.FRENCH_R: 3,
+}
+"""Maps calendar type to an integer code used in calendar arrays."""
+
+# Julian Day used when no date could be converted, same as in calendar.py
+_FUTURE_JD = 2816787.5
+
+# convertdate.gregorian.EPOCH
+_GREGORIAN_EPOCH = 1721425.5
+
+
+def _check_numpy():
+    if np is None:
+        raise ImportError("numpy is needed for batch calendar conversion")
+
+
+def date_arrays(dates):
+    """Make arrays of calendar date components.
+
+    Parameters
+    ----------
+    dates : iterable [ `~ged4py.calendar.CalendarDate` ]
+        Calendar dates.
+
+    Returns
+    -------
+    calendar : `numpy.ndarray`
+        Calendar codes, see `CALENDAR_CODES`.
+    year : `numpy.ndarray`
+        Year numbers.
+    month : `numpy.ndarray`
+        Month numbers (1-based), 0 if month is not known.
+    day : `numpy.ndarray`
+        Day numbers, -1 if day is not known.
+    bc : `numpy.ndarray`
+        Boolean flags for B.C. years.
+    dual_year : `numpy.ndarray`
+        Dual year for Gregorian dates, 0 if not given.
+    """
+    _check_numpy()
+    rows = [(CALENDAR_CODES[date.calendar], date.year, date.month_num or 0,
+             -1 if date.day is None else date.day, date.bc, getattr(date, "dual_year", None) or 0)
+            for date in dates]
+    columns = list(zip(*rows)) if rows else [()] * 6
+    return (np.array(columns[0], dtype=np.int8),
+            np.array(columns[1], dtype=np.int64),
+            np.array(columns[2], dtype=np.int64),
+            np.array(columns[3], dtype=np.int64),
+            np.array(columns[4], dtype=bool),
+            np.array(columns[5], dtype=np.int64))
+
+
+def _gregorian_month_length(year, month):
+    # same as in convertdate.gregorian.legal_date
+    leap = (year % 4 == 0) & ((year % 100 != 0) | (year % 400 == 0))
+    return np.where(month == 2, 28 + leap, np.where(np.isin(month, (4, 6, 9, 11)), 30, 31))
+
+
+def _gregorian_to_jd(year, month, day):
+    # same as convertdate.gregorian.to_jd, with integer arithmetic
+    leap = (year % 4 == 0) & ((year % 100 != 0) | (year % 400 == 0))
+    leap_adj = np.where(month <= 2, 0, np.where(leap, -1, -2))
+    year1 = year - 1
+    return (_GREGORIAN_EPOCH - 1 + 365 * year1 + year1 // 4 - year1 // 100 + year1 // 400 +
+            (367 * month - 362 + 12 * (leap_adj + day)) // 12)
+
+
+def _julian_month_length(year, month):
+    # same as convertdate.julian.month_length
+    return np.where(month == 2, 28 + (year % 4 == 0),
+                    np.where(np.isin(month, (4, 6, 9, 11)), 30, 31))
+
+
+def _julian_to_jd(year, month, day):
+    # same as convertdate.julian.to_jd, floor(365.25*x) done in integers
+    early = month <= 2
+    year = np.where(early, year - 1, year)
+    month = np.where(early, month + 12, month)
+    return ((1461 * (year + 4716)) // 4 + np.floor(30.6001 * (month + 1)) + day) - 1524.5
+
+
+def _solar_keys(year, month, day, month_length, to_jd):
+    """Keys for Gregorian and Julian dates, same logic as in
+    `GregorianDate.key()` and `JulianDate.key()`.
+    """
+    no_month = month == 0
+    no_day = (day < 0) & ~no_month
+    # Take Jan 1 of next year or first day of next month
+    month1 = np.where(no_month, 1, np.where(no_day, month + 1, month))
+    year1 = np.where(no_month, year + 1, year)
+    wrap = no_day & (month1 == 13)
+    month1 = np.where(wrap, 1, month1)
+    year1 = np.where(wrap, year1 + 1, year1)
+    day1 = np.where(no_month | no_day, 1, day)
+    offset1 = np.where(no_month | no_day, 1., 0.)
+
+    candidates = [
+        (year1, month1, day1, offset1),
+        (year1, month1 + 1, np.ones_like(day1), 1.),
+        (year1 + 1, np.ones_like(month1), np.ones_like(day1), 1.),
+    ]
+    jd = np.full(year.shape, _FUTURE_JD)
+    done = np.zeros(year.shape, dtype=bool)
+    for cyear, cmonth, cday, coffset in candidates:
+        valid = ~done & (cday > 0) & (cday <= month_length(cyear, cmonth))
+        jd = np.where(valid, to_jd(cyear, cmonth, cday) - coffset, jd)
+        done |= valid
+    return jd
+
+
+def _hebrew_keys(year, month, day):
+    """Keys for Hebrew dates, same logic as in `HebrewDate.key()`.
+    """
+    table = caltables.hebrew_table()
+    leap = ((year * 7) + 1) % 19 < 7
+    month = np.where(month == 0, np.where(leap, 13, 12), month)
+    in_table = ((year >= caltables.HEBREW_FIRST_YEAR) & (year <= caltables.HEBREW_LAST_YEAR) &
+                (month >= 1) & (month <= 13))
+    index = np.where(in_table, year - caltables.HEBREW_FIRST_YEAR, 0)
+    tmonth = np.where(in_table, month, 1)
+    lengths = np.array(table.lengths, dtype=np.int64)
+    offsets = np.array(table.offsets, dtype=np.int64)
+    base = np.array(table.base)
+    day = np.where(day < 0, lengths[index, tmonth], day)
+    jd = np.floor(base[index] + 1 + day + offsets[index, tmonth]) + 0.5
+    # everything else is done by regular code
+    fallback = ~in_table | (jd <= 0)
+    return jd, fallback
+
+
+def _french_keys(year, month, day):
+    """Keys for French Republican dates, same logic as in `FrenchDate.key()`.
+    """
+    years = np.unique(np.concatenate([year, year + 1]))
+    params = [caltables.french_year(int(y)) for y in years]
+    starts = np.array([start for start, _ in params])
+    leaps = np.array([leap for _, leap in params], dtype=np.int64)
+
+    month = np.where(month == 0, 13, month)
+    day = np.where(day < 0, np.where(month == 13, 5, 30), day)
+    candidates = [
+        (year, month, day, 0.),
+        (year, month + 1, np.ones_like(day), 1.),
+        (year + 1, np.ones_like(month), np.ones_like(day), 1.),
+    ]
+    jd = np.full(year.shape, _FUTURE_JD)
+    done = np.zeros(year.shape, dtype=bool)
+    for cyear, cmonth, cday, coffset in candidates:
+        pos = np.searchsorted(years, cyear)
+        valid = (~done & (cday >= 1) & (cday <= 30) & (cmonth <= 13) &
+                 ((cmonth != 13) | (cday <= 5 + leaps[pos])))
+        cjd = np.trunc(starts[pos] - 0.5) + 0.5 + 30 * (cmonth - 1) + (cday - 1)
+        jd = np.where(valid, cjd - coffset, jd)
+        done |= valid
+    return jd
+
+
+def calendar_keys(calendar, year, month, day, bc, dual_year=None):
+    """Calculate ordering keys for arrays of calendar dates.
+
+    Parameters
+    ----------
+    calendar : `numpy.ndarray`
+        Calendar codes, see `CALENDAR_CODES`.
+    year : `numpy.ndarray`
+        Year numbers.
+    month : `numpy.ndarray`
+        Month numbers (1-based), 0 if month is not known.
+    day : `numpy.ndarray`
+        Day numbers, -1 if day is not known.
+    bc : `numpy.ndarray`
+        Boolean flags for B.C. years.
+    dual_year : `numpy.ndarray`, optional
+        Dual year for Gregorian dates, 0 if not given.
+
+    Returns
+    -------
+    jd : `numpy.ndarray`
+        Julian Day numbers, same as first item of
+        `~ged4py.calendar.CalendarDate.key()`.
+    flag : `numpy.ndarray`
+        Flags, same as second item of `~ged4py.calendar.CalendarDate.key()`.
+
+    Notes
+    -----
+    Gregorian and Julian dates are converted with integer arithmetic,
+    Hebrew and French Republican dates use precomputed calendar tables.
+    Result is identical to calling `~ged4py.calendar.CalendarDate.key()` for
+    each date, including the substitution of missing month or day. Arrays
+    for input are usually made with `date_arrays` method.
+    """
+    _check_numpy()
+    calendar = np.asarray(calendar)
+    month = np.asarray(month, dtype=np.int64)
+    day = np.asarray(day, dtype=np.int64)
+    bc = np.asarray(bc, dtype=bool)
+    year = np.asarray(year, dtype=np.int64)
+    gregorian = calendar == CALENDAR_CODES[CalendarType.GREGORIAN]
+    if dual_year is not None:
+        dual_year = np.asarray(dual_year, dtype=np.int64)
+        year = np.where(gregorian & (dual_year != 0), dual_year, year)
+    year = np.where(bc, -year, year)
+
+    jd = np.full(year.shape, _FUTURE_JD)
+    flag = ((month == 0) | (day < 0)).astype(np.int8)
+
+    for code, month_length, to_jd in (
+            (CALENDAR_CODES[CalendarType.GREGORIAN], _gregorian_month_length, _gregorian_to_jd),
+            (CALENDAR_CODES[CalendarType.JULIAN], _julian_month_length, _julian_to_jd)):
+        sel = calendar == code
+        if sel.any():
+            jd[sel] = _solar_keys(year[sel], month[sel], day[sel], month_length, to_jd)
+
+    sel = calendar == CALENDAR_CODES[CalendarType.HEBREW]
+    if sel.any():
+        hebrew_jd, fallback = _hebrew_keys(year[sel], month[sel], day[sel])
+        jd[sel] = hebrew_jd
+        for i in np.flatnonzero(sel)[fallback]:
+            jd[i] = _scalar_key(calendar[i], year[i], month[i], day[i])
+
+    sel = calendar == CALENDAR_CODES[CalendarType.FRENCH_R]
+    if sel.any():
+        jd[sel] = _french_keys(year[sel], month[sel], day[sel])
+
+    return jd, flag
+
+
+def _scalar_key(calendar, year, month, day):
+    """Calculate Julian Day for one date using regular calendar classes.
+
+    ``year`` here is the signed year number.
+    """
+    klass, months = {
+        CALENDAR_CODES[CalendarType.GREGORIAN]: (GregorianDate, MONTHS_GREG),
+        CALENDAR_CODES[CalendarType.JULIAN]: (JulianDate, MONTHS_GREG),
+        CALENDAR_CODES[CalendarType.HEBREW]: (HebrewDate, MONTHS_HEBR),
+        CALENDAR_CODES[CalendarType.FRENCH_R]: (FrenchDate, MONTHS_FREN),
+    }[int(calendar)]
+    date = klass(abs(int(year)), months[month - 1] if month else None,
+                 None if day < 0 else int(day), bc=year < 0)
+    return date.key()[0]
@@ -10,11 +10,12 @@ import abc
 import enum
 import re
 
-import convertdate.french_republican
 import convertdate.gregorian
 import convertdate.hebrew
 import convertdate.julian
 
+from .detail import caltables
+
 MONTHS_GREG = ['JAN', 'FEB', 'MAR', 'APR', 'MAY', 'JUN', 'JUL', 'AUG',
                'SEP', 'OCT', 'NOV', 'DEC']
 MONTHS_HEBR = ['TSH', 'CSH', 'KSL', 'TVT', 'SHV', 'ADR', 'ADS', 'NSN',
@@ -107,9 +108,12 @@ class CalendarDate(metaclass=abc.ABCMeta):
 
     Implementation for different calendars are provided by subclasses which
     can implement additional attributes or methods. All subclasses need to
-    implement `key()` method to support ordering of the dates from
-    different calendars. There are presently four implementations defined
-    in this module:
+    implement `_make_key()` method to support ordering of the dates from
+    different calendars, its result is cached and returned from `key()`.
+    Subclasses must implement `_make_key()` instead of `key()`, which was
+    abstract in earlier versions; subclasses which only override `key()`
+    cannot be instantiated and their keys would not be cached. There are
+    presently four implementations defined in this module:
 
         - `GregorianDate` for "GREGORIAN" calendar
         - `JulianDate` for "JULIAN" calendar
@@ -153,6 +157,9 @@ class CalendarDate(metaclass=abc.ABCMeta):
         except ValueError:
             pass
 
+        # ordering key, calculated on first use
+        self._key = None
+
     @classmethod
     @abc.abstractmethod
     def months(self):
@@ -160,7 +167,6 @@ class CalendarDate(metaclass=abc.ABCMeta):
         """
         raise NotImplementedError()
 
-    @abc.abstractmethod
     def key(self):
         """Return ordering key for this instance.
 
@@ -170,6 +176,18 @@ class CalendarDate(metaclass=abc.ABCMeta):
         returned in its place (in corresponding calendar, and converted to
         JD) and ``flag`` should be set to 1. If date and month are known then
         flag should be set to 0.
+
+        Key is calculated by `_make_key()` on first call and cached, the
+        attributes of the instance should not be modified after that.
+        """
+        key = self._key
+        if key is None:
+            key = self._key = self._make_key()
+        return key
+
+    @abc.abstractmethod
+    def _make_key(self):
+        """Calculate ordering key for this instance, see `key()`.
         """
         raise NotImplementedError()
 
@@ -351,9 +369,8 @@ class GregorianDate(CalendarDate):
         # docstring inherited from base class
         return CalendarType.GREGORIAN
 
-    def key(self):
-        """Return ordering key for this instance.
-        """
+    def _make_key(self):
+        # docstring inherited from base class
         calendar = convertdate.gregorian
 
         # In dual dating use second year
@@ -433,9 +450,8 @@ class JulianDate(CalendarDate):
         """
         return MONTHS_GREG
 
-    def key(self):
-        """Return ordering key for this instance.
-        """
+    def _make_key(self):
+        # docstring inherited from base class
         calendar = convertdate.julian
 
         year = - self.year if self.bc else self.year
@@ -499,13 +515,11 @@ class HebrewDate(CalendarDate):
         """
         return MONTHS_HEBR
 
-    def key(self):
-        """Return ordering key for this instance.
-        """
-        calendar = convertdate.hebrew
+    def _make_key(self):
+        # docstring inherited from base class
         year = - self.year if self.bc else self.year
-        month = self.month_num or calendar.year_months(year)
-        day = self.day if self.day is not None else calendar.month_days(year, month)
+        month = self.month_num or convertdate.hebrew.year_months(year)
+        day = self.day if self.day is not None else caltables.hebrew_month_length(year, month)
 
         dates = [
             (year, month, day, 0.),
@@ -514,7 +528,7 @@ class HebrewDate(CalendarDate):
         ]
         for year, month, day, offset in dates:
             try:
-                jd = calendar.to_jd(year, month, day) - offset
+                jd = caltables.hebrew_to_jd(year, month, day) - offset
                 break
             except ValueError:
                 # Likely a non-existing date, use another
@@ -549,10 +563,8 @@ class FrenchDate(CalendarDate):
         """
         return MONTHS_FREN
 
-    def key(self):
-        """Return ordering key for this instance.
-        """
-        calendar = convertdate.french_republican
+    def _make_key(self):
+        # docstring inherited from base class
         year = - self.year if self.bc else self.year
         month = self.month_num or 13
         day = self.day
@@ -570,7 +582,7 @@ class FrenchDate(CalendarDate):
         ]
         for year, month, day, offset in dates:
             try:
-                jd = calendar.to_jd(year, month, day) - offset
+                jd = caltables.french_to_jd(year, month, day) - offset
                 break
             except ValueError:
                 # Likely a non-existing date, use another
@@ -11,6 +11,7 @@ __all__ = [
 
 import abc
 import enum
+import functools
 import re
 
 from .calendar import CalendarDate, GregorianDate, DATE
@@ -160,12 +161,17 @@ class DateValue(metaclass=abc.ABCMeta):
     """
     def __init__(self, key):
         self._key = key
+        self._jd_key = None
 
     @classmethod
     def parse(cls, datestr):
         """Parse string <DATE_VALUE> string and make `DateValue`
         instance out of it.
 
+        Results of parsing are kept in a bounded cache (see
+        `parse_cache_info`), parsing the same string again returns the same
+        instance. Returned instances are shared and must not be modified.
+
         Parameters
         ----------
         datestr : `str`
@@ -176,24 +182,26 @@ class DateValue(metaclass=abc.ABCMeta):
         date_value : `DateValue`
             Object representing the date value.
         """
-        # In some cases date strings can have leadin/trailing spaces
-        if datestr:
-            datestr = datestr.strip()
-        # some apps generate DATE recods without any value, which is
-        # non-standard, return empty DateValue for those
-        if not datestr:
-            return DateValuePhrase(None)
-        for regex, klass in DATES:
-            m = regex.match(datestr)
-            if m is not None:
-                groups = {}
-                for key, val in m.groupdict().items():
-                    if key != 'phrase':
-                        val = CalendarDate.parse(val)
-                    groups[key] = val
-                return klass(**groups)
-        # if cannot parse string assume it is a phrase
-        return DateValuePhrase(datestr)
+        return _parse_cached(datestr)
+
+    @staticmethod
+    def parse_cache_info():
+        """Return statistics of the `parse` cache.
+
+        Returns
+        -------
+        info : `tuple`
+            Named tuple with ``hits``, ``misses``, ``maxsize`` and
+            ``currsize`` attributes, same as returned from
+            ``functools.lru_cache`` ``cache_info()`` method.
+        """
+        return _parse_cached.cache_info()
+
+    @staticmethod
+    def parse_cache_clear():
+        """Clear the `parse` cache and its statistics.
+        """
+        _parse_cached.cache_clear()
 
     @property
     @abc.abstractmethod
@@ -223,26 +231,46 @@ class DateValue(metaclass=abc.ABCMeta):
             return _END_OF_TIME, _END_OF_TIME
         return self._key
 
+    def ordering_key(self):
+        """Return numeric ordering key for this instance.
+
+        This is equivalent to `key()` for ordering purposes, but it is cached
+        and can be compared without calling methods of calendar dates.
+        Comparison operators of this class compare these keys.
+
+        Returns
+        -------
+        key : `tuple` [ `tuple` ]
+            Pair of keys of the two dates returned from `key()`, each is a
+            ``(jd, flag)`` tuple returned from
+            `~ged4py.calendar.CalendarDate.key()`.
+        """
+        jd_key = self._jd_key
+        if jd_key is None:
+            date1, date2 = self.key()
+            jd_key = self._jd_key = (date1.key(), date2.key())
+        return jd_key
+
     def __lt__(self, other):
-        return self.key() < other.key()
+        return self.ordering_key() < other.ordering_key()
 
     def __le__(self, other):
-        return self.key() <= other.key()
+        return self.ordering_key() <= other.ordering_key()
 
     def __eq__(self, other):
-        return self.key() == other.key()
+        return self.ordering_key() == other.ordering_key()
 
     def __ne__(self, other):
-        return self.key() != other.key()
+        return self.ordering_key() != other.ordering_key()
 
     def __gt__(self, other):
-        return self.key() > other.key()
+        return self.ordering_key() > other.ordering_key()
 
     def __ge__(self, other):
-        return self.key() >= other.key()
+        return self.ordering_key() >= other.ordering_key()
 
     def __hash__(self):
-        return hash(self.key())
+        return hash(self.ordering_key())
 
     @abc.abstractmethod
     def accept(self, visitor):
@@ -736,6 +764,61 @@ DATES = (
     (re.compile(DATE_SIMPLE, re.X | re.I), DateValueSimple),
 )
 
+# Each of the DATES patterns, except the last two, starts with a keyword, so
+# only the patterns for the leading keyword of a string need to be tried.
+# Strings starting with keyword can also match DATE_SIMPLE if keyword looks
+# like a month name (e.g. "BET 1900"), so it is always tried last, same as
+# in DATES.
+_KEYWORD_RE = re.compile(r"[A-Z]+|\(", re.I)
+_DISPATCH = {
+    "FROM": (DATES[0], DATES[1], DATES[11]),
+    "TO": (DATES[2], DATES[11]),
+    "BET": (DATES[3], DATES[11]),
+    "BEF": (DATES[4], DATES[11]),
+    "AFT": (DATES[5], DATES[11]),
+    "ABT": (DATES[6], DATES[11]),
+    "CAL": (DATES[7], DATES[11]),
+    "EST": (DATES[8], DATES[11]),
+    "INT": (DATES[9], DATES[11]),
+    "(": (DATES[10],),
+}
+_SIMPLE = (DATES[11],)
+
+
+PARSE_CACHE_SIZE = 65536
+"""Maximum number of date strings kept in `DateValue.parse` cache."""
+
+
+def _parse(datestr):
+    """Parse <DATE_VALUE> string, implementation of `DateValue.parse`.
+    """
+    # In some cases date strings can have leadin/trailing spaces
+    if datestr:
+        datestr = datestr.strip()
+    # some apps generate DATE recods without any value, which is
+    # non-standard, return empty DateValue for those
+    if not datestr:
+        return DateValuePhrase(None)
+    keyword = _KEYWORD_RE.match(datestr)
+    patterns = _SIMPLE
+    if keyword is not None:
+        patterns = _DISPATCH.get(keyword.group().upper(), _SIMPLE)
+    for regex, klass in patterns:
+        m = regex.match(datestr)
+        if m is not None:
+            groups = {}
+            for key, val in m.groupdict().items():
+                if key != 'phrase':
+                    val = CalendarDate.parse(val)
+                groups[key] = val
+            return klass(**groups)
+    # if cannot parse string assume it is a phrase
+    return DateValuePhrase(datestr)
+
+
+# Date strings repeat a lot in real files, lru_cache is thread-safe
+_parse_cached = functools.lru_cache(maxsize=PARSE_CACHE_SIZE)(_parse)
+
 
 class DateValueVisitor(metaclass=abc.ABCMeta):
     """Interface for implementation of Visitor pattern for `DateValue`
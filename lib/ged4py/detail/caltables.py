@@ -0,0 +1,166 @@
+"""Internal module with precomputed tables for Hebrew and French Republican
+calendars.
+
+Conversion of Hebrew and French Republican dates to Julian Day numbers in
+``convertdate`` is expensive, Hebrew conversion repeats molad and year length
+arithmetic for every call, and French conversion calculates autumn equinox.
+Methods in this module produce identical results using tables that are built
+once on first use. Dates outside of the table range are passed to
+``convertdate``.
+"""
+
+import functools
+from math import trunc
+
+import convertdate.french_republican
+import convertdate.hebrew
+
+HEBREW_FIRST_YEAR = 1
+"""First Hebrew year covered by the table."""
+
+HEBREW_LAST_YEAR = 9999
+"""Last Hebrew year covered by the table."""
+
+
+class HebrewTable:
+    """Table of Hebrew calendar years.
+
+    Attributes
+    ----------
+    first : `int`
+        First year in the table.
+    base : `list` [ `float` ]
+        For each year, Julian Day number of the day preceding day 0 of Tishri
+        (so that JD of Tishri 1 is ``base + 1``).
+    lengths : `list` [ `tuple` ]
+        For each year, 15-tuple of month lengths indexed by month number
+        (``convertdate`` numbering, Nisan is 1, Tishri is 7), element 0 and
+        element 14 are not used.
+    offsets : `list` [ `tuple` ]
+        For each year, 15-tuple indexed by month number (1 to 14) with the
+        number of days between the start of the year and the start of month.
+    """
+    def __init__(self, first, last):
+        hebrew = convertdate.hebrew
+        self.first = first
+        delay_1 = {year: hebrew.delay_1(year) for year in range(first - 1, last + 3)}
+
+        def _base(year):
+            # same as convertdate.hebrew.delay_2
+            last, present, next_ = delay_1[year - 1], delay_1[year], delay_1[year + 1]
+            if next_ - present == 356:
+                delay_2 = 2
+            elif present - last == 382:
+                delay_2 = 1
+            else:
+                delay_2 = 0
+            return hebrew.EPOCH + present + delay_2
+
+        bases = [_base(year) for year in range(first, last + 2)]
+        self.base = bases[:-1]
+        self.lengths = []
+        self.offsets = []
+        for i, year in enumerate(range(first, last + 1)):
+            year_days = bases[i + 1] - bases[i]
+            n_months = hebrew.year_months(year)
+            lengths = [0] * 15
+            for month in range(1, 14):
+                # same as convertdate.hebrew.month_length
+                if month in (hebrew.IYYAR, hebrew.TAMMUZ, hebrew.ELUL,
+                             hebrew.TEVETH, hebrew.VEADAR):
+                    length = 29
+                elif month == hebrew.ADAR and not hebrew.leap(year):
+                    length = 29
+                elif month == hebrew.HESHVAN and year_days % 10 != 5:
+                    length = 29
+                elif month == hebrew.KISLEV and year_days % 10 == 3:
+                    length = 29
+                else:
+                    length = 30
+                lengths[month] = length
+            # same as loops in convertdate.hebrew.to_jd
+            offsets = [0] * 15
+            for month in range(1, 15):
+                if month < hebrew.TISHRI:
+                    offsets[month] = (sum(lengths[hebrew.TISHRI:n_months + 1]) +
+                                      sum(lengths[1:month]))
+                else:
+                    offsets[month] = sum(lengths[hebrew.TISHRI:month])
+            self.lengths.append(tuple(lengths))
+            self.offsets.append(tuple(offsets))
+
+
+@functools.lru_cache(maxsize=None)
+def hebrew_table():
+    """Return Hebrew calendar table, it is built on first call.
+
+    Returns
+    -------
+    table : `HebrewTable`
+        Table for years `HEBREW_FIRST_YEAR` to `HEBREW_LAST_YEAR`.
+    """
+    return HebrewTable(HEBREW_FIRST_YEAR, HEBREW_LAST_YEAR)
+
+
+def hebrew_month_length(year, month):
+    """Return number of days in a Hebrew month.
+
+    Same as ``convertdate.hebrew.month_length()``.
+    """
+    if HEBREW_FIRST_YEAR <= year <= HEBREW_LAST_YEAR and 1 <= month <= 13:
+        return hebrew_table().lengths[year - HEBREW_FIRST_YEAR][month]
+    return convertdate.hebrew.month_length(year, month)
+
+
+def hebrew_to_jd(year, month, day):
+    """Convert Hebrew date to Julian Day number.
+
+    Same as ``convertdate.hebrew.to_jd()``, month numbering is the same as
+    in ``convertdate``.
+    """
+    if HEBREW_FIRST_YEAR <= year <= HEBREW_LAST_YEAR and 1 <= month <= 14:
+        table = hebrew_table()
+        index = year - HEBREW_FIRST_YEAR
+        jd = table.base[index] + 1 + day + table.offsets[index][month]
+        if jd > 0:
+            return int(jd) + 0.5
+    return convertdate.hebrew.to_jd(year, month, day)
+
+
+@functools.lru_cache(maxsize=None)
+def french_year(year):
+    """Return parameters of a French Republican calendar year.
+
+    Parameters are calculated on first call for each year.
+
+    Returns
+    -------
+    start : `float`
+        Julian Day number of the first day of the year.
+    leap : `bool`
+        ``True`` for leap years.
+    """
+    french = convertdate.french_republican
+    return french.to_jd(year, 1, 1), french.leap(year)
+
+
+def french_to_jd(year, month, day):
+    """Convert French Republican date to Julian Day number.
+
+    Same as ``convertdate.french_republican.to_jd()`` with default (equinox)
+    method.
+
+    Raises
+    ------
+    ValueError
+        Raised for invalid dates.
+    """
+    if day < 1 or day > 30:
+        raise ValueError("Invalid day for this calendar")
+    if month > 13:
+        raise ValueError("Invalid month for this calendar")
+    start, leap = french_year(year)
+    if month == 13 and day > 5 + leap:
+        raise ValueError("Invalid day for this month in this calendar")
+    # same as convertdate.french_republican._to_jd_equinox
+    return trunc(start - 0.5) + 0.5 + 30 * (month - 1) + (day - 1)
@@ -0,0 +1,130 @@
+"""Internal module for extracting values of many sub-records at once.
+"""
+
+from array import array
+
+from ..model import Pointer
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Marker for values that were not found yet
+_MISSING = object()
+
+
+class ExtractPlan:
+    """Compiled set of paths extracted from each record.
+
+    Parameters
+    ----------
+    paths : `list` [ `str` ]
+        Paths to extract, same as paths in `~ged4py.model.Record.sub_tag`.
+    follow : `bool`
+        If True then resolve pointers.
+
+    Notes
+    -----
+    Paths are compiled into a trie, each node of the trie is a dictionary
+    mapping tag name to a tuple ``(columns, node, subtree)``, ``columns`` is
+    a list of the indices of paths which end at this tag, ``node`` is the
+    trie node for longer paths (or ``None``), and ``subtree`` is a list of
+    the indices of all paths going through this tag. Sub-records are visited depth-first in
+    document order and each path takes the value of the first record that
+    matches it, which is the same record that `~ged4py.model.Record.sub_tag`
+    returns, so every path is resolved in one traversal of a record.
+    """
+    def __init__(self, paths, follow=True):
+        self.size = len(paths)
+        self.follow = follow
+        self.root = {}
+        for column, path in enumerate(paths):
+            tags = path.split('/')
+            if len(tags) > 1 and not tags[-1]:
+                # trailing slash is ignored by sub_tag
+                del tags[-1]
+            node = self.root
+            for i, tag in enumerate(tags):
+                columns, child, subtree = node.get(tag, ([], None, []))
+                subtree.append(column)
+                if i == len(tags) - 1:
+                    columns.append(column)
+                elif child is None:
+                    child = {}
+                node[tag] = (columns, child, subtree)
+                node = child
+
+    def values(self, record):
+        """Extract values of all paths from a record.
+
+        Parameters
+        ----------
+        record : `~ged4py.model.Record`
+            Record to extract values from.
+
+        Returns
+        -------
+        values : `list`
+            Values for each path, ``None`` if path is missing.
+        """
+        values = [_MISSING] * self.size
+        self._visit(record, self.root, values, self.size)
+        return [None if value is _MISSING else value for value in values]
+
+    def _visit(self, record, node, values, missing):
+        """Fill values from sub-records of a record, returns number of
+        values which are still missing.
+        """
+        follow = self.follow
+        for rec in record.sub_records or ():
+            match = node.get(rec.tag)
+            if match is None:
+                continue
+            columns, child, subtree = match
+            for column in subtree:
+                if values[column] is _MISSING:
+                    break
+            else:
+                # everything under this tag is known already
+                continue
+            if follow and isinstance(rec, Pointer):
+                rec = rec.ref
+                if rec is None:
+                    continue
+            for column in columns:
+                if values[column] is _MISSING:
+                    values[column] = rec.value
+                    missing -= 1
+            if not missing:
+                break
+            if child is not None:
+                missing = self._visit(rec, child, values, missing)
+                if not missing:
+                    break
+        return missing
+
+
+def make_column(values, column_type):
+    """Convert list of values into a column.
+
+    Parameters
+    ----------
+    values : `list`
+        Column values.
+    column_type : `str` or `object`
+        One-character string is a type code for `array.array`, anything else
+        is passed to ``numpy.array`` as ``dtype``, ``None`` keeps the list.
+
+    Returns
+    -------
+    column : `list`, `array.array`, or `numpy.ndarray`
+        Column data.
+    """
+    if column_type is None:
+        return values
+    if isinstance(column_type, str) and len(column_type) == 1:
+        return array(column_type, values)
+    if np is None:
+        raise ImportError("numpy is needed for numpy column types")
+    return np.array(values, dtype=column_type)
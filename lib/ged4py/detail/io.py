@@ -4,6 +4,7 @@
 import codecs
 import io
 import os
+import threading
 from typing import List
 
 
@@ -98,3 +99,176 @@ class BinaryFileCR(io.BufferedReader):
                     nxt = self.read(1)
                     data.append(nxt)
                 return b"".join(data)
+
+
+class PositionalFile:
+    """Random access to a binary file which is safe to use from many threads.
+
+    If the file is a regular file (`io.FileIO` or buffered reader on top of
+    it) and platform has `os.pread` then data is read with ``os.pread`` which
+    does not use or change file position. Otherwise reads are serialized with
+    a lock, each read re-positions the file.
+
+    Parameters
+    ----------
+    file
+        File object open in binary mode, must be seekable.
+    """
+    def __init__(self, file):
+        self._file = file
+        self._lock = threading.Lock()
+        self._fd = None
+        raw = file
+        while not isinstance(raw, io.FileIO) and hasattr(raw, "raw"):
+            raw = raw.raw
+        if isinstance(raw, io.FileIO) and hasattr(os, "pread"):
+            self._fd = raw.fileno()
+
+    @property
+    def lock(self):
+        """Lock which serializes access to the file position
+        (`threading.Lock`).
+        """
+        return self._lock
+
+    def read_at(self, offset, size):
+        """Read data at given position.
+
+        Parameters
+        ----------
+        offset : `int`
+            Position in the file.
+        size : `int`
+            Maximum number of bytes to read.
+
+        Returns
+        -------
+        data : `bytes`
+            Data read from file, shorter than ``size`` only at EOF.
+        """
+        if self._fd is not None:
+            return os.pread(self._fd, size, offset)
+        with self._lock:
+            self._file.seek(offset)
+            return self._file.read(size)
+
+    def size(self):
+        """Return size of the file in bytes (`int`).
+        """
+        if self._fd is not None:
+            return os.fstat(self._fd).st_size
+        with self._lock:
+            return self._file.seek(0, io.SEEK_END)
+
+
+class BufferSource:
+    """Part of a file already read into memory, can be used in place of
+    `PositionalFile` for `LineReader`.
+
+    Parameters
+    ----------
+    data : `bytes`
+        File data.
+    offset : `int`
+        Position of the data in the file.
+    """
+    def __init__(self, data, offset):
+        self._data = data
+        self._offset = offset
+
+    def read_at(self, offset, size):
+        """Read data at given position.
+
+        Parameters
+        ----------
+        offset : `int`
+            Position in the file, must not be before the start of data.
+        size : `int`
+            Maximum number of bytes to read.
+
+        Returns
+        -------
+        data : `bytes`
+            Data, shorter than ``size`` only at the end of data.
+        """
+        start = offset - self._offset
+        return self._data[start:start + size]
+
+
+class LineReader:
+    """Iterator over lines of `PositionalFile` with its own buffer and
+    position.
+
+    Lines can be terminated by LF, CR-LF, or CR, same as in `BinaryFileCR`.
+    Each instance keeps its own position so that any number of instances
+    can read the same file concurrently.
+
+    Parameters
+    ----------
+    source : `PositionalFile` or `BufferSource`
+        File to read from.
+    offset : `int`
+        Position in the file to start reading.
+    end : `int`, optional
+        Position in the file where reading stops, as if it was EOF.
+    chunk_size : `int`, optional
+        Number of bytes to read from the file at once, by default whole
+        range is read at once if ``end`` is given, otherwise 8 KiB.
+    """
+    def __init__(self, source, offset, end=None, chunk_size=None):
+        if chunk_size is None:
+            chunk_size = 8192 if end is None else max(end - offset, 1)
+        self._source = source
+        self._end = end
+        self._chunk_size = chunk_size
+        self._buffer = b""
+        self._buffer_offset = offset   # file position of the buffer start
+        self._pos = 0                  # current position in the buffer
+        self._eof = False
+
+    def __iter__(self):
+        """Iterate over remaining lines.
+
+        Each buffer is split into lines at once, only complete lines are
+        returned before more data is read.
+
+        Yields
+        ------
+        offset : `int`
+            Position of the line in the file.
+        line : `bytes`
+            Line data including its line terminator.
+        """
+        while True:
+            buffer = self._buffer
+            pos = self._pos
+            if self._eof:
+                tail = len(buffer)
+            else:
+                # CR at the end of buffer can be followed by LF, so line is
+                # only complete if there is something after it
+                tail = max(buffer.rfind(b"\n"), buffer.rfind(b"\r", 0, len(buffer) - 1)) + 1
+            if tail > pos:
+                offset = self._buffer_offset + pos
+                self._pos = tail
+                for line in buffer[pos:tail].splitlines(True):
+                    yield offset, line
+                    offset += len(line)
+            if self._eof:
+                return
+            self._fill()
+
+    def _fill(self):
+        """Read next chunk of data into buffer.
+        """
+        end = self._buffer_offset + len(self._buffer)
+        size = self._chunk_size
+        if self._end is not None:
+            size = min(size, self._end - end)
+        data = self._source.read_at(end, size) if size > 0 else b""
+        if not data:
+            self._eof = True
+            return
+        self._buffer = self._buffer[self._pos:] + data
+        self._buffer_offset += self._pos
+        self._pos = 0
@@ -1,7 +1,16 @@
 """Internal module for parsing names in gedcom format.
+
+Large files often repeat identical names, so parsing is memoized on the
+NAME value and the values of the sub-records that a dialect looks at.
 """
 
+import functools
+
+NAME_CACHE_SIZE = 65536
+"""Maximum number of parsed names kept in each cache."""
+
 
+@functools.lru_cache(maxsize=NAME_CACHE_SIZE)
 def split_name(name):
     """Extracts pieces of name from full name string.
 
@@ -87,10 +96,17 @@ def parse_name_altree(record):
 
     ALTREE also replaces empty names with question mark, we undo that too.
     """
-    name_tuple = split_name(record.value)
+    return _parse_altree(record.value, record.sub_tag_value("SURN"))
+
+
+@functools.lru_cache(maxsize=NAME_CACHE_SIZE)
+def _parse_altree(value, maiden):
+    """Implementation of `parse_name_altree`, ``maiden`` is the value of SURN
+    sub-record.
+    """
+    name_tuple = split_name(value)
     if name_tuple[1] == '?':
         name_tuple = (name_tuple[0], '', name_tuple[2])
-    maiden = record.sub_tag_value("SURN")
     if maiden:
         # strip "(maiden)" from family name
         ending = '(' + maiden + ')'
@@ -145,8 +161,15 @@ def parse_name_myher(record):
 
 
     """
-    name_tuple = split_name(record.value)
-    married = record.sub_tag_value("_MARNM")
+    return _parse_myher(record.value, record.sub_tag_value("_MARNM"))
+
+
+@functools.lru_cache(maxsize=NAME_CACHE_SIZE)
+def _parse_myher(value, married):
+    """Implementation of `parse_name_myher`, ``married`` is the value of
+    _MARNM sub-record.
+    """
+    name_tuple = split_name(value)
     if married:
         maiden = name_tuple[1]
         name_tuple = (name_tuple[0],
@@ -175,5 +198,5 @@ def parse_name_ancestris(record):
         the same as returned from `split_name` method, fourth element
         (if present) denotes maiden name.
     """
-    name_tuple = split_name(record.value)
-    return name_tuple
+    # no sub-records are used, so memoized split_name is all that is needed
+    return split_name(record.value)
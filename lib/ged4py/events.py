@@ -0,0 +1,251 @@
+"""Module for extracting events of all records into a flat table.
+"""
+
+__all__ = ["COLUMNS", "Event", "EventTable"]
+
+import csv
+import json
+from typing import NamedTuple, Optional, Tuple
+
+from .date import DateValueTypes
+
+COLUMNS = ("xref_id", "tag", "lo", "hi", "date", "place_id", "place", "age",
+           "individuals")
+"""Names of the columns written by `EventTable.write_csv` and keys of the
+objects written by `EventTable.write_jsonl`."""
+
+
+class Event(NamedTuple):
+    """Single row of the event table.
+
+    Attributes
+    ----------
+    xref_id : `str`
+    tag : `str`
+    lo : `float` or ``None``
+    hi : `float` or ``None``
+    date : `str` or ``None``
+    place_id : `int` or ``None``
+    age : `str` or ``None``
+    individuals : `tuple` [ `str` ]
+    """
+    xref_id: str
+    """Reference ID of the INDI or FAM record owning the event (`str`)"""
+
+    tag: str
+    """Event tag name (`str`)"""
+
+    lo: Optional[float]
+    """Julian Day number of the first end of the date key, ``None`` if event
+    has no date or date has no calendar date (`float`)"""
+
+    hi: Optional[float]
+    """Julian Day number of the second end of the date key (`float`)"""
+
+    date: Optional[str]
+    """Original value of the DATE record, ``None`` if event has no date
+    (`str`)"""
+
+    place_id: Optional[int]
+    """Index of the PLAC value in `EventTable.places`, ``None`` if event has
+    no place (`int`)"""
+
+    age: Optional[str]
+    """Value of the AGE record, ``None`` if event has no age (`str`)"""
+
+    individuals: Tuple[str, ...]
+    """Reference IDs of individuals participating in the event, for FAM
+    records these are the values of HUSB and WIFE pointers
+    (`tuple` [ `str` ])"""
+
+
+class EventTable:
+    """Table of events of INDI and FAM records.
+
+    Notes
+    -----
+    Events are extracted in one pass over level 0 records, each event is an
+    `Event` tuple with the date already converted into a pair of Julian Day
+    numbers (same key as used by `~ged4py.index.DateIndex`) and with place
+    name replaced by an index into `places` table. Pointers are not resolved,
+    so extraction reads every record exactly once.
+
+    Table can be written to JSON Lines or CSV file, and it can be used to
+    build `~ged4py.index.DateIndex`, `~ged4py.index.PlaceIndex` and
+    `~ged4py.index.LifespanIndex` (see their ``from_events`` methods) without
+    reading the file again.
+
+    Typical use::
+
+        with GedcomReader(path) as parser:
+            table = EventTable.from_reader(parser)
+        dates = DateIndex.from_events(table)
+        places = PlaceIndex.from_events(table)
+
+    Events can also be streamed without keeping them in memory, only the
+    place table is kept::
+
+        table = EventTable()
+        with GedcomReader(path) as parser, open(output, "w") as file:
+            table.write_jsonl(file, table.scan(parser))
+    """
+    def __init__(self):
+        self._events = []
+        self._places = []
+        self._place_ids = {}
+
+    @classmethod
+    def from_reader(cls, reader, tags=None):
+        """Make table from all INDI and FAM records in a file.
+
+        Parameters
+        ----------
+        reader : `~ged4py.parser.GedcomReader`
+            Parser instance.
+        tags : `tuple` [ `str` ], optional
+            Event tags to extract, see `scan`.
+
+        Returns
+        -------
+        table : `EventTable`
+            New table instance.
+        """
+        table = cls()
+        table._events.extend(table.scan(reader, tags))
+        return table
+
+    @property
+    def events(self):
+        """List of events in document order (`list` [ `Event` ])."""
+        return self._events
+
+    @property
+    def places(self):
+        """Distinct PLAC values in order of first appearance, must not be
+        modified (`list` [ `str` ]).
+        """
+        return self._places
+
+    def place_id(self, place):
+        """Return index of a place name, adding it to the table if needed.
+
+        Parameters
+        ----------
+        place : `str`
+            Place name as it appears in PLAC record.
+
+        Returns
+        -------
+        place_id : `int`
+            Index of the place in `places`.
+        """
+        place_id = self._place_ids.get(place)
+        if place_id is None:
+            place_id = self._place_ids[place] = len(self._places)
+            self._places.append(place)
+        return place_id
+
+    def scan(self, reader, tags=None):
+        """Extract events from all INDI and FAM records in a file.
+
+        Events are not added to `events` list, but their places are added
+        to `places` table.
+
+        Parameters
+        ----------
+        reader : `~ged4py.parser.GedcomReader`
+            Parser instance.
+        tags : `tuple` [ `str` ], optional
+            Event tags to extract, all direct sub-records with these tags are
+            extracted. If not given then all direct sub-records which have
+            DATE, PLAC or AGE sub-record are extracted.
+
+        Yields
+        ------
+        event : `Event`
+            Extracted events in document order.
+        """
+        if tags is not None:
+            tags = frozenset(tags)
+        for offset, rec_tag in reader.index0:
+            if rec_tag not in ("INDI", "FAM"):
+                continue
+            record = reader.read_record(offset)
+            if rec_tag == "INDI":
+                individuals = (record.xref_id,)
+            else:
+                individuals = tuple(rec.value for rec in record.sub_records or ()
+                                    if rec.tag in ("HUSB", "WIFE"))
+            for event in record.sub_records or ():
+                if tags is not None and event.tag not in tags:
+                    continue
+                date = place = age = None
+                for rec in event.sub_records or ():
+                    if rec.tag == "DATE":
+                        if date is None:
+                            date = rec
+                    elif rec.tag == "PLAC":
+                        if place is None:
+                            place = rec.value
+                    elif rec.tag == "AGE":
+                        if age is None:
+                            age = rec.value
+                if tags is None and date is None and place is None and age is None:
+                    continue
+                lo = hi = raw_date = None
+                if date is not None:
+                    raw_date = date.raw_value
+                    date_value = date.value
+                    if date_value is not None and date_value.kind is not DateValueTypes.PHRASE:
+                        date1, date2 = date_value.key()
+                        lo, hi = date1.key()[0], date2.key()[0]
+                yield Event(record.xref_id, event.tag, lo, hi, raw_date,
+                            self.place_id(place) if place else None, age,
+                            individuals)
+
+    def _rows(self, events):
+        """Convert events into dictionaries with `COLUMNS` keys.
+        """
+        places = self._places
+        for event in events:
+            row = event._asdict()
+            row["place"] = None if event.place_id is None else places[event.place_id]
+            yield row
+
+    def write_jsonl(self, file, events=None):
+        """Write events in JSON Lines format, one JSON object per event.
+
+        Parameters
+        ----------
+        file : file object
+            Text file to write to.
+        events : iterable [ `Event` ], optional
+            Events to write, e.g. generator returned from `scan`, `events`
+            are written if not given.
+        """
+        for row in self._rows(self._events if events is None else events):
+            file.write(json.dumps({name: row[name] for name in COLUMNS}))
+            file.write("\n")
+
+    def write_csv(self, file, events=None):
+        """Write events in CSV format with a header line.
+
+        Missing values are written as empty strings, individuals are
+        separated by spaces.
+
+        Parameters
+        ----------
+        file : file object
+            Text file to write to, should be opened with ``newline=""``.
+        events : iterable [ `Event` ], optional
+            Events to write, e.g. generator returned from `scan`, `events`
+            are written if not given.
+        """
+        writer = csv.DictWriter(file, COLUMNS, extrasaction="ignore")
+        writer.writeheader()
+        for row in self._rows(self._events if events is None else events):
+            row["individuals"] = " ".join(row["individuals"])
+            writer.writerow(row)
+
+    def __len__(self):
+        return len(self._events)
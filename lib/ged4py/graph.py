@@ -0,0 +1,377 @@
+"""Module containing compact graph representation of family relations.
+"""
+
+__all__ = ["FamilyGraph"]
+
+from array import array
+from collections import deque
+
+
+def _csr(size, edges):
+    """Make compressed sparse row arrays from a list of edges.
+
+    Parameters
+    ----------
+    size : `int`
+        Number of nodes.
+    edges : `list` [ `tuple` ]
+        List of (source, target) node pairs.
+
+    Returns
+    -------
+    offsets : `array.array`
+        Array of ``size + 1`` offsets into ``targets``, targets of node ``i``
+        are ``targets[offsets[i]:offsets[i+1]]``.
+    targets : `array.array`
+        Array of target nodes.
+    """
+    offsets = array('l', [0]) * (size + 1)
+    for source, _ in edges:
+        offsets[source + 1] += 1
+    for i in range(size):
+        offsets[i + 1] += offsets[i]
+    targets = array('l', [0]) * len(edges)
+    fill = offsets[:-1]
+    for source, target in edges:
+        targets[fill[source]] = target
+        fill[source] += 1
+    return offsets, targets
+
+
+class FamilyGraph:
+    """Graph of parent, child and spouse relations between individuals.
+
+    Parameters
+    ----------
+    xref_ids : `list` [ `str` ]
+        Reference IDs of INDI records, position in this list is used as
+        integer node ID.
+    families : `list` [ `tuple` ]
+        List of (xref_id, husband, wife, children) tuples, ``husband`` and
+        ``wife`` are node IDs or -1, ``children`` is a list of node IDs.
+
+    Notes
+    -----
+    Navigating between individuals via `~ged4py.model.Individual.mother` or
+    `~ged4py.model.Individual.father` reads and parses family records at
+    every hop. This class is built with one pass over FAM records and keeps
+    the relations in compressed sparse row (CSR) arrays of integer node IDs,
+    so that traversals over many generations do not touch the file at all.
+    Use `node` and `xref_id` methods to convert between node IDs and INDI
+    reference IDs.
+
+    Typical use::
+
+        with GedcomReader(path) as parser:
+            graph = FamilyGraph.from_reader(parser)
+            root = graph.node("@I1@")
+            for node, depth in graph.ancestors(root).items():
+                print(graph.xref_id(node), depth)
+    """
+    def __init__(self, xref_ids, families):
+        self._xref_ids = list(xref_ids)
+        self._nodes = {xref_id: i for i, xref_id in enumerate(self._xref_ids)}
+        self._fam_xref_ids = [family[0] for family in families]
+        self._fam_husband = array('l', [family[1] for family in families])
+        self._fam_wife = array('l', [family[2] for family in families])
+        self._fam_offsets, self._fam_children = _csr(
+            len(families),
+            [(i, child) for i, family in enumerate(families) for child in family[3]])
+
+        size = len(self._xref_ids)
+        parent_edges = []
+        spouse_edges = []
+        for _, husband, wife, children in families:
+            for parent in (husband, wife):
+                if parent >= 0:
+                    parent_edges += [(child, parent) for child in children
+                                     if child != parent]
+            if husband >= 0 and wife >= 0 and husband != wife:
+                spouse_edges += [(husband, wife), (wife, husband)]
+        parent_edges = list(dict.fromkeys(parent_edges))
+        spouse_edges = list(dict.fromkeys(spouse_edges))
+        self._parent_offsets, self._parents = _csr(size, parent_edges)
+        self._child_offsets, self._children = _csr(
+            size, [(parent, child) for child, parent in parent_edges])
+        self._spouse_offsets, self._spouses = _csr(size, spouse_edges)
+        self._order = None
+        self._generations = None
+
+    @classmethod
+    def from_reader(cls, reader):
+        """Make graph from the records in a file.
+
+        Individuals are taken from the file index, only FAM records are
+        parsed. Pointers to non-existing individuals are ignored.
+
+        Parameters
+        ----------
+        reader : `~ged4py.parser.GedcomReader`
+            Parser instance.
+
+        Returns
+        -------
+        graph : `FamilyGraph`
+            New graph instance.
+        """
+        xref_ids = [xref_id for xref_id, (_, tag) in reader.xref0.items()
+                    if tag == "INDI"]
+        nodes = {xref_id: i for i, xref_id in enumerate(xref_ids)}
+        families = []
+        for record in reader.records0("FAM"):
+            husband, wife, children = -1, -1, []
+            for rec in record.sub_tags(follow=False):
+                node = nodes.get(rec.value, -1)
+                if node < 0:
+                    continue
+                if rec.tag == "HUSB" and husband < 0:
+                    husband = node
+                elif rec.tag == "WIFE" and wife < 0:
+                    wife = node
+                elif rec.tag == "CHIL":
+                    children.append(node)
+            families.append((record.xref_id, husband, wife, children))
+        return cls(xref_ids, families)
+
+    def __len__(self):
+        return len(self._xref_ids)
+
+    def node(self, xref_id):
+        """Return node ID for INDI reference ID.
+
+        Parameters
+        ----------
+        xref_id : `str`
+            Reference ID of INDI record, e.g. "@I1@".
+
+        Returns
+        -------
+        node : `int`
+            Node ID.
+
+        Raises
+        ------
+        KeyError
+            Raised if reference ID is not known.
+        """
+        return self._nodes[xref_id]
+
+    def xref_id(self, node):
+        """Return INDI reference ID for node ID (`str`).
+        """
+        return self._xref_ids[node]
+
+    def parents(self, node):
+        """Return parents of an individual (`array.array` [ `int` ]).
+        """
+        return self._parents[self._parent_offsets[node]:self._parent_offsets[node + 1]]
+
+    def children(self, node):
+        """Return children of an individual (`array.array` [ `int` ]).
+        """
+        return self._children[self._child_offsets[node]:self._child_offsets[node + 1]]
+
+    def spouses(self, node):
+        """Return spouses of an individual (`array.array` [ `int` ]).
+        """
+        return self._spouses[self._spouse_offsets[node]:self._spouse_offsets[node + 1]]
+
+    @property
+    def families(self):
+        """Reference IDs of FAM records (`list` [ `str` ]), position in this
+        list is a family ID accepted by `family` method.
+        """
+        return self._fam_xref_ids
+
+    def family(self, family):
+        """Return members of a family.
+
+        Parameters
+        ----------
+        family : `int`
+            Family ID, index in `families` list.
+
+        Returns
+        -------
+        husband : `int`
+            Node ID of husband or -1.
+        wife : `int`
+            Node ID of wife or -1.
+        children : `array.array` [ `int` ]
+            Node IDs of children.
+        """
+        return (self._fam_husband[family], self._fam_wife[family],
+                self._fam_children[self._fam_offsets[family]:self._fam_offsets[family + 1]])
+
+    def _adjacency(self, direction):
+        if direction == "parents":
+            return self._parent_offsets, self._parents
+        elif direction == "children":
+            return self._child_offsets, self._children
+        elif direction == "spouses":
+            return self._spouse_offsets, self._spouses
+        raise ValueError("unexpected direction: {}".format(direction))
+
+    def bfs(self, start, direction="parents", max_depth=None):
+        """Breadth-first traversal starting at a given node.
+
+        Parameters
+        ----------
+        start : `int`
+            Node ID of starting individual.
+        direction : `str`, optional
+            Edges to follow, one of "parents", "children", or "spouses".
+        max_depth : `int`, optional
+            If given then traversal stops at this depth.
+
+        Yields
+        ------
+        node : `int`
+            Node ID, each node is returned once, starting node first.
+        depth : `int`
+            Number of edges from starting node (shortest path).
+        """
+        offsets, targets = self._adjacency(direction)
+        seen = {start}
+        queue = deque([(start, 0)])
+        while queue:
+            node, depth = queue.popleft()
+            yield node, depth
+            if max_depth is not None and depth >= max_depth:
+                continue
+            for i in range(offsets[node], offsets[node + 1]):
+                target = targets[i]
+                if target not in seen:
+                    seen.add(target)
+                    queue.append((target, depth + 1))
+
+    def dfs(self, start, direction="parents", max_depth=None):
+        """Depth-first (pre-order) traversal starting at a given node.
+
+        Parameters are the same as for `bfs` method.
+
+        Yields
+        ------
+        node : `int`
+            Node ID, each node is returned once, starting node first.
+        depth : `int`
+            Number of edges from starting node along the traversal path.
+        """
+        offsets, targets = self._adjacency(direction)
+        seen = set()
+        stack = [(start, 0)]
+        while stack:
+            node, depth = stack.pop()
+            if node in seen:
+                continue
+            seen.add(node)
+            yield node, depth
+            if max_depth is not None and depth >= max_depth:
+                continue
+            for i in range(offsets[node + 1] - 1, offsets[node] - 1, -1):
+                if targets[i] not in seen:
+                    stack.append((targets[i], depth + 1))
+
+    def ancestors(self, node, max_depth=None):
+        """Return ancestors of an individual.
+
+        Parameters
+        ----------
+        node : `int`
+            Node ID of an individual.
+        max_depth : `int`, optional
+            Maximum number of generations.
+
+        Returns
+        -------
+        ancestors : `dict` [ `int`, `int` ]
+            Maps node ID of each ancestor to the smallest number of
+            generations separating it from the individual, individual itself
+            is not included.
+        """
+        result = dict(self.bfs(node, "parents", max_depth))
+        del result[node]
+        return result
+
+    def descendants(self, node, max_depth=None):
+        """Return descendants of an individual.
+
+        Parameters
+        ----------
+        node : `int`
+            Node ID of an individual.
+        max_depth : `int`, optional
+            Maximum number of generations.
+
+        Returns
+        -------
+        descendants : `dict` [ `int`, `int` ]
+            Maps node ID of each descendant to the smallest number of
+            generations separating it from the individual, individual itself
+            is not included.
+        """
+        result = dict(self.bfs(node, "children", max_depth))
+        del result[node]
+        return result
+
+    def topological_order(self):
+        """Return nodes ordered so that parents precede their children.
+
+        Individuals that are part of a cycle in parent relations (which is
+        always a data error) and their descendants are placed at the end in
+        arbitrary order.
+
+        Returns
+        -------
+        order : `array.array` [ `int` ]
+            Node IDs.
+        """
+        if self._order is None:
+            self._compute_order()
+        return self._order
+
+    def generation_depth(self):
+        """Return generation number of each individual.
+
+        Generation number is zero for individuals without known parents and
+        one more than the largest generation number of parents for everybody
+        else. Individuals in parent cycles and their descendants get -1.
+
+        Returns
+        -------
+        depth : `array.array` [ `int` ]
+            Generation numbers indexed by node ID.
+        """
+        if self._generations is None:
+            self._compute_order()
+        return self._generations
+
+    def _compute_order(self):
+        """Kahn's algorithm over child edges.
+        """
+        size = len(self._xref_ids)
+        n_parents = array('l', [self._parent_offsets[i + 1] - self._parent_offsets[i]
+                                for i in range(size)])
+        generations = array('l', [-1]) * size
+        order = array('l', [i for i in range(size) if n_parents[i] == 0])
+        for i in order:
+            generations[i] = 0
+        pos = 0
+        while pos < len(order):
+            node = order[pos]
+            pos += 1
+            generation = generations[node] + 1
+            for i in range(self._child_offsets[node], self._child_offsets[node + 1]):
+                child = self._children[i]
+                if generations[child] < generation:
+                    generations[child] = generation
+                n_parents[child] -= 1
+                if n_parents[child] == 0:
+                    order.append(child)
+        if len(order) < size:
+            for i in range(size):
+                if n_parents[i] > 0:
+                    generations[i] = -1
+                    order.append(i)
+        self._order = order
+        self._generations = generations
@@ -0,0 +1,1007 @@
+"""Module containing in-memory indices built over GEDCOM records.
+"""
+
+__all__ = ["EVENT_TAGS", "DateIndex", "LifespanIndex", "PlaceNode", "PlaceIndex",
+           "Citation", "CitationIndex"]
+
+import sys
+from array import array
+from bisect import bisect_left, bisect_right
+from typing import NamedTuple, Optional
+
+from .calendar import CalendarDate, GregorianDate
+from .date import DateValue, DateValueTypes, _START_OF_TIME, _END_OF_TIME
+from .model import Pointer
+
+EVENT_TAGS = ("BIRT", "CHR", "BAPM", "DEAT", "BURI", "CREM", "MARR", "DIV")
+"""Default set of event tags indexed by `DateIndex`."""
+
+# Julian Day numbers of the sentinels used for open-ended date keys
+_START_JD = _START_OF_TIME.key()[0]
+_END_JD = _END_OF_TIME.key()[0]
+
+
+def _finite(jd):
+    """Return ``True`` if Julian Day number is not an open end of a range.
+    """
+    return jd is not None and _START_JD < jd < _END_JD
+
+
+def _jd(value, upper=False):
+    """Convert query boundary into Julian Day number.
+
+    Parameters
+    ----------
+    value : `~ged4py.date.DateValue`, `~ged4py.calendar.CalendarDate`, \
+            `int` or `float`
+        Boundary value, integer number is interpreted as Gregorian year,
+        floating point number is taken as Julian Day number.
+    upper : `bool`
+        If ``True`` then value is an upper boundary, this selects second
+        date of a date range or last day of a year.
+
+    Returns
+    -------
+    jd : `float`
+        Julian Day number.
+    """
+    if isinstance(value, DateValue):
+        return value.key()[1 if upper else 0].key()[0]
+    if isinstance(value, CalendarDate):
+        return value.key()[0]
+    if isinstance(value, int):
+        if upper:
+            return GregorianDate(value, "DEC", 31).key()[0]
+        return GregorianDate(value, "JAN", 1).key()[0]
+    return float(value)
+
+
+class _DateTable:
+    """Sorted arrays of date keys for a single event tag.
+
+    Parameters
+    ----------
+    events : `list` [ `tuple` ]
+        List of (lo, hi, xref_id) tuples.
+    """
+    def __init__(self, events):
+        by_lo = sorted(events, key=lambda event: event[0])
+        self.lo = array('d', [event[0] for event in by_lo])
+        self.lo_hi = array('d', [event[1] for event in by_lo])
+        self.lo_ids = [event[2] for event in by_lo]
+        by_hi = sorted(events, key=lambda event: event[1])
+        self.hi = array('d', [event[1] for event in by_hi])
+        self.hi_lo = array('d', [event[0] for event in by_hi])
+        self.hi_ids = [event[2] for event in by_hi]
+
+
+class DateIndex:
+    """Index of event dates ordered by Julian Day number.
+
+    Notes
+    -----
+    For each event tag (e.g. "BIRT" or "MARR") index keeps two sorted arrays
+    of Julian Day numbers, one for the first and one for the second date of
+    the date key (`~ged4py.date.DateValue.key()`). Simple dates have both
+    ends equal, ranges, periods and approximate dates (e.g. ``BEF 1900``)
+    have distinct ends, so they can be matched either by containment or by
+    overlap. Range queries are performed with binary search on those arrays
+    and return reference IDs of the records owning the events. Dates that
+    have no calendar date (``PHRASE`` kind) are not indexed.
+
+    Typical use::
+
+        with GedcomReader(path) as parser:
+            index = DateIndex.from_reader(parser)
+            for xref_id in index.between("BIRT", 1820, 1840):
+                ...
+
+    Query boundaries can be given as `~ged4py.date.DateValue` or
+    `~ged4py.calendar.CalendarDate` instances, integer Gregorian years, or
+    Julian Day numbers (`float`).
+    """
+    def __init__(self):
+        self._events = {}   # maps tag to a list of (lo, hi, xref_id)
+        self._tables = {}   # maps tag to _DateTable, built on demand
+
+    @classmethod
+    def from_reader(cls, reader, tags=EVENT_TAGS):
+        """Make index from all INDI and FAM records in a file.
+
+        Parameters
+        ----------
+        reader : `~ged4py.parser.GedcomReader`
+            Parser instance.
+        tags : `tuple` [ `str` ], optional
+            Event tags to index.
+
+        Returns
+        -------
+        index : `DateIndex`
+            New index instance.
+        """
+        index = cls()
+        for rec_tag in ("INDI", "FAM"):
+            for record in reader.records0(rec_tag):
+                for event in record.sub_tags(*tags, follow=False):
+                    date = event.sub_tag("DATE", follow=False)
+                    if date is not None:
+                        index.add(event.tag, record.xref_id, date.value)
+        return index
+
+    @classmethod
+    def from_events(cls, table, tags=EVENT_TAGS):
+        """Make index from an event table.
+
+        Parameters
+        ----------
+        table : `~ged4py.events.EventTable`
+            Table of events.
+        tags : `tuple` [ `str` ], optional
+            Event tags to index.
+
+        Returns
+        -------
+        index : `DateIndex`
+            New index instance.
+        """
+        index = cls()
+        tags = frozenset(tags)
+        for event in table.events:
+            if event.lo is not None and event.tag in tags:
+                index._events.setdefault(event.tag, []).append((event.lo, event.hi,
+                                                                event.xref_id))
+        return index
+
+    def add(self, tag, xref_id, date):
+        """Add one event to the index.
+
+        Parameters
+        ----------
+        tag : `str`
+            Event tag name.
+        xref_id : `str`
+            Reference ID of the record owning the event.
+        date : `~ged4py.date.DateValue`
+            Event date, ``None`` or dates without calendar date are ignored.
+        """
+        if date is None or date.kind is DateValueTypes.PHRASE:
+            return
+        date1, date2 = date.key()
+        self._events.setdefault(tag, []).append((date1.key()[0],
+                                                 date2.key()[0],
+                                                 xref_id))
+        self._tables.pop(tag, None)
+
+    def tags(self):
+        """Return the set of indexed event tags (`set` [ `str` ]).
+        """
+        return set(self._events)
+
+    def _table(self, tag):
+        table = self._tables.get(tag)
+        if table is None:
+            table = self._tables[tag] = _DateTable(self._events.get(tag, []))
+        return table
+
+    def between(self, tag, start, end):
+        """Return events whose complete date range is within given dates.
+
+        Parameters
+        ----------
+        tag : `str`
+            Event tag name.
+        start, end
+            Boundaries of the interval, inclusive.
+
+        Returns
+        -------
+        xref_ids : `list` [ `str` ]
+            Reference IDs of the records, ordered by the event date.
+        """
+        start, end = _jd(start), _jd(end, upper=True)
+        table = self._table(tag)
+        lo = bisect_left(table.lo, start)
+        hi = bisect_right(table.lo, end)
+        return [table.lo_ids[i] for i in range(lo, hi) if table.lo_hi[i] <= end]
+
+    def overlapping(self, tag, start, end):
+        """Return events whose date range overlaps given dates.
+
+        Parameters
+        ----------
+        tag : `str`
+            Event tag name.
+        start, end
+            Boundaries of the interval, inclusive.
+
+        Returns
+        -------
+        xref_ids : `list` [ `str` ]
+            Reference IDs of the records, ordered by the first (or second)
+            date of the event.
+        """
+        start, end = _jd(start), _jd(end, upper=True)
+        table = self._table(tag)
+        # scan whichever sorted array gives fewer candidates
+        n_lo = bisect_right(table.lo, end)
+        first_hi = bisect_left(table.hi, start)
+        if n_lo <= len(table.hi) - first_hi:
+            return [table.lo_ids[i] for i in range(n_lo)
+                    if table.lo_hi[i] >= start]
+        return [table.hi_ids[i] for i in range(first_hi, len(table.hi))
+                if table.hi_lo[i] <= end]
+
+    def __len__(self):
+        return sum(len(events) for events in self._events.values())
+
+
+class _IntervalNode:
+    """Node of a static centered interval tree.
+
+    Parameters
+    ----------
+    intervals : `list` [ `tuple` ]
+        List of (lo, hi, xref_id) tuples, must not be empty.
+    """
+    def __init__(self, intervals):
+        endpoints = sorted(point for lo, hi, _ in intervals for point in (lo, hi))
+        self.center = center = endpoints[len(endpoints) // 2]
+        left, right, here = [], [], []
+        for interval in intervals:
+            if interval[1] < center:
+                left.append(interval)
+            elif interval[0] > center:
+                right.append(interval)
+            else:
+                here.append(interval)
+        here.sort(key=lambda interval: interval[0])
+        self.by_lo = here
+        self.by_hi = sorted(here, key=lambda interval: interval[1], reverse=True)
+        self.left = _IntervalNode(left) if left else None
+        self.right = _IntervalNode(right) if right else None
+
+
+class LifespanIndex:
+    """Interval index of individual lifespans.
+
+    Parameters
+    ----------
+    lifespans : `list` [ `tuple` ]
+        List of (lo, hi, xref_id) tuples, ``lo`` and ``hi`` are Julian Day
+        numbers of earliest birth and latest death.
+
+    Notes
+    -----
+    Lifespan of each individual is determined from the dates of birth and
+    death events, earliest possible birth date and latest possible death
+    date are used as the ends of lifespan interval. If one end is not known
+    (event or date is missing, or date is open-ended like ``BEF 1900``) it
+    is estimated from the other end assuming maximum lifespan. Individuals
+    with no usable dates are not indexed.
+
+    Lifespans are stored in a static centered interval tree which answers
+    "alive at" (stabbing) and overlap queries in ``O(log n + k)`` time.
+    Query dates are specified in the same way as for `DateIndex`.
+    """
+
+    BIRTH_TAGS = ("BIRT", "CHR", "BAPM")
+    """Tags of events used for birth date, in order of preference."""
+
+    DEATH_TAGS = ("DEAT", "BURI", "CREM")
+    """Tags of events used for death date, in order of preference."""
+
+    def __init__(self, lifespans):
+        self._lifespans = {xref_id: (lo, hi) for lo, hi, xref_id in lifespans}
+        self._root = _IntervalNode(list(lifespans)) if lifespans else None
+
+    @classmethod
+    def from_reader(cls, reader, max_lifespan=100):
+        """Make index from all INDI records in a file.
+
+        Parameters
+        ----------
+        reader : `~ged4py.parser.GedcomReader`
+            Parser instance.
+        max_lifespan : `float`, optional
+            Maximum lifespan in years, used to estimate missing ends.
+
+        Returns
+        -------
+        index : `LifespanIndex`
+            New index instance.
+        """
+        def _event_date(record, tags):
+            for tag in tags:
+                date = record.sub_tag_value(tag + "/DATE", follow=False)
+                if date is not None and date.kind is not DateValueTypes.PHRASE:
+                    return date
+            return None
+
+        return cls.from_dates(((record.xref_id,
+                                _event_date(record, cls.BIRTH_TAGS),
+                                _event_date(record, cls.DEATH_TAGS))
+                               for record in reader.records0("INDI")),
+                              max_lifespan=max_lifespan)
+
+    @classmethod
+    def from_events(cls, table, max_lifespan=100):
+        """Make index from an event table.
+
+        Parameters
+        ----------
+        table : `~ged4py.events.EventTable`
+            Table of events, only events of INDI records are used.
+        max_lifespan : `float`, optional
+            Maximum lifespan in years, used to estimate missing ends.
+
+        Returns
+        -------
+        index : `LifespanIndex`
+            New index instance.
+        """
+        # Same choice of events as in from_reader: for each tag take the
+        # first event which has DATE, skip the tag if date is a phrase.
+        ranks = {tag: rank for rank, tag in enumerate(cls.BIRTH_TAGS + cls.DEATH_TAGS)}
+        n_birth = len(cls.BIRTH_TAGS)
+        found = {}   # maps xref_id to [birth_rank, birth_ends, death_rank, death_ends]
+        seen = set()
+        for event in table.events:
+            rank = ranks.get(event.tag)
+            # events of INDI records have record itself as the only individual
+            if rank is None or event.date is None or event.individuals != (event.xref_id,):
+                continue
+            if (event.xref_id, rank) in seen:
+                continue
+            seen.add((event.xref_id, rank))
+            if event.lo is None:
+                continue
+            ends = found.setdefault(event.xref_id, [None, (None, None), None, (None, None)])
+            slot = 0 if rank < n_birth else 2
+            if ends[slot] is None or rank < ends[slot]:
+                ends[slot] = rank
+                ends[slot + 1] = (event.lo, event.hi)
+        return cls._from_ends(((xref_id, ends[1], ends[3]) for xref_id, ends in found.items()),
+                              max_lifespan)
+
+    @classmethod
+    def from_dates(cls, dates, max_lifespan=100):
+        """Make index from birth and death dates.
+
+        Parameters
+        ----------
+        dates : iterable [ `tuple` ]
+            Tuples of (xref_id, birth, death), ``birth`` and ``death`` are
+            `~ged4py.date.DateValue` instances or ``None``.
+        max_lifespan : `float`, optional
+            Maximum lifespan in years, used to estimate missing ends.
+
+        Returns
+        -------
+        index : `LifespanIndex`
+            New index instance.
+        """
+        def _ends(date):
+            if date is None or date.kind is DateValueTypes.PHRASE:
+                return None, None
+            date1, date2 = date.key()
+            return date1.key()[0], date2.key()[0]
+
+        return cls._from_ends(((xref_id, _ends(birth), _ends(death))
+                               for xref_id, birth, death in dates),
+                              max_lifespan)
+
+    @classmethod
+    def _from_ends(cls, dates, max_lifespan):
+        """Make index from tuples of (xref_id, (birth_lo, birth_hi),
+        (death_lo, death_hi)), unknown Julian Day numbers are ``None``.
+        """
+        max_days = max_lifespan * 365.25
+        lifespans = []
+        for xref_id, (birth_lo, birth_hi), (death_lo, death_hi) in dates:
+            lo = birth_lo if _finite(birth_lo) else None
+            if lo is None:
+                known = [jd for jd in (birth_hi, death_lo, death_hi) if _finite(jd)]
+                if known:
+                    lo = known[0] - max_days
+            hi = death_hi if _finite(death_hi) else None
+            if hi is None:
+                known = [jd for jd in (death_lo, birth_hi, birth_lo) if _finite(jd)]
+                if known:
+                    hi = known[0] + max_days
+            if lo is None or hi is None:
+                continue
+            lifespans.append((lo, max(lo, hi), xref_id))
+        return cls(lifespans)
+
+    def lifespan(self, xref_id):
+        """Return lifespan of an individual.
+
+        Parameters
+        ----------
+        xref_id : `str`
+            Reference ID of INDI record.
+
+        Returns
+        -------
+        lifespan : `tuple` [ `float` ] or ``None``
+            Julian Day numbers of lifespan ends, ``None`` if individual is not
+            in the index.
+        """
+        return self._lifespans.get(xref_id)
+
+    def alive_at(self, date):
+        """Return individuals who were alive at given date.
+
+        Parameters
+        ----------
+        date
+            Query date, if date is a range then its first date is used.
+
+        Returns
+        -------
+        xref_ids : `list` [ `str` ]
+            Reference IDs of INDI records, in no particular order.
+        """
+        point = _jd(date)
+        result = []
+        node = self._root
+        while node is not None:
+            if point < node.center:
+                for lo, _, xref_id in node.by_lo:
+                    if lo > point:
+                        break
+                    result.append(xref_id)
+                node = node.left
+            elif point > node.center:
+                for _, hi, xref_id in node.by_hi:
+                    if hi < point:
+                        break
+                    result.append(xref_id)
+                node = node.right
+            else:
+                result += [xref_id for _, _, xref_id in node.by_lo]
+                break
+        return result
+
+    def overlapping(self, start, end):
+        """Return individuals whose lifespan overlaps given period.
+
+        Parameters
+        ----------
+        start, end
+            Boundaries of the period, inclusive.
+
+        Returns
+        -------
+        xref_ids : `list` [ `str` ]
+            Reference IDs of INDI records, in no particular order.
+        """
+        start, end = _jd(start), _jd(end, upper=True)
+        result = []
+        stack = [self._root] if self._root is not None else []
+        while stack:
+            node = stack.pop()
+            if end < node.center:
+                for lo, _, xref_id in node.by_lo:
+                    if lo > end:
+                        break
+                    result.append(xref_id)
+                if node.left is not None:
+                    stack.append(node.left)
+            elif start > node.center:
+                for _, hi, xref_id in node.by_hi:
+                    if hi < start:
+                        break
+                    result.append(xref_id)
+                if node.right is not None:
+                    stack.append(node.right)
+            else:
+                result += [xref_id for _, _, xref_id in node.by_lo]
+                stack += [child for child in (node.left, node.right)
+                          if child is not None]
+        return result
+
+    def __len__(self):
+        return len(self._lifespans)
+
+
+class PlaceNode:
+    """Node in a hierarchy of places.
+
+    Each node represents single jurisdiction (e.g. town, county or country)
+    in a place hierarchy of `PlaceIndex`.
+
+    Parameters
+    ----------
+    name : `str`
+        Jurisdiction name.
+    parent : `PlaceNode`
+        Enclosing jurisdiction or ``None`` for top-level nodes.
+    """
+    def __init__(self, name, parent):
+        self.name = name
+        """Jurisdiction name, as it first appeared in a file (`str`)."""
+        self.parent = parent
+        """Enclosing jurisdiction, ``None`` for top level (`PlaceNode`)."""
+        self.children = {}
+        """Maps normalized name to enclosed jurisdiction
+        (`dict` [ `str`, `PlaceNode` ])."""
+        self.events = []
+        """Events with this exact place, list of (xref_id, tag) tuples
+        (`list` [ `tuple` ])."""
+        self.individuals = set()
+        """Reference IDs of individuals with events at this exact place
+        (`set` [ `str` ])."""
+
+    @property
+    def full_name(self):
+        """Comma-separated names of this and enclosing jurisdictions (`str`).
+        """
+        names = []
+        node = self
+        while node is not None:
+            names.append(node.name)
+            node = node.parent
+        return ", ".join(names)
+
+    def walk(self):
+        """Iterate over this node and all enclosed nodes.
+
+        Yields
+        ------
+        node : `PlaceNode`
+            Place node, parents are returned before children.
+        """
+        stack = [self]
+        while stack:
+            node = stack.pop()
+            yield node
+            stack += node.children.values()
+
+    def __str__(self):
+        return "{}({!r})".format(self.__class__.__name__, self.full_name)
+
+    def __repr__(self):
+        return str(self)
+
+
+class PlaceIndex:
+    """Hierarchical index of PLAC values.
+
+    Notes
+    -----
+    GEDCOM place names are lists of jurisdictions separated by commas, from
+    the smallest to the largest, e.g. "Leeds, Yorkshire, England". This
+    index splits place names into jurisdictions, normalizes them (extra
+    whitespace is removed and case is ignored for matching, empty
+    jurisdictions are skipped) and stores them in a trie with top-level
+    jurisdictions (usually countries) at the root. Each node knows the
+    events and individuals that refer to that exact place, queries collect
+    them from the whole sub-tree, so that e.g. query for "Yorkshire, England"
+    returns everything in Leeds, York, etc.
+
+    Events of FAM records are attributed to both spouses.
+    """
+    def __init__(self):
+        self._roots = {}     # maps normalized name to top-level PlaceNode
+        self._by_name = {}   # maps normalized name to list of PlaceNodes
+        self._places = {}    # maps PLAC string to PlaceNode
+
+    @staticmethod
+    def split(place):
+        """Split place name into jurisdictions.
+
+        Parameters
+        ----------
+        place : `str`
+            Place name as it appears in PLAC record.
+
+        Returns
+        -------
+        names : `list` [ `str` ]
+            Non-empty jurisdiction names, largest jurisdiction first.
+        """
+        names = [" ".join(name.split()) for name in place.split(",")]
+        return [name for name in reversed(names) if name]
+
+    @classmethod
+    def from_reader(cls, reader):
+        """Make index from all INDI and FAM records in a file.
+
+        Parameters
+        ----------
+        reader : `~ged4py.parser.GedcomReader`
+            Parser instance.
+
+        Returns
+        -------
+        index : `PlaceIndex`
+            New index instance.
+        """
+        index = cls()
+        for rec_tag in ("INDI", "FAM"):
+            for record in reader.records0(rec_tag):
+                if rec_tag == "INDI":
+                    individuals = (record.xref_id,)
+                else:
+                    individuals = tuple(rec.value for rec in record.sub_tags(follow=False)
+                                        if rec.tag in ("HUSB", "WIFE"))
+                for event in record.sub_tags(follow=False):
+                    place = event.sub_tag_value("PLAC", follow=False)
+                    if place:
+                        index.add(place, record.xref_id, event.tag, individuals)
+        return index
+
+    @classmethod
+    def from_events(cls, table):
+        """Make index from an event table.
+
+        Parameters
+        ----------
+        table : `~ged4py.events.EventTable`
+            Table of events.
+
+        Returns
+        -------
+        index : `PlaceIndex`
+            New index instance.
+        """
+        index = cls()
+        places = table.places
+        for event in table.events:
+            if event.place_id is not None:
+                index.add(places[event.place_id], event.xref_id, event.tag,
+                          event.individuals)
+        return index
+
+    def add(self, place, xref_id, tag, individuals=()):
+        """Add one event to the index.
+
+        Parameters
+        ----------
+        place : `str`
+            Place name as it appears in PLAC record.
+        xref_id : `str`
+            Reference ID of the record owning the event.
+        tag : `str`
+            Event tag name.
+        individuals : `tuple` [ `str` ], optional
+            Reference IDs of individuals participating in the event.
+
+        Returns
+        -------
+        node : `PlaceNode`
+            Node for the place, ``None`` if place name is empty.
+        """
+        node = self._places.get(place)
+        if node is None:
+            node = self._intern(self.split(place))
+            if node is None:
+                return None
+            self._places[place] = node
+        node.events.append((xref_id, tag))
+        node.individuals.update(individuals)
+        return node
+
+    def _intern(self, names):
+        """Find or make node for a list of jurisdictions.
+        """
+        node = None
+        children = self._roots
+        for name in names:
+            key = sys.intern(name.casefold())
+            child = children.get(key)
+            if child is None:
+                child = children[key] = PlaceNode(sys.intern(name), node)
+                self._by_name.setdefault(key, []).append(child)
+            node = child
+            children = node.children
+        return node
+
+    @property
+    def roots(self):
+        """Top-level jurisdictions (`list` [ `PlaceNode` ]).
+        """
+        return list(self._roots.values())
+
+    def find(self, place):
+        """Return nodes matching place name.
+
+        Parameters
+        ----------
+        place : `str`
+            Place name, one or more jurisdictions separated by commas, e.g.
+            "Yorkshire" or "Yorkshire, England". Matched jurisdictions can
+            appear at any level of hierarchy, but all given enclosing
+            jurisdictions have to match too.
+
+        Returns
+        -------
+        nodes : `list` [ `PlaceNode` ]
+            Matching nodes, possibly empty.
+        """
+        names = [name.casefold() for name in self.split(place)]
+        if not names:
+            return []
+        result = []
+        for node in self._by_name.get(names[-1], []):
+            parent = node.parent
+            for name in reversed(names[:-1]):
+                if parent is None or parent.name.casefold() != name:
+                    break
+                parent = parent.parent
+            else:
+                result.append(node)
+        return result
+
+    def events(self, place):
+        """Return events at a given place or any place enclosed by it.
+
+        Parameters
+        ----------
+        place : `str`
+            Place name, same as for `find` method.
+
+        Returns
+        -------
+        events : `list` [ `tuple` ]
+            List of (xref_id, tag) tuples.
+        """
+        return [event for top in self.find(place) for node in top.walk()
+                for event in node.events]
+
+    def individuals(self, place):
+        """Return individuals with any event at a given place or any place
+        enclosed by it.
+
+        Parameters
+        ----------
+        place : `str`
+            Place name, same as for `find` method.
+
+        Returns
+        -------
+        xref_ids : `set` [ `str` ]
+            Reference IDs of INDI records.
+        """
+        result = set()
+        for top in self.find(place):
+            for node in top.walk():
+                result |= node.individuals
+        return result
+
+
+class Citation(NamedTuple):
+    """Single source citation in `CitationIndex`.
+
+    Attributes
+    ----------
+    source : `str` or ``None``
+    xref_id : `str`
+    tag : `str` or ``None``
+    page : `str` or ``None``
+    quay : `str` or ``None``
+    """
+    source: Optional[str]
+    """Reference ID of the cited SOUR record, ``None`` for sources given as
+    text instead of a pointer (`str`)"""
+
+    xref_id: str
+    """Reference ID of the citing level 0 record (`str`)"""
+
+    tag: Optional[str]
+    """Tag of the citing fact (level 1 record containing the citation),
+    ``None`` if citation belongs to the level 0 record itself (`str`)"""
+
+    page: Optional[str]
+    """Value of PAGE record (`str`)"""
+
+    quay: Optional[str]
+    """Value of QUAY record (`str`)"""
+
+
+class CitationIndex:
+    """Index of source citations and repositories.
+
+    Notes
+    -----
+    Index is built in one pass over all level 0 records, pointers to SOUR
+    and REPO records are not resolved, only their reference IDs are used.
+    For each source it keeps the list of citations (`Citation` tuples with
+    citing record, fact tag, PAGE and QUAY), for each repository the list
+    of sources that refer to it (REPO pointers of level 0 SOUR records).
+
+    Facts are the level 1 sub-records of INDI and FAM records with tags
+    from `FACT_TAGS`. A fact is sourced if it has SOUR record anywhere
+    inside it, facts without sources are listed by `unsourced`.
+
+    Typical use::
+
+        with GedcomReader(path) as parser:
+            index = CitationIndex.from_reader(parser)
+        for citation in index.citations("@S12@"):
+            ...
+        print(len(index.unsourced()), "of", index.n_facts, "facts have no source")
+    """
+
+    FACT_TAGS = frozenset([
+        # individual events
+        "ADOP", "BAPM", "BARM", "BASM", "BIRT", "BLES", "BURI", "CENS", "CHR",
+        "CHRA", "CONF", "CREM", "DEAT", "EMIG", "EVEN", "FCOM", "GRAD", "IMMI",
+        "NATU", "ORDN", "PROB", "RETI", "WILL",
+        # individual attributes
+        "CAST", "DSCR", "EDUC", "FACT", "IDNO", "NATI", "NCHI", "NMR", "OCCU",
+        "PROP", "RELI", "RESI", "SSN", "TITL",
+        # family events
+        "ANUL", "DIV", "DIVF", "ENGA", "MARB", "MARC", "MARL", "MARR", "MARS",
+    ])
+    """Tags of the sub-records of INDI and FAM records counted as facts."""
+
+    def __init__(self):
+        self._citations = {}     # maps source xref_id to list of Citations
+        self._by_record = {}     # maps citing xref_id to list of Citations
+        self._repositories = {}  # maps repository xref_id to list of sources
+        self._unsourced = []     # list of (xref_id, tag)
+        self._n_facts = 0
+
+    @classmethod
+    def from_reader(cls, reader):
+        """Make index from all records in a file.
+
+        Parameters
+        ----------
+        reader : `~ged4py.parser.GedcomReader`
+            Parser instance.
+
+        Returns
+        -------
+        index : `CitationIndex`
+            New index instance.
+        """
+        index = cls()
+        for offset, tag in reader.index0:
+            if tag not in ("HEAD", "TRLR"):
+                index.add_record(reader.read_record(offset))
+        return index
+
+    def add_record(self, record):
+        """Add citations and facts of one level 0 record to the index.
+
+        Parameters
+        ----------
+        record : `~ged4py.model.Record`
+            Level 0 record.
+        """
+        xref_id = record.xref_id
+        with_facts = record.tag in ("INDI", "FAM")
+        for sub_rec in record.sub_records or ():
+            if sub_rec.tag == "SOUR":
+                self._add_citation(sub_rec, xref_id, None)
+            elif sub_rec.tag == "REPO" and record.tag == "SOUR" and isinstance(sub_rec, Pointer):
+                self._repositories.setdefault(sub_rec.value, []).append(xref_id)
+            else:
+                # depth-first walk, sub-records are pushed in reverse so
+                # that citations are added in document order
+                sourced = False
+                stack = list(reversed(sub_rec.sub_records or ()))
+                while stack:
+                    rec = stack.pop()
+                    if rec.tag == "SOUR":
+                        self._add_citation(rec, xref_id, sub_rec.tag)
+                        sourced = True
+                    elif rec.sub_records:
+                        stack += reversed(rec.sub_records)
+                if with_facts and sub_rec.tag in self.FACT_TAGS:
+                    self._n_facts += 1
+                    if not sourced:
+                        self._unsourced.append((xref_id, sub_rec.tag))
+
+    def _add_citation(self, record, xref_id, tag):
+        """Add citation for a SOUR sub-record.
+        """
+        page = quay = None
+        for rec in record.sub_records or ():
+            if rec.tag == "PAGE":
+                if page is None:
+                    page = rec.value
+            elif rec.tag == "QUAY":
+                if quay is None:
+                    quay = rec.value
+        source = record.value if isinstance(record, Pointer) else None
+        citation = Citation(source, xref_id, tag, page, quay)
+        if source is not None:
+            self._citations.setdefault(source, []).append(citation)
+        self._by_record.setdefault(xref_id, []).append(citation)
+
+    @property
+    def n_facts(self):
+        """Total number of facts seen by the index (`int`)."""
+        return self._n_facts
+
+    def sources(self, repository=None):
+        """Return cited sources or sources in a repository.
+
+        Parameters
+        ----------
+        repository : `str`, optional
+            Reference ID of a REPO record.
+
+        Returns
+        -------
+        sources : `list` [ `str` ]
+            Reference IDs of SOUR records, if ``repository`` is not given
+            then all cited sources are returned.
+        """
+        if repository is None:
+            return list(self._citations)
+        return list(self._repositories.get(repository, []))
+
+    def repositories(self):
+        """Return repositories referenced by SOUR records.
+
+        Returns
+        -------
+        repositories : `list` [ `str` ]
+            Reference IDs of REPO records.
+        """
+        return list(self._repositories)
+
+    def citations(self, source):
+        """Return citations of a source.
+
+        Parameters
+        ----------
+        source : `str`
+            Reference ID of a SOUR record.
+
+        Returns
+        -------
+        citations : `list` [ `Citation` ]
+            Citations in document order.
+        """
+        return list(self._citations.get(source, []))
+
+    def repository_citations(self, repository):
+        """Return citations of all sources in a repository.
+
+        Parameters
+        ----------
+        repository : `str`
+            Reference ID of a REPO record.
+
+        Returns
+        -------
+        citations : `list` [ `Citation` ]
+            Citations, grouped by source.
+        """
+        return [citation for source in self._repositories.get(repository, [])
+                for citation in self._citations.get(source, [])]
+
+    def cited_by(self, xref_id):
+        """Return citations made by a record.
+
+        Parameters
+        ----------
+        xref_id : `str`
+            Reference ID of a level 0 record.
+
+        Returns
+        -------
+        citations : `list` [ `Citation` ]
+            Citations in document order, including citations given as text.
+        """
+        return list(self._by_record.get(xref_id, []))
+
+    def unsourced(self):
+        """Return facts without any source citation.
+
+        Returns
+        -------
+        facts : `list` [ `tuple` ]
+            List of (xref_id, tag) tuples in document order.
+        """
+        return list(self._unsourced)
+
+    def __len__(self):
+        return sum(len(citations) for citations in self._by_record.values())
@@ -0,0 +1,312 @@
+"""Module for computing relationships and kinship between individuals.
+"""
+
+__all__ = ["KinshipCalculator", "relationship_name"]
+
+import functools
+
+_ORDINALS = ["zeroth", "first", "second", "third", "fourth", "fifth", "sixth",
+             "seventh", "eighth", "ninth", "tenth"]
+
+_TIMES = {1: "once", 2: "twice"}
+
+
+def _ordinal(number, words=True):
+    """Return ordinal for a number, e.g. "third" or "3rd".
+    """
+    if words and number < len(_ORDINALS):
+        return _ORDINALS[number]
+    if number % 100 in (11, 12, 13):
+        suffix = "th"
+    else:
+        suffix = {1: "st", 2: "nd", 3: "rd"}.get(number % 10, "th")
+    return str(number) + suffix
+
+
+def _grand(number):
+    """Return prefix for a number of extra generations, e.g. "grand",
+    "great-grand", "2nd great-grand".
+    """
+    if number <= 0:
+        return ""
+    elif number == 1:
+        return "grand"
+    elif number == 2:
+        return "great-grand"
+    return _ordinal(number - 1, words=False) + " great-grand"
+
+
+def relationship_name(up, down):
+    """Return name of relationship for given generation distances.
+
+    Parameters
+    ----------
+    up : `int`
+        Number of generations from the first individual to the common
+        ancestor.
+    down : `int`
+        Number of generations from the second individual to the common
+        ancestor.
+
+    Returns
+    -------
+    name : `str`
+        Name of the relationship of second individual to the first one,
+        e.g. "grandparent", "niece/nephew", "third cousin twice removed".
+        Names are gender-neutral and do not distinguish half-relations.
+    """
+    if up == 0 and down == 0:
+        return "self"
+    elif up == 0:
+        return _grand(down - 1) + "child"
+    elif down == 0:
+        return _grand(up - 1) + "parent"
+    elif up == 1 and down == 1:
+        return "sibling"
+    elif up == 1:
+        return _grand(down - 2) + "niece/nephew"
+    elif down == 1:
+        return _grand(up - 2) + "aunt/uncle"
+    name = _ordinal(min(up, down) - 1) + " cousin"
+    removed = abs(up - down)
+    if removed:
+        name += " " + _TIMES.get(removed, "{} times".format(removed)) + " removed"
+    return name
+
+
+class KinshipCalculator:
+    """Calculator of relationships and kinship coefficients.
+
+    Parameters
+    ----------
+    graph : `~ged4py.graph.FamilyGraph`
+        Family graph.
+    cache_size : `int`, optional
+        Number of individuals for which ancestry is cached.
+
+    Notes
+    -----
+    Ancestry (the set of ancestors with the generation distance to each of
+    them) is computed once per individual and cached. Lowest common ancestors
+    of two individuals are found by walking up from one of them until
+    ancestors of the other one are reached.
+
+    Batch methods `relationships` and `kinships` compute relationships of a
+    single individual to everybody else in one pass over the individuals in
+    topological order (parents before children), which takes roughly linear
+    time in the size of the graph instead of a separate pedigree walk for
+    each pair.
+
+    Kinship coefficient is the probability that randomly selected alleles
+    from two individuals are identical by descent. It is calculated using
+    standard recursive definition, only the first two parents of each
+    individual are used (additional parents usually come from adoptive
+    families). Individuals in parent cycles or descending from them (which
+    is always a data error, see `~ged4py.graph.FamilyGraph.generation_depth`)
+    are treated as founders when computing kinship.
+    """
+    def __init__(self, graph, cache_size=1024):
+        self._graph = graph
+        order = graph.topological_order()
+        self._position = {node: i for i, node in enumerate(order)}
+        self._depth = graph.generation_depth()
+        self._kinship = {}
+        self._ancestry = functools.lru_cache(maxsize=cache_size)(self._make_ancestry)
+
+    def _kinship_parents(self, node):
+        """Return parents used for kinship, at most two, none for
+        individuals in or below a parent cycle.
+        """
+        if self._depth[node] < 0:
+            return ()
+        return self._graph.parents(node)[:2]
+
+    def _make_ancestry(self, node):
+        return dict(self._graph.bfs(node, "parents"))
+
+    def ancestry(self, node):
+        """Return ancestors of an individual including the individual itself.
+
+        Parameters
+        ----------
+        node : `int`
+            Node ID.
+
+        Returns
+        -------
+        ancestry : `dict` [ `int`, `int` ]
+            Maps node ID to the generation distance, individual itself has
+            distance 0. Returned dictionary is shared and must not be modified.
+        """
+        return self._ancestry(node)
+
+    def common_ancestors(self, node1, node2):
+        """Return lowest common ancestors of two individuals.
+
+        Parameters
+        ----------
+        node1, node2 : `int`
+            Node IDs.
+
+        Returns
+        -------
+        ancestors : `list` [ `tuple` ]
+            List of (node, up, down) tuples, ``up`` and ``down`` are the
+            generation distances from the first and second individual. Only
+            ancestors with the smallest total distance are returned, e.g. both
+            parents for siblings. List is empty for unrelated individuals.
+            If one individual is an ancestor of the other then it is returned
+            as the common ancestor.
+        """
+        ancestry = self._ancestry(node1)
+        result = []
+        best = None
+        for node, down in self._graph.bfs(node2, "parents"):
+            if best is not None and down > best:
+                break
+            up = ancestry.get(node)
+            if up is None:
+                continue
+            if best is None or up + down < best:
+                best = up + down
+                result = [(node, up, down)]
+            elif up + down == best:
+                result.append((node, up, down))
+        return result
+
+    def relationship(self, node1, node2):
+        """Return name of relationship of second individual to the first one.
+
+        Parameters
+        ----------
+        node1, node2 : `int`
+            Node IDs.
+
+        Returns
+        -------
+        name : `str` or ``None``
+            Relationship name (see `relationship_name`), ``None`` for
+            unrelated individuals.
+        """
+        ancestors = self.common_ancestors(node1, node2)
+        if not ancestors:
+            return None
+        _, up, down = ancestors[0]
+        return relationship_name(up, down)
+
+    def relationships(self, root):
+        """Return relationships of everyone to a root individual.
+
+        Parameters
+        ----------
+        root : `int`
+            Node ID of root individual.
+
+        Returns
+        -------
+        relationships : `dict` [ `int`, `tuple` ]
+            Maps node ID of each related individual to a (up, down) tuple of
+            generation distances to the nearest common ancestor, use
+            `relationship_name` to convert it to a name.
+        """
+        ancestry = self._ancestry(root)
+        result = {}
+        for node in self._graph.topological_order():
+            best = None
+            if node in ancestry:
+                best = (ancestry[node], 0)
+            for parent in self._graph.parents(node):
+                dist = result.get(parent)
+                if dist is None:
+                    continue
+                candidate = (dist[0], dist[1] + 1)
+                if best is None or (sum(candidate), candidate[0]) < (sum(best), best[0]):
+                    best = candidate
+            if best is not None:
+                result[node] = best
+        return result
+
+    def kinship(self, node1, node2):
+        """Return kinship coefficient of two individuals.
+
+        Parameters
+        ----------
+        node1, node2 : `int`
+            Node IDs.
+
+        Returns
+        -------
+        kinship : `float`
+            Kinship coefficient, 0.5 for individual with itself (if not
+            inbred), 0.25 for parent and child or full siblings, 0 for
+            unrelated individuals.
+        """
+        cache = self._kinship
+        position = self._position
+        stack = [(node1, node2)]
+        while stack:
+            node1, node2 = stack[-1]
+            if position[node1] > position[node2]:
+                node1, node2 = node2, node1
+            if (node1, node2) in cache:
+                stack.pop()
+                continue
+            # expand the individual which is later in topological order,
+            # it cannot be an ancestor of the other one
+            parents = self._kinship_parents(node2)
+            if node1 == node2:
+                needed = [tuple(parents)] if len(parents) == 2 else []
+            else:
+                needed = [(node1, parent) for parent in parents]
+            needed = [pair for pair in needed
+                      if (pair if position[pair[0]] <= position[pair[1]]
+                          else pair[::-1]) not in cache]
+            if needed:
+                stack += needed
+                continue
+            if node1 == node2:
+                inbreeding = self._cached_kinship(*parents) if len(parents) == 2 else 0.
+                value = (1. + inbreeding) / 2
+            else:
+                value = sum(self._cached_kinship(node1, parent) for parent in parents) / 2
+            cache[(node1, node2)] = value
+            stack.pop()
+        return self._cached_kinship(node1, node2)
+
+    def _cached_kinship(self, node1, node2):
+        if self._position[node1] > self._position[node2]:
+            node1, node2 = node2, node1
+        return self._kinship[(node1, node2)]
+
+    def kinships(self, root):
+        """Return kinship coefficients of everyone with a root individual.
+
+        Parameters
+        ----------
+        root : `int`
+            Node ID of root individual.
+
+        Returns
+        -------
+        kinships : `dict` [ `int`, `float` ]
+            Maps node ID of each related individual to kinship coefficient,
+            individuals that are not in the returned dictionary have zero
+            kinship with root.
+        """
+        # only descendants of root ancestors can be related to root
+        ancestry = self._ancestry(root)
+        related = set()
+        result = {}
+        root_position = self._position[root]
+        for node in self._graph.topological_order():
+            parents = self._kinship_parents(node)
+            if node not in ancestry and not any(parent in related for parent in parents):
+                continue
+            related.add(node)
+            if self._position[node] <= root_position:
+                value = self.kinship(root, node)
+            else:
+                value = sum(result.get(parent, 0.) for parent in parents) / 2
+            if value:
+                result[node] = value
+        return result
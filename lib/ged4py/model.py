@@ -6,10 +6,11 @@
 # from __future__ import annotations
 
 __all__ = ['make_record', 'Record', 'Pointer', 'NameRec', 'Name',
-           'Date', 'Individual']
+           'Date', 'Individual', 'Family']
 
 import enum
-from typing import Any, Iterator, List, Optional, Union
+import functools
+from typing import Any, List, Optional, Union
 
 from .detail.name import (split_name, parse_name_altree, parse_name_ancestris,
                           parse_name_myher)
@@ -56,6 +57,50 @@ class NameOrder(enum.Enum):
     """Order by given name first, maiden name (or surname) second."""
 
 
+# Records with fewer sub-records than this are scanned without making index
+_TAG_INDEX_MIN_SIZE = 16
+
+
+@functools.lru_cache(maxsize=1024)
+def _split_path(path):
+    """Split `Record.sub_tag` path into a tuple of tags.
+
+    Trailing slash is ignored, same as in the original recursive lookup.
+    """
+    tags = path.split('/')
+    if len(tags) > 1 and not tags[-1]:
+        del tags[-1]
+    return tuple(tags)
+
+
+@functools.lru_cache(maxsize=1024)
+def _compile_tags(tags):
+    """Compile `Record.sub_tags` paths into a trie.
+
+    Each trie node is a dictionary mapping tag name to a tuple
+    ``(final, node)``. If ``final`` is True then matching record is returned,
+    otherwise its sub-records are matched against ``node``. Like in the
+    original matching loop, only the first path (in argument order) that
+    reaches a tag decides whether the record is returned or searched.
+    Empty paths are ignored.
+    """
+    paths = [tag.split("/") for tag in tags if tag]
+
+    def _make_node(prefix):
+        node: dict = {}
+        depth = len(prefix)
+        for path in paths:
+            if len(path) <= depth or path[:depth] != prefix:
+                continue
+            tag = path[depth]
+            if tag not in node:
+                final = len(path) == depth + 1
+                node[tag] = (final, None if final else _make_node(prefix + [tag]))
+        return node
+
+    return _make_node([])
+
+
 class Record:
     """Class representing a parsed GEDCOM record in a generic format.
 
@@ -128,6 +173,8 @@ class Record:
         self.sub_records = None
         self.offset = None
         self.dialect = None
+        # (sub_records, len(sub_records), {tag: [records]}), built on demand
+        self._tag_index = None
 
     def freeze(self) -> 'Record':
         """Method called by parser when updates to this record finish.
@@ -167,25 +214,52 @@ class Record:
             Subordinate record or ``None`` if sub-record with a given tag does
             not exist.
         """
-        if not self.sub_records:
+        return self._sub_tag(_split_path(path), follow)
+
+    def _sub_tag(self, tags, follow):
+        """Implementation of `sub_tag` for a path split into tags.
+        """
+        sub_records = self.sub_records
+        if not sub_records:
             return None
-        head, _, tail = path.partition('/')
-        for rec in self.sub_records:
+        head = tags[0]
+        if len(sub_records) > _TAG_INDEX_MIN_SIZE:
+            sub_records = self._tag_children(head)
+        for rec in sub_records:
             if rec.tag != head:
                 continue
             # dereference pointers if needed
             if follow and isinstance(rec, Pointer):
                 rec = rec.ref
             if rec is not None:
-                if tail:
+                if len(tags) > 1:
                     # recurse
-                    sub_tag = rec.sub_tag(tail, follow=follow)
+                    sub_tag = rec._sub_tag(tags[1:], follow)
                     if sub_tag:
                         return sub_tag
                 else:
                     return rec
         return None
 
+    def _tag_children(self, tag):
+        """Return direct sub-records with a given tag.
+
+        Mapping of tags to sub-records is built on first call and is rebuilt
+        if ``sub_records`` list is replaced or its size changes. It is only
+        worth using for records with many sub-records.
+        """
+        sub_records = self.sub_records
+        if not sub_records:
+            return ()
+        tag_index = self._tag_index
+        if (tag_index is None or tag_index[0] is not sub_records or
+                tag_index[1] != len(sub_records)):
+            index: dict = {}
+            for rec in sub_records:
+                index.setdefault(rec.tag, []).append(rec)
+            tag_index = self._tag_index = (sub_records, len(sub_records), index)
+        return tag_index[2].get(tag, ())
+
     def sub_tag_value(self, path, follow=True) -> Any:
         """Returns value of a direct sub-record.
 
@@ -235,20 +309,6 @@ class Record:
         records : `list` [ `Record` ]
             List of records, possibly empty.
         """
-        def _sub_tags(record: Record, tag_matches: List[List[str]], my_tag: List[str]) -> Iterator[Record]:
-            assert record.sub_records is not None
-            for rec in record.sub_records:
-                sub_tag = my_tag + [rec.tag]
-                for m in tag_matches:
-                    if m[:len(sub_tag)] == sub_tag:
-                        if follow and isinstance(rec, Pointer):
-                            rec = rec.ref
-                        if len(sub_tag) == len(m):
-                            yield rec
-                        else:
-                            yield from _sub_tags(rec, tag_matches, sub_tag)
-                        break
-
         assert self.sub_records is not None
         if not tags:
             # return all direct sub-tgas
@@ -258,13 +318,39 @@ class Record:
                            for rec in records]
         else:
             records = []
-
-            # this ignores empty tags
-            tag_matches = [tag.split("/") for tag in tags if tag]
-            records += list(_sub_tags(self, tag_matches, []))
+            self._collect_sub_tags(_compile_tags(tags), follow, records)
 
         return records
 
+    def _collect_sub_tags(self, node, follow, records):
+        """Implementation of `sub_tags` for compiled tag paths.
+
+        Parameters
+        ----------
+        node : `dict`
+            Trie node returned from `_compile_tags`.
+        follow : `bool`
+            If True then resolve pointers.
+        records : `list` [ `Record` ]
+            List to add matching records to.
+        """
+        sub_records = self.sub_records or ()
+        if len(node) == 1 and len(sub_records) > _TAG_INDEX_MIN_SIZE:
+            # single tag, use index instead of scanning all sub-records
+            tag, = node
+            sub_records = self._tag_children(tag)
+        for rec in sub_records:
+            match = node.get(rec.tag)
+            if match is None:
+                continue
+            if follow and isinstance(rec, Pointer):
+                rec = rec.ref
+            final, sub_node = match
+            if final:
+                records.append(rec)
+            elif rec is not None:
+                rec._collect_sub_tags(sub_node, follow, records)
+
     def __repr__(self) -> str:
         return self.__str__()
 
@@ -313,11 +399,7 @@ class Pointer(Record):
     @property
     def ref(self):
         if self._value == []:
-            offset, _ = self.parser.xref0.get(self.value, (None, None))
-            if offset is None:
-                self._value = None
-            else:
-                self._value = self.parser.read_record(offset)
+            self._value = self.parser.read_xref(self.value)
         return self._value
 
 
@@ -339,12 +421,35 @@ class NameRec(Record):
         ("John", "Smith", "Jr.")
         ("", "", "")                             # empty NAME record
 
+    Original string value of the record is available as `raw_value`, it is
+    reset to ``None`` when new value is assigned.
+
     Client code usually does not need to create instances of this class
     directly, `make_record()` should be used instead.
     """
 
     def __init__(self):
         Record.__init__(self)
+        self._raw_value = None
+
+    @property
+    def value(self):
+        """Record value, name tuple after `freeze()` is called (`tuple`).
+        """
+        return self._name_value
+
+    @value.setter
+    def value(self, value):
+        # original string does not match new value
+        self._raw_value = None
+        self._name_value = value
+
+    @property
+    def raw_value(self):
+        """Original value of the NAME record, ``None`` if record has no value
+        or if it was not made by parser (`str`).
+        """
+        return self._raw_value
 
     def freeze(self):
         """Method called by parser when updates to this record finish.
@@ -354,6 +459,7 @@ class NameRec(Record):
         self : `NameRec`
             Finalized record instance.
         """
+        raw_value = self.value
         # None is the same as empty string
         if self.value is None:
             self.value = ""
@@ -366,6 +472,7 @@ class NameRec(Record):
         else:
             name_tuple = split_name(self.value)
         self.value = name_tuple
+        self._raw_value = raw_value
         return self
 
     @property
@@ -527,11 +634,46 @@ class Date(Record):
     """Sub-class of `Record` representing the DATE record.
 
     After `freeze()` method is called by parser the `value` attribute contains
-    instance of `ged4py.date.DateValue` class.
+    instance of `ged4py.date.DateValue` class. Date string is only parsed on
+    first access to `value`, so that clients that do not look at dates do
+    not pay for parsing. Original string is available as `raw_value` which
+    does not parse the date.
     """
     def __init__(self):
+        self._raw_value = None
+        self._date_value = None
+        self._frozen = False
         Record.__init__(self)
 
+    @property
+    def value(self):
+        """Record value, instance of `ged4py.date.DateValue` class after
+        `freeze()` is called (`~ged4py.date.DateValue`).
+        """
+        date_value = self._date_value
+        if date_value is None:
+            if not self._frozen:
+                # parser is still building this record
+                return self._raw_value
+            date_value = self._date_value = DateValue.parse(self._raw_value)
+        return date_value
+
+    @value.setter
+    def value(self, value):
+        if isinstance(value, DateValue):
+            self._raw_value = None
+            self._date_value = value
+        else:
+            self._raw_value = value
+            self._date_value = None
+
+    @property
+    def raw_value(self):
+        """Original value of the DATE record, ``None`` if record has no value
+        (`str`).
+        """
+        return self._raw_value
+
     def freeze(self):
         """Method called by parser when updates to this record finish.
 
@@ -540,7 +682,7 @@ class Date(Record):
         self : `Date`
             Finalized record instance.
         """
-        self.value = DateValue.parse(self.value)
+        self._frozen = True
         return self
 
 
@@ -558,13 +700,18 @@ class Individual(Record):
         Record.__init__(self)
         self._mother: Optional[Union[Record, List]] = []  # Non-None as uninitialized
         self._father: Optional[Union[Record, List]] = []  # Non-None as uninitialized
+        self._name: Optional[Name] = None
+        self._families: Optional[List[Family]] = None
+        self._parent_families: Optional[List[Family]] = None
 
     @property
     def name(self):
-        """Person name (`Name`).
+        """Person name (`Name`), it is made on first access and cached.
         """
         # +1 <<PERSONAL_NAME_STRUCTURE>> {0:M}
-        return Name(self.sub_tags("NAME"), self.dialect)
+        if self._name is None:
+            self._name = Name(self.sub_tags("NAME"), self.dialect)
+        return self._name
 
     @property
     def sex(self):
@@ -575,6 +722,54 @@ class Individual(Record):
             return sex_rec.value
         return "U"
 
+    @property
+    def families(self):
+        """Families in which this individual is a spouse, from FAMS records
+        (`list` [ `Family` ]).
+        """
+        # +1 FAMS @<XREF:FAM>@ {0:M}
+        if self._families is None:
+            self._families = _families(self.sub_tags("FAMS"))
+        return self._families
+
+    @property
+    def parent_families(self):
+        """Families in which this individual is a child, from FAMC records
+        (`list` [ `Family` ]).
+        """
+        # +1 FAMC @<XREF:FAM>@ {0:M}
+        if self._parent_families is None:
+            self._parent_families = _families(self.sub_tags("FAMC"))
+        return self._parent_families
+
+    @property
+    def parents(self):
+        """Parents from all `parent_families`, husbands before wives
+        (`list` [ `Individual` ]).
+        """
+        parents = []
+        for family in self.parent_families:
+            parents += [family.husband, family.wife]
+        return _unique(parents)
+
+    @property
+    def spouses(self):
+        """Spouses from all `families` (`list` [ `Individual` ]).
+        """
+        spouses = []
+        for family in self.families:
+            spouses += [family.husband, family.wife]
+        return [spouse for spouse in _unique(spouses) if spouse.xref_id != self.xref_id]
+
+    @property
+    def children(self):
+        """Children from all `families` (`list` [ `Individual` ]).
+        """
+        children = []
+        for family in self.families:
+            children += family.children
+        return _unique(children)
+
     @property
     def mother(self):
         """Parent of this individual (`Individual` or ``None``)"""
@@ -590,8 +785,91 @@ class Individual(Record):
         return self._father
 
 
+class Family(Record):
+    """Sub-class of `Record` representing the FAM record.
+
+    FAM record represents a family, it links spouses and their children.
+    This class defines methods for navigation to the individuals in a
+    family, pointers are resolved on first access and results are cached.
+    Pointers are resolved via parser cache of records (see
+    `~ged4py.parser.GedcomReader.read_xref`) so individuals and families
+    are only read from file once when navigating between them.
+
+    Client code usually does not need to create instances of this class
+    directly, `make_record()` should be used instead.
+    """
+
+    EVENT_TAGS = ("ANUL", "CENS", "DIV", "DIVF", "ENGA", "MARB", "MARC",
+                  "MARL", "MARR", "MARS", "RESI", "EVEN")
+    """Tags of family events (`tuple` [ `str` ])."""
+
+    def __init__(self):
+        Record.__init__(self)
+        self._husband: Optional[Union[Record, List]] = []  # Non-None as uninitialized
+        self._wife: Optional[Union[Record, List]] = []  # Non-None as uninitialized
+        self._children: Optional[List[Record]] = None
+        self._events: Optional[List[Record]] = None
+
+    @property
+    def husband(self):
+        """Husband in this family (`Individual` or ``None``)."""
+        # +1 HUSB @<XREF:INDI>@ {0:1}
+        if self._husband == []:
+            self._husband = self.sub_tag("HUSB")
+        return self._husband
+
+    @property
+    def wife(self):
+        """Wife in this family (`Individual` or ``None``)."""
+        # +1 WIFE @<XREF:INDI>@ {0:1}
+        if self._wife == []:
+            self._wife = self.sub_tag("WIFE")
+        return self._wife
+
+    @property
+    def children(self):
+        """Children in this family (`list` [ `Individual` ]), pointers to
+        unknown records are ignored.
+        """
+        # +1 CHIL @<XREF:INDI>@ {0:M}
+        if self._children is None:
+            self._children = [child for child in self.sub_tags("CHIL") if child is not None]
+        return self._children
+
+    @property
+    def events(self):
+        """Family events, e.g. MARR or DIV records (`list` [ `Record` ]).
+        """
+        if self._events is None:
+            self._events = [rec for rec in self.sub_records or ()
+                            if rec.tag in self.EVENT_TAGS]
+        return self._events
+
+
+def _families(records):
+    """Filter the results of FAMS or FAMC lookup.
+    """
+    return [rec for rec in records if isinstance(rec, Family)]
+
+
+def _unique(records):
+    """Remove ``None`` and duplicates (by reference ID) from a list of
+    records, preserving order.
+    """
+    seen = set()
+    result = []
+    for rec in records:
+        if rec is not None:
+            key = rec.xref_id or id(rec)
+            if key not in seen:
+                seen.add(key)
+                result.append(rec)
+    return result
+
+
 # maps tag names to record class
 _tag_class = dict(INDI=Individual,
+                  FAM=Family,
                   NAME=NameRec,
                   DATE=Date)
 
@@ -636,6 +914,7 @@ def make_record(level, xref_id, tag, value, sub_records, offset, dialect,
         - if value has a pointer form (``@ref_id@``) then `Pointer`
           instance is created
         - if tag is "INDI" then `Individual` instance is created
+        - if tag is "FAM" then `Family` instance is created
         - if tag is "NAME" then `NameRec` instance is created
         - if tag is "DATE" then `Date` instance is created
         - otherwise  `Record` instance is created
@@ -0,0 +1,328 @@
+"""Module for compact integer encoding of GEDCOM dates.
+"""
+
+__all__ = ["KIND_BITS", "DatePacker", "pack_key", "unpack_key"]
+
+from array import array
+
+from .calendar import (CalendarType, FrenchDate, GregorianDate, HebrewDate,
+                       JulianDate)
+from .date import (DateValueAbout, DateValueAfter, DateValueBefore,
+                   DateValueCalculated, DateValueEstimated, DateValueFrom,
+                   DateValueInterpreted, DateValuePeriod, DateValuePhrase,
+                   DateValueRange, DateValueSimple, DateValueTo,
+                   DateValueTypes)
+
+KIND_BITS = 4
+"""Number of low bits in a packed key used for `DateValueTypes` code,
+``key >> KIND_BITS`` orders and compares like `~ged4py.date.DateValue`.
+"""
+
+_KINDS = list(DateValueTypes)
+_KIND_CODES = {kind: code for code, kind in enumerate(_KINDS)}
+
+# Key word layout, from most significant bit:
+#   jd1 (24 bits, biased), flag1 (1 bit), jd2 (24 bits, biased),
+#   flag2 (1 bit), kind (4 bits)
+_JD_BITS = 24
+_JD_BIAS = 1 << (_JD_BITS - 1)
+_JD_MASK = (1 << _JD_BITS) - 1
+_KIND_MASK = (1 << KIND_BITS) - 1
+
+# Payload word has two 32-bit slots, one per date, each slot layout is
+# (from least significant bit): calendar (2 bits), bc (1 bit), year (14 bits),
+# month number (4 bits, 0 if not given), day (6 bits, 63 if not given),
+# dual year offset (4 bits, 0 if not given, otherwise dual year minus year
+# plus one). Slots that are not used for dates keep indices of phrases.
+_CALENDARS = [
+    (CalendarType.GREGORIAN, GregorianDate),
+    (CalendarType.JULIAN, JulianDate),
+    (CalendarType.HEBREW, HebrewDate),
+    (CalendarType.FRENCH_R, FrenchDate),
+]
+_CALENDAR_CODES = {calendar: code for code, (calendar, _) in enumerate(_CALENDARS)}
+_MAX_YEAR = (1 << 14) - 1
+_NO_DAY = 63
+_MAX_DUAL = 14
+_SLOT_MASK = (1 << 32) - 1
+
+# Kinds with one date and with two dates, phrase kinds are handled separately
+_SINGLE = {
+    DateValueTypes.SIMPLE: DateValueSimple,
+    DateValueTypes.FROM: DateValueFrom,
+    DateValueTypes.TO: DateValueTo,
+    DateValueTypes.BEFORE: DateValueBefore,
+    DateValueTypes.AFTER: DateValueAfter,
+    DateValueTypes.ABOUT: DateValueAbout,
+    DateValueTypes.CALCULATED: DateValueCalculated,
+    DateValueTypes.ESTIMATED: DateValueEstimated,
+}
+_DOUBLE = {
+    DateValueTypes.PERIOD: DateValuePeriod,
+    DateValueTypes.RANGE: DateValueRange,
+}
+
+
+def _pack_jd(jd, flag):
+    day = jd - 0.5
+    if day != int(day) or not -_JD_BIAS <= day < _JD_BIAS:
+        raise ValueError("Julian Day cannot be packed: {}".format(jd))
+    return ((int(day) + _JD_BIAS) << 1) | flag
+
+
+def pack_key(date_value):
+    """Pack ordering key of a date into an integer.
+
+    Parameters
+    ----------
+    date_value : `~ged4py.date.DateValue`
+        Date value.
+
+    Returns
+    -------
+    key : `int`
+        Non-negative integer that fits into signed 64-bit integer. Ordering
+        of keys is consistent with ordering of `~ged4py.date.DateValue`
+        instances, ties are broken by `~ged4py.date.DateValueTypes` kind.
+        To check equality with the same semantics as
+        `~ged4py.date.DateValue` compare ``key >> KIND_BITS``.
+
+    Raises
+    ------
+    ValueError
+        Raised if Julian Day of a date is outside of supported range (about
+        22,000 years in each direction).
+    """
+    (jd1, flag1), (jd2, flag2) = date_value.ordering_key()
+    key = (_pack_jd(jd1, flag1) << (_JD_BITS + 1)) | _pack_jd(jd2, flag2)
+    return (key << KIND_BITS) | _KIND_CODES[date_value.kind]
+
+
+def unpack_key(key):
+    """Unpack integer key made by `pack_key`.
+
+    Parameters
+    ----------
+    key : `int`
+        Packed key.
+
+    Returns
+    -------
+    key1 : `tuple`
+        Key of first date, (jd, flag) tuple, same as returned from
+        `~ged4py.calendar.CalendarDate.key()`.
+    key2 : `tuple`
+        Key of second date.
+    kind : `~ged4py.date.DateValueTypes`
+        Kind of the date.
+    """
+    kind = _KINDS[key & _KIND_MASK]
+    key >>= KIND_BITS
+    keys = []
+    for _ in range(2):
+        flag = key & 1
+        key >>= 1
+        keys.append(((key & _JD_MASK) - _JD_BIAS + 0.5, flag))
+        key >>= _JD_BITS
+    return keys[1], keys[0], kind
+
+
+def _pack_date(date):
+    """Pack calendar date into 32-bit slot.
+    """
+    if date.month is not None and date.month_num is None:
+        raise ValueError("Unknown month name cannot be packed: {}".format(date))
+    if not 0 <= date.year <= _MAX_YEAR:
+        raise ValueError("Year cannot be packed: {}".format(date))
+    if date.day is None:
+        day = _NO_DAY
+    elif 0 <= date.day < _NO_DAY:
+        day = date.day
+    else:
+        raise ValueError("Day cannot be packed: {}".format(date))
+    dual_year = getattr(date, "dual_year", None)
+    if dual_year is None:
+        dual = 0
+    elif 0 <= dual_year - date.year <= _MAX_DUAL:
+        dual = dual_year - date.year + 1
+    else:
+        raise ValueError("Dual year cannot be packed: {}".format(date))
+    return (_CALENDAR_CODES[date.calendar] | (date.bc << 2) | (date.year << 3) |
+            ((date.month_num or 0) << 17) | (day << 21) | (dual << 27))
+
+
+def _unpack_date(slot):
+    """Make calendar date from 32-bit slot.
+    """
+    calendar, klass = _CALENDARS[slot & 3]
+    bc = bool(slot & 4)
+    year = (slot >> 3) & _MAX_YEAR
+    month_num = (slot >> 17) & 0xf
+    month = klass.months()[month_num - 1] if month_num else None
+    day = (slot >> 21) & 0x3f
+    day = None if day == _NO_DAY else day
+    dual = (slot >> 27) & 0xf
+    if calendar == CalendarType.GREGORIAN:
+        return klass(year, month, day, bc=bc, dual_year=year + dual - 1 if dual else None)
+    return klass(year, month, day, bc=bc)
+
+
+class DatePacker:
+    """Lossless encoding of dates into pairs of 64-bit integers.
+
+    Parameters
+    ----------
+    phrases : `list` [ `str` ], optional
+        Initial contents of the phrase table, e.g. `phrases` of another
+        packer that was used to make packed values.
+
+    Notes
+    -----
+    Each `~ged4py.date.DateValue` is encoded as two integers, both fitting
+    into signed 64-bit integers so that they can be stored in ``array('q')``
+    or NumPy ``int64`` columns:
+
+    - key, made by `pack_key`; sorting dates by key (e.g. with
+      ``numpy.argsort``) gives the same order as sorting
+      `~ged4py.date.DateValue` instances;
+    - payload, with calendar, year, month, day, B.C. flag and dual year of
+      each date in the value.
+
+    Phrases of INT and phrase-only dates are kept in a table owned by the
+    packer, payload stores index into that table. Identical phrases share
+    the same index.
+
+    Unpacked dates are equal to the original dates and have identical string
+    representation, but their calendar dates do not have `original`
+    attribute set. Dates that cannot be encoded without loss (year outside
+    0-16383 range, day over 62, unknown month names, or dual year too far
+    from the year) raise `ValueError`.
+
+    Typical use::
+
+        packer = DatePacker()
+        keys, payloads = packer.pack_many(dates)
+        order = sorted(range(len(keys)), key=keys.__getitem__)
+        earliest = packer.unpack(keys[order[0]], payloads[order[0]])
+    """
+    def __init__(self, phrases=None):
+        self._phrases = []
+        self._phrase_index = {}
+        for phrase in phrases or []:
+            self._add_phrase(phrase)
+
+    @property
+    def phrases(self):
+        """Phrase table (`list` [ `str` ]), must not be modified."""
+        return self._phrases
+
+    def _add_phrase(self, phrase):
+        index = self._phrase_index.get(phrase)
+        if index is None:
+            index = self._phrase_index[phrase] = len(self._phrases)
+            self._phrases.append(phrase)
+        return index
+
+    def pack(self, date_value):
+        """Encode a date.
+
+        Parameters
+        ----------
+        date_value : `~ged4py.date.DateValue`
+            Date value.
+
+        Returns
+        -------
+        key : `int`
+            Ordering key, see `pack_key`.
+        payload : `int`
+            Encoded contents of the date.
+
+        Raises
+        ------
+        ValueError
+            Raised if date cannot be encoded.
+        """
+        key = pack_key(date_value)
+        kind = date_value.kind
+        if kind in _SINGLE:
+            payload = _pack_date(date_value.date)
+        elif kind in _DOUBLE:
+            payload = _pack_date(date_value.date1) | (_pack_date(date_value.date2) << 32)
+        elif kind == DateValueTypes.INTERPRETED:
+            payload = (_pack_date(date_value.date) |
+                       (self._add_phrase(date_value.phrase) << 32))
+        else:
+            payload = self._add_phrase(date_value.phrase)
+        return key, payload
+
+    def unpack(self, key, payload):
+        """Decode a date.
+
+        Parameters
+        ----------
+        key : `int`
+            Ordering key, only its kind bits are used.
+        payload : `int`
+            Encoded contents of the date.
+
+        Returns
+        -------
+        date_value : `~ged4py.date.DateValue`
+            Date value.
+        """
+        kind = _KINDS[key & _KIND_MASK]
+        slot1 = payload & _SLOT_MASK
+        slot2 = (payload >> 32) & _SLOT_MASK
+        if kind in _SINGLE:
+            return _SINGLE[kind](_unpack_date(slot1))
+        elif kind in _DOUBLE:
+            return _DOUBLE[kind](_unpack_date(slot1), _unpack_date(slot2))
+        elif kind == DateValueTypes.INTERPRETED:
+            return DateValueInterpreted(_unpack_date(slot1), self._phrases[slot2])
+        return DateValuePhrase(self._phrases[slot1])
+
+    def pack_many(self, date_values):
+        """Encode many dates.
+
+        Parameters
+        ----------
+        date_values : iterable [ `~ged4py.date.DateValue` ]
+            Date values.
+
+        Returns
+        -------
+        keys : `array.array`
+            Array of ordering keys (type code "q").
+        payloads : `array.array`
+            Array of payloads (type code "q").
+
+        Raises
+        ------
+        ValueError
+            Raised if any date cannot be encoded.
+        """
+        keys = array('q')
+        payloads = array('q')
+        for date_value in date_values:
+            key, payload = self.pack(date_value)
+            keys.append(key)
+            payloads.append(payload)
+        return keys, payloads
+
+    def unpack_many(self, keys, payloads):
+        """Decode many dates.
+
+        Parameters
+        ----------
+        keys : iterable [ `int` ]
+            Ordering keys.
+        payloads : iterable [ `int` ]
+            Payloads.
+
+        Returns
+        -------
+        date_values : `list` [ `~ged4py.date.DateValue` ]
+            Date values.
+        """
+        return [self.unpack(int(key), int(payload)) for key, payload in zip(keys, payloads)]
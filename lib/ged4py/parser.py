@@ -5,16 +5,22 @@ __all__ = ['GedcomReader', 'ParserError', 'CodecError', 'IntegrityError',
            'guess_codec', 'GedcomLine']
 
 import codecs
+import collections
 import io
 import logging
 import re
+import threading
 from typing import List, NamedTuple, Optional
 
-from .detail.io import check_bom, guess_lineno, BinaryFileCR
+from .detail.extract import ExtractPlan, make_column
+from .detail.io import check_bom, guess_lineno, BinaryFileCR, BufferSource, LineReader, PositionalFile
 from . import model
 
 _log = logging.getLogger(__name__)
 
+# Maximum size of a run of adjacent records read at once by resolve_all
+_RESOLVE_READ_SIZE = 1 << 20
+
 # records are bytes, regex is for bytes too
 _re_GedcomLine = re.compile(br"""
         ^
@@ -220,6 +226,9 @@ class GedcomReader:
         If True then exception is thrown if CHAR record is not found in a
         header, if False and CHAR is not in the header then codec determined
         from BOM or "gedcom" is used.
+    record_cache_size : `int`, optional
+        Maximum number of records kept in a cache of records resolved by
+        reference ID (see `read_xref`), 0 disables cache.
 
     Notes
     -----
@@ -236,17 +245,28 @@ class GedcomReader:
             for record in parser.records0("INDI"):
                 # do something with the record or navigate to other linked records
 
+    Reader can be shared between threads, e.g. records can be read and
+    pointers resolved from a thread pool. File is read with ``os.pread``
+    which does not depend on file position, for file objects which do not
+    support it (e.g. `io.BytesIO`) reads are serialized with a lock. Record
+    instances should not be modified when they are shared between threads.
     """
 
     def __init__(self, file, encoding=None, errors="strict",
-                 require_char=False):
+                 require_char=False, record_cache_size=1024):
         self._encoding = encoding
         self._errors = errors
         self._bom_size = 0
         self._index0 = None   # list of level=0 record positions
         self._xref0 = None    # maps xref_id to level=0 record position
+        self._ends0 = None    # maps level=0 record position to its end
         self._header = None
         self._dialect = None
+        # LRU cache of records resolved by xref_id, maps offset to record
+        self._record_cache = collections.OrderedDict()
+        self._record_cache_size = record_cache_size
+        # protects index initialization and record cache
+        self._lock = threading.Lock()
 
         # open the file
         if hasattr(file, 'read'):
@@ -271,9 +291,23 @@ class GedcomReader:
             self._file.close()
             raise
         self._file.seek(self._bom_size)
+        self._source = PositionalFile(self._file)
         if not self._encoding:
             self._encoding = encoding
 
+    @property
+    def encoding(self):
+        """Name of the codec used to decode file contents, either given to
+        constructor or determined from the file (`str`).
+        """
+        return self._encoding
+
+    @property
+    def errors(self):
+        """Error handling scheme used for decoding file contents (`str`).
+        """
+        return self._errors
+
     @property
     def index0(self):
         """List of level=0 record positions and tag names (`list[(int, str)]`).
@@ -291,6 +325,53 @@ class GedcomReader:
             self._init_index()
         return self._xref0
 
+    def record_span(self, offset):
+        """Return byte span of a level=0 record.
+
+        Span of a record includes all its sub-records and ends at the start
+        of the next level=0 record (or at the end of file).
+
+        Parameters
+        ----------
+        offset : `int`
+            Position of the level=0 record in the file, as in `index0` or
+            `xref0`.
+
+        Returns
+        -------
+        span : `tuple` [ `int`, `int` ] or ``None``
+            Start and end positions of the record, ``None`` if offset is not
+            a position of a level=0 record.
+        """
+        if self._index0 is None:
+            self._init_index()
+        end = self._ends0.get(offset)
+        return None if end is None else (offset, end)
+
+    def read_bytes(self, start, end):
+        """Return raw contents of a part of a file.
+
+        Parameters
+        ----------
+        start : `int`
+            Start position in the file.
+        end : `int`
+            End position in the file, exclusive.
+
+        Returns
+        -------
+        data : `bytes`
+            Raw file data, not decoded, shorter than requested at EOF.
+
+        Examples
+        --------
+        Copy a record without parsing it::
+
+            offset, _ = parser.xref0["@I1@"]
+            data = parser.read_bytes(*parser.record_span(offset))
+        """
+        return self._source.read_at(start, max(end - start, 0))
+
     @property
     def header(self):
         """Header record (`ged4py.model.Record`).
@@ -301,18 +382,27 @@ class GedcomReader:
 
     def _init_index(self):
         _log.debug("in _init_index")
-        self._index0 = []
-        self._xref0 = {}
-        # scan whole file for level=0 records
-        for gline in self.GedcomLines(self._bom_size):
-            _log.debug("  _init_index gline: %s", gline)
-            if gline.level == 0:
-                self._index0.append((gline.offset, gline.tag))
-                if gline.xref_id:
-                    self._xref0[gline.xref_id] = (gline.offset, gline.tag)
-            _log.debug("  _init_index gline: done proc")
-        if self._index0 and self._index0[0][1] == 'HEAD':
-            self._header = self.read_record(self._index0[0][0])
+        with self._lock:
+            if self._index0 is not None:
+                # another thread did it already
+                return
+            index0 = []
+            xref0 = {}
+            # scan whole file for level=0 records
+            for gline in self.GedcomLines(self._bom_size):
+                _log.debug("  _init_index gline: %s", gline)
+                if gline.level == 0:
+                    index0.append((gline.offset, gline.tag))
+                    if gline.xref_id:
+                        xref0[gline.xref_id] = (gline.offset, gline.tag)
+                _log.debug("  _init_index gline: done proc")
+            offsets = [offset for offset, _ in index0]
+            self._ends0 = dict(zip(offsets, offsets[1:] + [self._source.size()]))
+            if index0 and index0[0][1] == 'HEAD':
+                self._header = self.read_record(index0[0][0])
+            # index0 is set last, other threads only look at index0
+            self._xref0 = xref0
+            self._index0 = index0
         _log.debug("_init_index done")
 
     @property
@@ -336,13 +426,17 @@ class GedcomReader:
     def dialect(self, value):
         self._dialect = value
 
-    def GedcomLines(self, offset):
+    def GedcomLines(self, offset, end=None):
         """Generator method for *gedcom lines*.
 
         Parameters
         ----------
         offset : `int`
             Position in the file to start reading.
+        end : `int`, optional
+            Position in the file to stop reading, by default reading stops
+            at the end of file. If given then whole range is read in one
+            call.
 
         Yields
         ------
@@ -363,26 +457,28 @@ class GedcomReader:
         this method does not perform any operations on the lines other than
         returning the lines in their order in file.
 
+        Each generator reads the file independently of file position and of
+        other generators.
+
         This method iterates over all lines in input file and converts each
         line into `GedcomLine` class. It is an implementation detail used by
         other methods, most clients will not need to use this method.
         """
+        return self._gedcom_lines(self._source, offset, end)
 
-        self._file.seek(offset)
-
+    def _gedcom_lines(self, source, offset, end):
+        """Implementation of `GedcomLines` reading from a given source,
+        `~ged4py.detail.io.PositionalFile` or
+        `~ged4py.detail.io.BufferSource`.
+        """
         prev_gline: Optional[GedcomLine] = None
-        while True:
+        for offset, line in LineReader(source, offset, end):
 
-            offset = self._file.tell()
-            line = self._file.readline()  # stops at \n
-            if not line:
-                break
             line = line.lstrip().rstrip(b"\r\n")
 
             match = _re_GedcomLine.match(line)
             if not match:
-                self._file.seek(offset)
-                lineno = guess_lineno(self._file)
+                lineno = self._guess_lineno(offset)
                 line = line.decode(self._encoding, "ignore")
                 raise ParserError("Invalid syntax at line "
                                   "{0}: `{1}'".format(lineno, line))
@@ -400,8 +496,7 @@ class GedcomReader:
             if prev_gline is not None:
                 if level - prev_gline.level > 1:
                     # nested levels should be incremental (+1)
-                    self._file.seek(offset)
-                    lineno = guess_lineno(self._file)
+                    lineno = self._guess_lineno(offset)
                     line = line.decode(self._encoding, "ignore")
                     raise IntegrityError("Structural integrity - "
                                          "illegal level nesting at line "
@@ -413,8 +508,7 @@ class GedcomReader:
                          level != prev_gline.level) or
                         (prev_gline.tag not in ("CONT", "CONC") and
                          level - prev_gline.level != 1)):
-                        self._file.seek(offset)
-                        lineno = guess_lineno(self._file)
+                        lineno = self._guess_lineno(offset)
                         line = line.decode(self._encoding, "ignore")
                         raise IntegrityError("Structural integrity -  illegal "
                                              "CONC/CONT nesting at line "
@@ -429,6 +523,13 @@ class GedcomReader:
 
             prev_gline = gline
 
+    def _guess_lineno(self, offset):
+        """Return line number for a position in a file, for error messages.
+        """
+        with self._source.lock:
+            self._file.seek(offset)
+            return guess_lineno(self._file)
+
     def records0(self, tag=None):
         """Iterator over level=0 records with given tag.
 
@@ -453,13 +554,228 @@ class GedcomReader:
             if tag is None or tag == xtag:
                 yield self.read_record(offset)
 
+    def extract(self, tag, columns, types=None, converters=None,
+                xref_column="xref_id", chunk_size=None, follow=True):
+        """Extract values of sub-records from level=0 records into columns.
+
+        For each level=0 record with a given tag, the value in each column is
+        the same as returned from `~ged4py.model.Record.sub_tag_value` for
+        the column path, but all paths are compiled together and resolved in
+        a single traversal of the record.
+
+        Parameters
+        ----------
+        tag : `str`
+            Tag of level=0 records, e.g. "INDI".
+        columns : `dict` [ `str`, `str` ]
+            Maps column name to a path of sub-record, e.g.
+            ``{"name": "NAME", "birth": "BIRT/DATE"}``.
+        types : `dict` [ `str`, `object` ], optional
+            Maps column name to a column type. One-character string is a
+            type code for `array.array` (e.g. "d" or "q"), any other value
+            is used as ``dtype`` for ``numpy.array``. Columns without type
+            are returned as lists. Values (after conversion) must be
+            compatible with the type.
+        converters : `dict` [ `str`, callable ], optional
+            Maps column name to a function applied to each value of the
+            column, ``None`` is passed to it for missing values.
+        xref_column : `str`, optional
+            Name of the additional column with reference IDs of records,
+            if ``None`` then this column is not added.
+        chunk_size : `int`, optional
+            If given then generator is returned which yields results for at
+            most ``chunk_size`` records at a time.
+        follow : `bool`, optional
+            If True then resolve pointers.
+
+        Returns
+        -------
+        data : `dict` [ `str`, `object` ] or iterator
+            Maps column name to a list or array of values, one value per
+            record. If ``chunk_size`` is given then iterator over such
+            dictionaries.
+
+        Examples
+        --------
+        Extract names and birth dates of all individuals::
+
+            data = parser.extract("INDI", {"name": "NAME", "birth": "BIRT/DATE"})
+            for xref_id, birth in zip(data["xref_id"], data["birth"]):
+                ...
+        """
+        names = list(columns)
+        plan = ExtractPlan([columns[name] for name in names], follow)
+        converters = converters or {}
+        types = types or {}
+
+        def _columns(xref_ids, rows):
+            values = list(zip(*rows)) if rows else [()] * len(names)
+            data = {}
+            if xref_column is not None:
+                data[xref_column] = make_column(xref_ids, types.get(xref_column))
+            for name, column in zip(names, values):
+                converter = converters.get(name)
+                column = [converter(value) for value in column] if converter else list(column)
+                data[name] = make_column(column, types.get(name))
+            return data
+
+        def _chunks():
+            xref_ids, rows = [], []
+            for record in self.records0(tag):
+                xref_ids.append(record.xref_id)
+                rows.append(plan.values(record))
+                if len(rows) == chunk_size:
+                    yield _columns(xref_ids, rows)
+                    xref_ids, rows = [], []
+            if rows or chunk_size is None:
+                yield _columns(xref_ids, rows)
+
+        if chunk_size is None:
+            return next(_chunks())
+        return _chunks()
+
+    def read_xref(self, xref_id):
+        """Return level=0 record with given reference ID.
+
+        Records returned from this method are kept in a cache of limited
+        size, repeated calls for the same reference ID return the same
+        instance without reading and parsing the file again. This method
+        is used to resolve `~ged4py.model.Pointer` records, so instances
+        returned from it are shared and must not be modified.
+
+        Parameters
+        ----------
+        xref_id : `str`
+            Reference ID, e.g. "@I1@".
+
+        Returns
+        -------
+        record : `~ged4py.model.Record` or ``None``
+            Record instance, ``None`` if reference ID is not known.
+        """
+        offset, _ = self.xref0.get(xref_id, (None, None))
+        if offset is None:
+            return None
+        record = self._cached_record(offset)
+        if record is None:
+            # parse outside of lock, other threads can read at the same time
+            record = self._cache_record(offset, self.read_record(offset))
+        return record
+
+    def resolve_all(self, pointers):
+        """Return level=0 records for many reference IDs at once.
+
+        Records which are not in cache are read in the order of their
+        position in a file, in a single forward sweep. Runs of adjacent
+        records are read from the file with one read and then split into
+        records using `record_span`. Records are added to the cache used by
+        `read_xref` and `~ged4py.model.Pointer.ref`.
+
+        Parameters
+        ----------
+        pointers : iterable [ `~ged4py.model.Pointer` or `str` ]
+            Pointer records or reference IDs.
+
+        Returns
+        -------
+        records : `list` [ `~ged4py.model.Record` ]
+            Records in the same order as ``pointers``, ``None`` for unknown
+            reference IDs.
+        """
+        xref0 = self.xref0
+        offsets = [xref0.get(getattr(pointer, "value", pointer), (None, None))[0]
+                   for pointer in pointers]
+        records = {}
+        missing = set()
+        for offset in offsets:
+            if offset is not None and offset not in records and offset not in missing:
+                record = self._cached_record(offset)
+                if record is None:
+                    missing.add(offset)
+                else:
+                    records[offset] = record
+        run = []
+        for offset in sorted(missing):
+            if run and (self._ends0[run[-1]] != offset or
+                        self._ends0[offset] - run[0] > _RESOLVE_READ_SIZE):
+                self._resolve_run(run, records)
+                run = []
+            run.append(offset)
+        if run:
+            self._resolve_run(run, records)
+        return [None if offset is None else records[offset] for offset in offsets]
+
+    def _resolve_run(self, run, records):
+        """Read and cache a run of adjacent level=0 records.
+
+        Parameters
+        ----------
+        run : `list` [ `int` ]
+            Positions of adjacent records, in increasing order.
+        records : `dict` [ `int`, `~ged4py.model.Record` ]
+            Maps record position to record, updated in place.
+        """
+        ends0 = self._ends0
+        source = BufferSource(self.read_bytes(run[0], ends0[run[-1]]), run[0])
+        for offset in run:
+            record = self._read_record(source, offset, ends0[offset])
+            records[offset] = self._cache_record(offset, record)
+
+    def prefetch(self, pointers):
+        """Read records for many reference IDs into the record cache.
+
+        Same as `resolve_all` but does not return records, subsequent
+        `~ged4py.model.Pointer.ref` calls for these pointers do not read the
+        file. Cache keeps at most ``record_cache_size`` records, so only
+        that many records can be prefetched at a time. If there are more
+        distinct records then only the first ``record_cache_size`` of them
+        are prefetched and a warning is logged, otherwise records prefetched
+        last would evict the first ones from cache.
+
+        Parameters
+        ----------
+        pointers : iterable [ `~ged4py.model.Pointer` or `str` ]
+            Pointer records or reference IDs.
+        """
+        xref0 = self.xref0
+        xref_ids = [xref_id for xref_id in dict.fromkeys(getattr(pointer, "value", pointer)
+                                                         for pointer in pointers)
+                    if xref_id in xref0]
+        if len(xref_ids) > self._record_cache_size:
+            _log.warning("prefetch: %d records do not fit into record cache, only first "
+                         "%d are prefetched, increase record_cache_size",
+                         len(xref_ids), self._record_cache_size)
+            del xref_ids[self._record_cache_size:]
+        self.resolve_all(xref_ids)
+
+    def _cached_record(self, offset):
+        """Return record from cache or ``None``.
+        """
+        with self._lock:
+            record = self._record_cache.get(offset)
+            if record is not None:
+                self._record_cache.move_to_end(offset)
+            return record
+
+    def _cache_record(self, offset, record):
+        """Add record to cache, returns the cached instance.
+        """
+        if self._record_cache_size > 0:
+            with self._lock:
+                # keep the instance made by another thread, if any
+                record = self._record_cache.setdefault(offset, record)
+                if len(self._record_cache) > self._record_cache_size:
+                    self._record_cache.popitem(last=False)
+        return record
+
     def read_record(self, offset):
         """Read next complete record from a file starting at given position.
 
         Reads the record at given position and all its sub-records. Stops
         reading at EOF or next record with the same or higher (smaller) level
-        number. File position after return from this method is not specified,
-        re-position file if you want to read other records.
+        number. For level=0 records the whole `record_span` is read at once
+        after `index0` is built. This method does not change file position,
+        it can be called from several threads at the same time.
 
         This is mostly for internal use, regular clients don't need to use it.
 
@@ -480,9 +796,16 @@ class GedcomReader:
             for any parsing errors.
         """
         _log.debug("in read_record(%s)", offset)
+        end = self._ends0.get(offset) if self._ends0 is not None else None
+        return self._read_record(self._source, offset, end)
+
+    def _read_record(self, source, offset, end):
+        """Implementation of `read_record` reading from a given source, see
+        `_gedcom_lines`.
+        """
         stack: List[Optional[model.Record]] = []  # stores per-level current records
         reclevel: Optional[int] = None
-        for gline in self.GedcomLines(offset):
+        for gline in self._gedcom_lines(source, offset, end):
             _log.debug("    read_record, gline: %s", gline)
             level = gline.level
 
@@ -0,0 +1,403 @@
+"""Module implementing simple selector language for GEDCOM records.
+
+Selector is a string which describes a path from a level 0 record to its
+subordinate records, e.g.::
+
+    INDI/BIRT/DATE
+    INDI[SEX="F"]/NAME
+    FAM/CHIL->INDI/NAME
+    INDI[!DEAT]/BIRT/PLAC
+
+Selector consists of steps separated by ``/`` or ``->``. Each step is a tag
+name or ``*`` which matches any tag. First step matches level 0 records,
+``/`` goes to direct sub-records, and ``->`` resolves pointer records (like
+``follow=True`` in `~ged4py.model.Record.sub_tag`) and matches the tag of
+the referenced record. Each step can have any number of predicates in square
+brackets:
+
+- ``[PATH]`` - record has sub-record with a given path;
+- ``[!PATH]`` - record does not have sub-record with a given path;
+- ``[PATH="value"]`` - record has sub-record with a given path and value;
+- ``[PATH!="value"]`` - record has no sub-record with a given path and
+  value.
+
+``PATH`` in predicates is the same as in `~ged4py.model.Record.sub_tags`, it
+can contain several tags separated by slashes, pointers are resolved. Values
+are compared with record values as strings. For DATE and NAME records the
+original string from the file (``raw_value``) is used, e.g.
+``INDI[NAME="John /Smith/"]`` or ``INDI[BIRT/DATE="ABT 1900"]``, dates are
+not parsed and name tuples are not compared. Inside quoted values backslash
+escapes next character.
+"""
+
+__all__ = ["SelectorError", "Selector", "Query"]
+
+import re
+
+from .model import Pointer
+
+
+class SelectorError(ValueError):
+    """Exception raised for errors in selector syntax.
+    """
+
+
+_TOKEN_RE = re.compile(r"""
+    \s*(?:
+        (?P<tag>[A-Za-z0-9_]+|\*)
+        | (?P<op>->|!=|[/\[\]=!])
+        | "(?P<string>(?:[^"\\]|\\.)*)"
+    )\s*
+    """, re.X)
+
+
+def _tokenize(text):
+    """Split selector string into tokens.
+
+    Yields
+    ------
+    kind : `str`
+        One of "tag", "op", or "string".
+    value : `str`
+        Token value.
+    """
+    pos = 0
+    while pos < len(text):
+        m = _TOKEN_RE.match(text, pos)
+        if m is None or m.end() == pos:
+            raise SelectorError("Unexpected character at position {} in selector: {}".format(
+                pos, text))
+        pos = m.end()
+        kind = m.lastgroup
+        value = m.group(kind)
+        if kind == "string":
+            value = re.sub(r"\\(.)", r"\1", value)
+        yield kind, value
+
+
+_NO_VALUE = object()
+
+
+def _record_value(record):
+    """Return value of the record for comparison in predicates.
+    """
+    # original string of DATE and NAME records is used, without parsing
+    # the date
+    value = getattr(record, "raw_value", _NO_VALUE)
+    if value is _NO_VALUE:
+        value = record.value
+    return value if value is None else str(value)
+
+
+class _Predicate:
+    """Predicate applied to records at a step.
+
+    Parameters
+    ----------
+    path : `str`
+        Path of sub-records.
+    op : `str`
+        One of "exists", "missing", "=", "!=".
+    value : `str`
+        Value to compare, ``None`` for "exists" and "missing".
+    """
+    def __init__(self, path, op, value):
+        self.path = path
+        self.op = op
+        self.value = value
+
+    def __call__(self, record):
+        records = record.sub_tags(self.path) if record.sub_records else []
+        if self.op == "exists":
+            return bool(records)
+        elif self.op == "missing":
+            return not records
+        found = any(_record_value(rec) == self.value for rec in records if rec is not None)
+        return found if self.op == "=" else not found
+
+    def __str__(self):
+        if self.op == "exists":
+            return "[{}]".format(self.path)
+        elif self.op == "missing":
+            return "[!{}]".format(self.path)
+        value = self.value.replace("\\", "\\\\").replace('"', '\\"')
+        return '[{}{}"{}"]'.format(self.path, self.op, value)
+
+
+class _Step:
+    """Single step of a selector.
+
+    Parameters
+    ----------
+    tag : `str`
+        Tag name, ``None`` matches any tag.
+    follow : `bool`
+        If True then records from previous step are pointers which are
+        resolved.
+    predicates : `list` [ `_Predicate` ]
+        Predicates.
+    """
+    def __init__(self, tag, follow, predicates):
+        self.tag = tag
+        self.follow = follow
+        self.predicates = predicates
+        self.key = str(self)
+
+    def matches(self, record):
+        """Check record tag and predicates.
+        """
+        if self.tag is not None and record.tag != self.tag:
+            return False
+        return all(predicate(record) for predicate in self.predicates)
+
+    def apply(self, records):
+        """Return records produced by this step from previous step records.
+        """
+        result = []
+        if self.follow:
+            for rec in records:
+                if isinstance(rec, Pointer):
+                    rec = rec.ref
+                    if rec is not None and self.matches(rec):
+                        result.append(rec)
+        else:
+            for rec in records:
+                for sub_rec in rec.sub_records or ():
+                    if self.matches(sub_rec):
+                        result.append(sub_rec)
+        return result
+
+    def __str__(self):
+        return ("->" if self.follow else "/") + (self.tag or "*") + \
+            "".join(str(predicate) for predicate in self.predicates)
+
+
+class Selector:
+    """Compiled selector.
+
+    Parameters
+    ----------
+    text : `str`
+        Selector string, see module documentation for syntax.
+
+    Raises
+    ------
+    SelectorError
+        Raised if selector has incorrect syntax.
+    """
+    def __init__(self, text):
+        self._text = text
+        self._steps = self._parse(text)
+
+    @staticmethod
+    def _parse(text):
+        tokens = list(_tokenize(text))
+        pos = 0
+
+        def _error(message):
+            return SelectorError("{} in selector: {}".format(message, text))
+
+        def _next(kind=None, value=None):
+            nonlocal pos
+            if pos >= len(tokens):
+                raise _error("Unexpected end")
+            token = tokens[pos]
+            if (kind is not None and token[0] != kind) or (value is not None and token[1] != value):
+                raise _error("Unexpected token {!r}".format(token[1]))
+            pos += 1
+            return token[1]
+
+        def _peek():
+            return tokens[pos] if pos < len(tokens) else (None, None)
+
+        def _path():
+            tags = [_next("tag")]
+            while _peek() == ("op", "/"):
+                _next()
+                tags.append(_next("tag"))
+            if "*" in tags:
+                raise _error("Wildcard is not allowed in predicate")
+            return "/".join(tags)
+
+        steps = []
+        follow = False
+        while True:
+            tag = _next("tag")
+            predicates = []
+            while _peek() == ("op", "["):
+                _next()
+                if _peek() == ("op", "!"):
+                    _next()
+                    predicates.append(_Predicate(_path(), "missing", None))
+                else:
+                    path = _path()
+                    kind, op = _peek()
+                    if kind == "op" and op in ("=", "!="):
+                        _next()
+                        predicates.append(_Predicate(path, op, _next("string")))
+                    else:
+                        predicates.append(_Predicate(path, "exists", None))
+                _next("op", "]")
+            steps.append(_Step(None if tag == "*" else tag, follow, predicates))
+            if pos == len(tokens):
+                break
+            sep = _next("op")
+            if sep not in ("/", "->"):
+                raise _error("Unexpected token {!r}".format(sep))
+            follow = sep == "->"
+        return steps
+
+    @property
+    def text(self):
+        """Selector string (`str`)."""
+        return self._text
+
+    @property
+    def root_tag(self):
+        """Tag of level 0 records, ``None`` if selector starts with ``*``
+        (`str`).
+        """
+        return self._steps[0].tag
+
+    def select(self, record):
+        """Apply selector to a level 0 record.
+
+        Parameters
+        ----------
+        record : `~ged4py.model.Record`
+            Level 0 record.
+
+        Returns
+        -------
+        records : `list` [ `~ged4py.model.Record` ]
+            Matching records in document order, possibly empty.
+        """
+        if not self._steps[0].matches(record):
+            return []
+        records = [record]
+        for step in self._steps[1:]:
+            if not records:
+                break
+            records = step.apply(records)
+        return records
+
+    def __str__(self):
+        return self._text
+
+    def __repr__(self):
+        return "Selector({!r})".format(self._text)
+
+
+class _PlanNode:
+    """Node of the evaluation plan, all selectors sharing the same leading
+    steps share the same node.
+    """
+    def __init__(self, step):
+        self.step = step
+        self.children = {}
+        self.outputs = []
+
+    def evaluate(self, records, results):
+        records = self.step.apply(records)
+        if records:
+            for index in self.outputs:
+                results[index] = records
+            for child in self.children.values():
+                child.evaluate(records, results)
+
+
+class Query:
+    """Collection of selectors evaluated together.
+
+    Parameters
+    ----------
+    selectors : iterable [ `Selector` or `str` ]
+        Selectors, strings are compiled into `Selector` instances.
+
+    Raises
+    ------
+    SelectorError
+        Raised if selector has incorrect syntax.
+
+    Notes
+    -----
+    Selectors are compiled into a single evaluation plan, in which the
+    steps common to several selectors (e.g. ``INDI[SEX="F"]/BIRT`` in
+    ``INDI[SEX="F"]/BIRT/DATE`` and ``INDI[SEX="F"]/BIRT/PLAC``) are
+    evaluated only once per record. `run` method reads all level 0 records
+    that can match any of the selectors in a single pass over the file.
+
+    Typical use::
+
+        query = Query(['INDI[SEX="F"]/NAME', 'INDI[SEX="F"]/BIRT/DATE'])
+        with GedcomReader(path) as parser:
+            for record, (names, dates) in query.run(parser):
+                ...
+    """
+    def __init__(self, selectors):
+        self._selectors = [sel if isinstance(sel, Selector) else Selector(sel)
+                           for sel in selectors]
+        self._roots = {}
+        for index, selector in enumerate(self._selectors):
+            steps = selector._steps
+            node = self._roots.get(steps[0].key)
+            if node is None:
+                node = self._roots[steps[0].key] = _PlanNode(steps[0])
+            for step in steps[1:]:
+                child = node.children.get(step.key)
+                if child is None:
+                    child = node.children[step.key] = _PlanNode(step)
+                node = child
+            node.outputs.append(index)
+
+    @property
+    def selectors(self):
+        """Compiled selectors (`list` [ `Selector` ])."""
+        return self._selectors
+
+    def select(self, record):
+        """Apply all selectors to a level 0 record.
+
+        Parameters
+        ----------
+        record : `~ged4py.model.Record`
+            Level 0 record.
+
+        Returns
+        -------
+        results : `list` [ `list` [ `~ged4py.model.Record` ] ]
+            List of matching records for each selector, in the same order
+            as selectors.
+        """
+        results = [[] for _ in self._selectors]
+        for root in self._roots.values():
+            if root.step.matches(record):
+                for index in root.outputs:
+                    results[index] = [record]
+                for child in root.children.values():
+                    child.evaluate([record], results)
+        return results
+
+    def run(self, reader):
+        """Apply all selectors to all level 0 records in a file.
+
+        Parameters
+        ----------
+        reader : `~ged4py.parser.GedcomReader`
+            Parser instance.
+
+        Yields
+        ------
+        record : `~ged4py.model.Record`
+            Level 0 record which is matched by at least one selector.
+        results : `list` [ `list` [ `~ged4py.model.Record` ] ]
+            List of matching records for each selector.
+        """
+        tags = {root.step.tag for root in self._roots.values()}
+        # only read records with tags that can match
+        for offset, tag in reader.index0:
+            if tag in tags or None in tags:
+                record = reader.read_record(offset)
+                results = self.select(record)
+                if any(results):
+                    yield record, results
@@ -0,0 +1,136 @@
+"""Module with helper methods for sorting records.
+"""
+
+__all__ = ["sort_key", "sort_individuals", "top_individuals"]
+
+import heapq
+
+from .model import NameOrder
+
+# Key for records without date, larger than keys of all dated records
+_NO_DATE = (1,)
+
+
+def _name_key(order, collate):
+    if collate is None:
+        def key(record):
+            return record.name.order(order)
+    else:
+        def key(record):
+            return tuple(collate(item) for item in record.name.order(order))
+    return key
+
+
+def _date_key(tag):
+    path = tag + "/DATE"
+
+    def key(record):
+        date = record.sub_tag_value(path)
+        if date is None:
+            return _NO_DATE
+        return (0, date.ordering_key())
+    return key
+
+
+def sort_key(by=NameOrder.SURNAME_GIVEN, collate=None):
+    """Make key function for sorting individuals.
+
+    Parameters
+    ----------
+    by : `~ged4py.model.NameOrder` or `str` or callable
+        Sorting criteria. If it is one of the `~ged4py.model.NameOrder`
+        enums then individuals are sorted by name in that order. If it is
+        a string then it is interpreted as an event tag (e.g. "BIRT" or
+        "DEAT") and individuals are sorted by the date of that event,
+        individuals without date are placed after all others. Callable
+        is returned unchanged.
+    collate : callable, optional
+        Function converting name strings into collation keys, e.g.
+        ``locale.strxfrm``. Only used for sorting by name.
+
+    Returns
+    -------
+    key : callable
+        Function which takes `~ged4py.model.Individual` and returns its
+        sorting key.
+
+    Raises
+    ------
+    ValueError
+        Raised if ``by`` has unexpected type.
+    """
+    if isinstance(by, NameOrder):
+        return _name_key(by, collate)
+    elif isinstance(by, str):
+        return _date_key(by)
+    elif callable(by):
+        return by
+    raise ValueError("unexpected sorting criteria: {!r}".format(by))
+
+
+def sort_individuals(records, by=NameOrder.SURNAME_GIVEN, collate=None, reverse=False):
+    """Sort individuals.
+
+    Sorting key is computed once for each record, which is much faster than
+    comparing names or dates of records directly.
+
+    Parameters
+    ----------
+    records : iterable [ `~ged4py.model.Individual` ]
+        Records to sort.
+    by : `~ged4py.model.NameOrder` or `str` or callable, optional
+        Sorting criteria, see `sort_key`.
+    collate : callable, optional
+        Collation function for names, see `sort_key`.
+    reverse : `bool`, optional
+        If ``True`` then sort in descending order.
+
+    Returns
+    -------
+    records : `list` [ `~ged4py.model.Individual` ]
+        Sorted list of records, sort is stable.
+
+    Examples
+    --------
+    Sort people by surname using current locale::
+
+        locale.setlocale(locale.LC_COLLATE, "")
+        people = sort_individuals(parser.records0("INDI"),
+                                  collate=locale.strxfrm)
+    """
+    return sorted(records, key=sort_key(by, collate), reverse=reverse)
+
+
+def top_individuals(records, n, by="BIRT", collate=None, reverse=False):
+    """Return first few individuals in sorted order.
+
+    This is equivalent to ``sort_individuals(...)[:n]`` but it uses heap
+    with ``n`` elements instead of sorting all records, so it works well for
+    large inputs and small ``n``.
+
+    Parameters
+    ----------
+    records : iterable [ `~ged4py.model.Individual` ]
+        Records to select from.
+    n : `int`
+        Number of records to return.
+    by : `~ged4py.model.NameOrder` or `str` or callable, optional
+        Sorting criteria, see `sort_key`, default is to sort by birth date.
+    collate : callable, optional
+        Collation function for names, see `sort_key`.
+    reverse : `bool`, optional
+        If ``True`` then return last records in descending order.
+
+    Returns
+    -------
+    records : `list` [ `~ged4py.model.Individual` ]
+        At most ``n`` records.
+
+    Examples
+    --------
+    Find 100 people with the earliest birth dates::
+
+        oldest = top_individuals(parser.records0("INDI"), 100, by="BIRT")
+    """
+    select = heapq.nlargest if reverse else heapq.nsmallest
+    return select(n, records, key=sort_key(by, collate))
@@ -0,0 +1,267 @@
+"""Module for extracting subsets of GEDCOM files without parsing records.
+
+Records in the subset are copied from the original file byte by byte, only
+lines with pointers to records that are not in the subset are removed.
+Typical use is to extract ancestors of an individual::
+
+    with GedcomReader(path) as parser:
+        graph = FamilyGraph.from_reader(parser)
+        root = graph.node("@I1@")
+        xref_ids = {graph.xref_id(node) for node in graph.ancestors(root)}
+        xref_ids.add("@I1@")
+        with open(output, "wb") as file:
+            write_subset(parser, xref_ids, file, graph)
+"""
+
+__all__ = ["closure", "write_subset"]
+
+import re
+
+from .graph import FamilyGraph
+
+# Line with a pointer value, same rule as in model.make_record: value starts
+# and ends with "@"
+_POINTER_RE = re.compile(br"""
+    (?:(?<=[\r\n])|\A)                       # start of line
+    [ \t]*(?P<level>\d+)                     # integer level number
+    (?:[ ]*@[A-Za-z0-9][^@]*@)?              # optional @xref@
+    [ ]*(?P<tag>[A-Za-z0-9_]+)               # tag name
+    [ ](?P<value>@[^\r\n]+@)                 # pointer value
+    (?=[\r\n]|\Z)                            # end of line
+""", re.X)
+
+# Level 1 records of the original header copied into new header
+_HEADER_TAGS = (b"GEDC", b"CHAR", b"LANG", b"SUBM")
+
+_FAMILY_TAGS = ("INDI", "FAM")
+
+
+def _pointers(reader, data):
+    """Return reference IDs of all pointers in raw record data.
+    """
+    encoding, errors = reader.encoding, reader.errors
+    return {match.group("value").decode(encoding, errors)
+            for match in _POINTER_RE.finditer(data)}
+
+
+def _closure(reader, xref_ids, graph):
+    """Implementation of `closure`, also returns raw data of records with
+    pointers outside of closure.
+    """
+    xref0 = reader.xref0
+    individuals = set()
+    for xref_id in xref_ids:
+        if xref0.get(xref_id, (None, None))[1] != "INDI":
+            raise ValueError("unknown INDI reference ID: {}".format(xref_id))
+        individuals.add(xref_id)
+
+    if graph is None:
+        graph = FamilyGraph.from_reader(reader)
+    selected = set(individuals)
+    for family, fam_xref_id in enumerate(graph.families):
+        husband, wife, children = graph.family(family)
+        members = {graph.xref_id(node) for node in (husband, wife) if node >= 0}
+        members.update(graph.xref_id(node) for node in children)
+        count = len(members & individuals)
+        if count and count >= min(2, len(members)):
+            selected.add(fam_xref_id)
+
+    pruned = {}
+    _follow(reader, list(selected), selected, pruned)
+    return selected, pruned
+
+
+def _follow(reader, queue, selected, pruned):
+    """Add records reachable by pointers from records in a queue, except
+    INDI and FAM records.
+
+    Parameters
+    ----------
+    reader : `~ged4py.parser.GedcomReader`
+        Parser instance.
+    queue : `list` [ `str` ]
+        Reference IDs of records to scan for pointers, updated in place.
+    selected : `set` [ `str` ]
+        Reference IDs of selected records, updated in place.
+    pruned : `dict` [ `str`, `bytes` ]
+        Raw data of records with pointers to records which are not
+        selected, updated in place.
+    """
+    xref0 = reader.xref0
+    while queue:
+        xref_id = queue.pop()
+        data = reader.read_bytes(*reader.record_span(xref0[xref_id][0]))
+        dangling = False
+        for target in _pointers(reader, data):
+            if target in selected:
+                continue
+            _, tag = xref0.get(target, (None, None))
+            if tag is None or tag in _FAMILY_TAGS:
+                dangling = True
+            else:
+                selected.add(target)
+                queue.append(target)
+        if dangling:
+            pruned[xref_id] = data
+
+
+def closure(reader, xref_ids, graph=None):
+    """Return all level 0 records needed for a set of individuals.
+
+    Parameters
+    ----------
+    reader : `~ged4py.parser.GedcomReader`
+        Parser instance.
+    xref_ids : iterable [ `str` ]
+        Reference IDs of INDI records.
+    graph : `~ged4py.graph.FamilyGraph`, optional
+        Family graph of the same file, made if not given.
+
+    Returns
+    -------
+    xref_ids : `set` [ `str` ]
+        Reference IDs of the records in the closure.
+
+    Raises
+    ------
+    ValueError
+        Raised if reference ID is not an INDI record.
+
+    Notes
+    -----
+    Closure contains given individuals, FAM records which connect them
+    (families with at least two members in the set, or with all members in
+    the set if family has one member), and all records (SOUR, NOTE, REPO,
+    OBJE, SUBM, etc.) reachable from them by pointers. INDI and FAM records
+    are never added by following pointers. Pointers are found in raw record
+    data, records are not parsed.
+    """
+    return _closure(reader, xref_ids, graph)[0]
+
+
+def _prune(reader, data, selected):
+    """Remove lines with pointers outside of selection and their
+    sub-records from raw record data.
+    """
+    encoding, errors = reader.encoding, reader.errors
+    lines = []
+    skip_level = None
+    for line in data.splitlines(True):
+        level = int(line.split(None, 1)[0])
+        if skip_level is not None:
+            if level > skip_level:
+                continue
+            skip_level = None
+        match = _POINTER_RE.match(line)
+        if match is not None and match.group("value").decode(encoding, errors) not in selected:
+            skip_level = level
+            continue
+        lines.append(line)
+    return b"".join(lines)
+
+
+def _header(reader, header_data):
+    """Make new header from raw data of the original header.
+    """
+    lines = header_data.splitlines(True)
+    eol = lines[0][len(lines[0].rstrip(b"\r\n")):] or b"\n"
+    result = [b"0 HEAD" + eol, b"1 SOUR ged4py" + eol]
+    copy = False
+    for line in lines[1:]:
+        words = line.split(None, 2)
+        if words[0] == b"1":
+            copy = len(words) > 1 and words[1] in _HEADER_TAGS
+        if copy:
+            result.append(line)
+    return b"".join(result), eol
+
+
+def write_subset(reader, xref_ids, file, graph=None):
+    """Write a subset of a file containing given individuals.
+
+    Closure of the individuals is computed with `closure`. Records are
+    written in their original order by copying raw data from the original
+    file, consecutive records are copied with one read. Lines with pointers
+    to records outside of the closure (e.g. FAMS of a spouse which is not in
+    the subset) are removed together with their sub-records.
+
+    New header has SOUR record of this package and copies of GEDC, CHAR,
+    LANG and SUBM records from the original header, submitter record is
+    added to the subset. Byte order mark, if any, is also copied.
+
+    Parameters
+    ----------
+    reader : `~ged4py.parser.GedcomReader`
+        Parser instance.
+    xref_ids : iterable [ `str` ]
+        Reference IDs of INDI records.
+    file
+        Output file open in binary mode.
+    graph : `~ged4py.graph.FamilyGraph`, optional
+        Family graph of the same file, made if not given.
+
+    Returns
+    -------
+    count : `int`
+        Number of level 0 records written, not including header and
+        trailer.
+
+    Raises
+    ------
+    ValueError
+        Raised if reference ID is not an INDI record.
+    """
+    index0 = reader.index0
+    xref0 = reader.xref0
+    header_data = b""
+    if index0 and index0[0][1] == "HEAD":
+        header_data = reader.read_bytes(*reader.record_span(index0[0][0]))
+    header, eol = _header(reader, header_data or b"0 HEAD\n")
+
+    selected, pruned = _closure(reader, xref_ids, graph)
+    submitters = [target for target in _pointers(reader, header)
+                  if target in xref0 and target not in selected]
+    selected.update(submitters)
+    _follow(reader, submitters, selected, pruned)
+    header = _prune(reader, header, selected)
+
+    offsets = {xref0[xref_id][0] for xref_id in selected}
+    pruned = {xref0[xref_id][0]: data for xref_id, data in pruned.items()}
+
+    last = b""  # last chunk written, to check that it ends with a line break
+
+    def write(data):
+        nonlocal last
+        if data:
+            file.write(data)
+            last = data
+
+    write(reader.read_bytes(0, index0[0][0]) if index0 else b"")
+    write(header)
+    count = 0
+    run_start = run_end = None
+    for offset, _ in index0:
+        if offset in offsets and offset not in pruned:
+            start, end = reader.record_span(offset)
+            if run_end == start:
+                run_end = end
+                count += 1
+                continue
+        else:
+            start = None
+        if run_start is not None:
+            write(reader.read_bytes(run_start, run_end))
+            run_start = run_end = None
+        if start is not None:
+            run_start, run_end = start, end
+            count += 1
+        elif offset in pruned:
+            write(_prune(reader, pruned[offset], selected))
+            count += 1
+    if run_start is not None:
+        write(reader.read_bytes(run_start, run_end))
+    if not last.endswith((b"\r", b"\n")):
+        # last record of a file may have no line break
+        file.write(eol)
+    file.write(b"0 TRLR" + eol)
+    return count
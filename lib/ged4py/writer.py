@@ -0,0 +1,238 @@
+"""Module for writing GEDCOM files.
+"""
+
+__all__ = ["GedcomWriter"]
+
+import codecs
+import io
+
+from .model import Record
+
+
+def _record_fields(record):
+    """Return (xref_id, tag, value, sub_records) of a record or dictionary.
+    """
+    if isinstance(record, dict):
+        return (record.get("xref_id"), record["tag"], record.get("value"),
+                record.get("sub_records") or ())
+    value = getattr(record, "raw_value", None)
+    if value is None:
+        value = record.value
+        if isinstance(value, tuple):
+            # NAME record made by client or without value, value is a name
+            # tuple
+            value = "{} /{}/ {}".format(*value[:3]).strip() if any(value[:3]) else None
+        elif value is not None and not isinstance(value, str):
+            # DATE record without value has empty DateValue
+            value = str(value) or None
+    return record.xref_id, record.tag, value, record.sub_records or ()
+
+
+class GedcomWriter:
+    """Writer of GEDCOM files.
+
+    Parameters
+    ----------
+    file
+        File name or file object open in binary mode.
+    encoding : `str`, optional
+        Name of the codec for output, "gedcom" codec is for ANSEL encoding.
+        This should agree with the CHAR record in the header.
+    errors : `str`, optional
+        Controls error handling behavior during string encoding, accepts
+        same values as standard `codecs.encode` method.
+    line_length : `int`, optional
+        Maximum length of a line in characters, not including line
+        terminator. Longer values are split into CONC records.
+    eol : `str`, optional
+        Line terminator.
+    buffer_size : `int`, optional
+        Approximate number of lines collected before writing to file.
+
+    Notes
+    -----
+    Records are written with their sub-records, either `~ged4py.model.Record`
+    instances (e.g. returned from `~ged4py.parser.GedcomReader`) or
+    dictionaries with "tag", and optional "xref_id", "value", and
+    "sub_records" keys. Individual lines can be written with `write_line`
+    or `write_rows`.
+
+    Values with new lines are split into CONT records, values that do not
+    fit into ``line_length`` are split into CONC records, preferably not next
+    to a space. For DATE and NAME records read by parser their original
+    string values (``raw_value``) are written, so that records which were
+    not modified are read back from the output with identical values. Other
+    values which are not strings are converted with ``str()``. Records
+    without value (``None``, empty name tuple or empty date) are written
+    as level and tag only, empty strings are written with a space after
+    the tag.
+
+    Output is collected in memory and encoded and written in large blocks.
+    Writer does not add header or trailer records, they have to be written
+    by client like all other records.
+
+    Typical use::
+
+        with GedcomReader(path) as parser, GedcomWriter(output) as writer:
+            for record in parser.records0():
+                writer.write_record(record)
+    """
+    def __init__(self, file, encoding="utf-8", errors="strict", line_length=255,
+                 eol="\n", buffer_size=65536):
+        self._encoder = codecs.getincrementalencoder(encoding)(errors)
+        self._line_length = line_length
+        self._eol = eol
+        self._buffer_size = buffer_size
+        self._buffer = []
+        self._buffered = 0
+        self._owned = not hasattr(file, "write")
+        self._file = io.open(file, "wb") if self._owned else file
+
+    def write_line(self, level, tag, value=None, xref_id=None):
+        """Write one record without sub-records.
+
+        Parameters
+        ----------
+        level : `int`
+            Record level.
+        tag : `str`
+            Tag name.
+        value : `str`, optional
+            Record value, can contain new lines.
+        xref_id : `str`, optional
+            Reference ID.
+        """
+        lines = []
+        self._lines(lines, level, tag, value, xref_id)
+        self._append(lines)
+
+    def _lines(self, lines, level, tag, value, xref_id):
+        """Append lines of one record to a list.
+        """
+        if xref_id:
+            prefix = "{} {} {}".format(level, xref_id, tag)
+        else:
+            prefix = "{} {}".format(level, tag)
+        eol = self._eol
+        if value is None:
+            lines.append(prefix + eol)
+            return
+        if len(prefix) + len(value) < self._line_length and "\n" not in value:
+            # most common case, value fits into one line; empty string is
+            # written with a space after tag to be read back as empty string
+            lines.append(prefix + " " + value + eol)
+            return
+        for i, text in enumerate(value.split("\n")):
+            if i:
+                prefix = "{} CONT".format(level + 1)
+            while True:
+                width = self._line_length - len(prefix) - 1
+                if len(text) <= width:
+                    lines.append(prefix + " " + text + eol if text else prefix + eol)
+                    break
+                split = self._split(text, width)
+                lines.append(prefix + " " + text[:split] + eol)
+                text = text[split:]
+                prefix = "{} CONC".format(level + 1)
+
+    @staticmethod
+    def _split(text, width):
+        """Return position for splitting long text, avoids spaces at both
+        sides of the split if possible.
+        """
+        if width < 1:
+            raise ValueError("line length is too short for value")
+        split = width
+        while split > width // 2 and (text[split - 1] == " " or text[split] == " "):
+            split -= 1
+        return split if split > width // 2 else width
+
+    def write_record(self, record, level=None):
+        """Write a record and all its sub-records.
+
+        Parameters
+        ----------
+        record : `~ged4py.model.Record` or `dict`
+            Record to write.
+        level : `int`, optional
+            Level of the record, by default level of `~ged4py.model.Record`
+            or 0 for dictionaries. Sub-records are written with increasing
+            levels.
+        """
+        if level is None:
+            level = record.level if isinstance(record, Record) and record.level is not None else 0
+        lines = []
+        stack = [(level, record)]
+        while stack:
+            level, record = stack.pop()
+            xref_id, tag, value, sub_records = _record_fields(record)
+            self._lines(lines, level, tag, value, xref_id)
+            if sub_records:
+                level += 1
+                stack += [(level, rec) for rec in reversed(sub_records)]
+        self._append(lines)
+
+    def write_records(self, records):
+        """Write many records.
+
+        Parameters
+        ----------
+        records : iterable [ `~ged4py.model.Record` or `dict` ]
+            Records to write.
+        """
+        for record in records:
+            self.write_record(record)
+
+    def write_rows(self, rows):
+        """Write many lines.
+
+        Parameters
+        ----------
+        rows : iterable [ `tuple` or `dict` ]
+            Tuples of (level, xref_id, tag, value), extra items are ignored
+            so that `~ged4py.parser.GedcomLine` with decoded value can be
+            used, or dictionaries with "level", "tag" and optional "xref_id"
+            and "value" keys.
+        """
+        lines = []
+        for row in rows:
+            if isinstance(row, dict):
+                self._lines(lines, row["level"], row["tag"], row.get("value"), row.get("xref_id"))
+            else:
+                level, xref_id, tag, value = row[:4]
+                self._lines(lines, level, tag, value, xref_id)
+            if len(lines) >= 1024:
+                self._append(lines)
+                lines = []
+        self._append(lines)
+
+    def _append(self, lines):
+        """Add list of lines to output buffer.
+        """
+        self._buffer += lines
+        self._buffered += len(lines)
+        if self._buffered >= self._buffer_size:
+            self.flush()
+
+    def flush(self):
+        """Encode and write all buffered output to file.
+        """
+        if self._buffer:
+            self._file.write(self._encoder.encode("".join(self._buffer)))
+            self._buffer = []
+            self._buffered = 0
+        self._file.flush()
+
+    def close(self):
+        """Flush output and close the file if it was opened by writer.
+        """
+        self.flush()
+        self._file.write(self._encoder.encode("", final=True))
+        if self._owned:
+            self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
@@ -0,0 +1,7 @@
+"""Test configuration, makes the package importable from source tree.
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "lib"))
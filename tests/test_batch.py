@@ -0,0 +1,84 @@
+"""Unit tests for ged4py.batch module.
+"""
+
+import random
+import unittest
+
+from ged4py.batch import calendar_keys, date_arrays
+from ged4py.calendar import (CalendarDate, FrenchDate, GregorianDate, HebrewDate,
+                             JulianDate, MONTHS_FREN, MONTHS_GREG, MONTHS_HEBR)
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+def _random_dates(count, seed):
+    """Random calendar dates, including partial and invalid ones."""
+    rng = random.Random(seed)
+    dates = []
+    for _ in range(count):
+        klass = rng.choice([GregorianDate, JulianDate, HebrewDate, FrenchDate])
+        kwargs = {}
+        if klass is HebrewDate:
+            months, max_day = MONTHS_HEBR, 31
+            # B.C. and years above 9999 are outside of the tables
+            year = rng.choice([rng.randint(1, 9999), rng.randint(10000, 11000)])
+            kwargs["bc"] = rng.random() < 0.05
+        elif klass is FrenchDate:
+            months, max_day = MONTHS_FREN, 31
+            year = rng.randint(1, 1200)
+        else:
+            months, max_day = MONTHS_GREG, 32
+            year = rng.randint(1, 3000)
+            kwargs["bc"] = rng.random() < 0.1
+            if klass is GregorianDate and rng.random() < 0.1:
+                kwargs["dual_year"] = year + 1
+        month = rng.choice([None] + months)
+        day = None
+        if month is not None and rng.random() < 0.7:
+            day = rng.randint(1, max_day)
+        dates.append(klass(year, month, day, **kwargs))
+    return dates
+
+
+@unittest.skipIf(numpy is None, "numpy is not installed")
+class TestCalendarKeys(unittest.TestCase):
+    """Tests for calendar_keys method."""
+
+    def _check(self, dates):
+        jd, flag = calendar_keys(*date_arrays(dates))
+        self.assertEqual(len(jd), len(dates))
+        for date, date_jd, date_flag in zip(dates, jd, flag):
+            self.assertEqual((date_jd, date_flag), date.key(), str(date))
+
+    def test_examples(self):
+        """Mixed calendars and partial dates."""
+        dates = [CalendarDate.parse(datestr) for datestr in [
+            "1 JAN 1700", "JAN 1700", "1700", "FEB 1700", "DEC 1700",
+            "1 JAN 1700/01", "JAN 1700/01", "1700/01", "29 FEB 1700",
+            "31 DEC 1899", "500 B.C.", "MAR 44 B.C.", "15 MAR 44 B.C.",
+            "@#DJULIAN@ 29 FEB 1700", "@#DJULIAN@ FEB 1700", "@#DJULIAN@ 1700",
+            "@#DJULIAN@ 5 FEB 44 B.C.", "@#DJULIAN@ DEC 1 B.C.",
+            "@#DHEBREW@ 1 TSH 5784", "@#DHEBREW@ ADR 5784", "@#DHEBREW@ ADS 5784",
+            "@#DHEBREW@ 30 ADS 5783", "@#DHEBREW@ ELL 5784", "@#DHEBREW@ 5784",
+            "@#DHEBREW@ 1 NSN 10000", "@#DHEBREW@ 1 NSN 3 B.C.",
+            "@#DFRENCH R@ 1 VEND 1", "@#DFRENCH R@ COMP 3", "@#DFRENCH R@ 6 COMP 3",
+            "@#DFRENCH R@ 6 COMP 4", "@#DFRENCH R@ FRUC 4", "@#DFRENCH R@ 12",
+        ]]
+        self._check(dates)
+
+    def test_random(self):
+        """Random dates in all calendars."""
+        self._check(_random_dates(3000, 34))
+
+    def test_empty(self):
+        """Empty input gives empty output."""
+        jd, flag = calendar_keys(*date_arrays([]))
+        self.assertEqual(len(jd), 0)
+        self.assertEqual(len(flag), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
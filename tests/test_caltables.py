@@ -0,0 +1,126 @@
+"""Unit tests for ged4py.detail.caltables module.
+"""
+
+import random
+import unittest
+
+import convertdate.french_republican
+import convertdate.hebrew
+
+from ged4py.calendar import FrenchDate, HebrewDate
+from ged4py.detail import caltables
+
+
+def _sample_years(first, last, count, seed):
+    """Random sample of years plus range boundaries."""
+    rng = random.Random(seed)
+    years = set(rng.sample(range(first, last + 1), count))
+    years.update([first, first + 1, last - 1, last])
+    return sorted(years)
+
+
+class TestHebrew(unittest.TestCase):
+    """Tests for Hebrew calendar tables."""
+
+    def setUp(self):
+        self.years = _sample_years(caltables.HEBREW_FIRST_YEAR,
+                                   caltables.HEBREW_LAST_YEAR, 200, 37)
+        # make sure that sample has enough years of each kind
+        leap = [year for year in self.years if convertdate.hebrew.leap(year)]
+        self.assertGreater(len(leap), 50)
+        self.assertGreater(len(self.years) - len(leap), 50)
+
+    def test_month_length(self):
+        """Compare month lengths with convertdate."""
+        for year in self.years:
+            for month in range(1, 14):
+                self.assertEqual(caltables.hebrew_month_length(year, month),
+                                 convertdate.hebrew.month_length(year, month),
+                                 (year, month))
+
+    def test_to_jd(self):
+        """Compare every day of every month with convertdate."""
+        for year in self.years:
+            n_months = convertdate.hebrew.year_months(year)
+            for month in range(1, n_months + 1):
+                n_days = convertdate.hebrew.month_length(year, month)
+                for day in range(1, n_days + 1):
+                    self.assertEqual(caltables.hebrew_to_jd(year, month, day),
+                                     convertdate.hebrew.to_jd(year, month, day),
+                                     (year, month, day))
+            # CalendarDate.key() also asks for the month after the last one
+            # and for day after the last day of month
+            for month, day in [(n_months + 1, 1), (14, 1), (1, 31), (7, 0)]:
+                self.assertEqual(caltables.hebrew_to_jd(year, month, day),
+                                 convertdate.hebrew.to_jd(year, month, day),
+                                 (year, month, day))
+
+    def test_outside_table(self):
+        """Years outside of the table are passed to convertdate."""
+        for year in (-100, -1, 0, 10000, 12345):
+            for month in (1, 7, 12, 13):
+                self.assertEqual(caltables.hebrew_to_jd(year, month, 1),
+                                 convertdate.hebrew.to_jd(year, month, 1))
+                self.assertEqual(caltables.hebrew_month_length(year, month),
+                                 convertdate.hebrew.month_length(year, month))
+
+    def test_leap_months(self):
+        """Keys of ADR and ADS dates in leap and non-leap years."""
+        for year in (5779, 5782, 5784, 5780, 5781, 5783):
+            for month, num in (("ADR", 6), ("ADS", 7)):
+                for day in (None, 1, 29):
+                    date = HebrewDate(year, month, day)
+                    # same as HebrewDate.key() before tables were added
+                    day_ = day if day is not None else convertdate.hebrew.month_length(year, num)
+                    expect = convertdate.hebrew.to_jd(year, num, day_)
+                    self.assertEqual(date.key()[0], expect, (year, month, day))
+
+
+class TestFrench(unittest.TestCase):
+    """Tests for French Republican calendar tables."""
+
+    def setUp(self):
+        # equinox calculation in convertdate only works until year 1208
+        self.years = _sample_years(1, 1200, 100, 41)
+        leap = [year for year in self.years if convertdate.french_republican.leap(year)]
+        self.assertGreater(len(leap), 10)
+
+    def test_to_jd(self):
+        """Compare every day of every month with convertdate."""
+        french = convertdate.french_republican
+        for year in self.years:
+            for month in range(1, 14):
+                n_days = 5 + french.leap(year) if month == 13 else 30
+                for day in range(1, n_days + 1):
+                    self.assertEqual(caltables.french_to_jd(year, month, day),
+                                     french.to_jd(year, month, day),
+                                     (year, month, day))
+
+    def test_invalid(self):
+        """Invalid dates raise ValueError like in convertdate."""
+        french = convertdate.french_republican
+        for year in self.years:
+            for month, day in [(13, 6 + french.leap(year)), (14, 1), (1, 31), (1, 0)]:
+                with self.assertRaises(ValueError):
+                    french.to_jd(year, month, day)
+                with self.assertRaises(ValueError):
+                    caltables.french_to_jd(year, month, day)
+
+    def test_comp(self):
+        """Keys of COMP dates in leap and non-leap years."""
+        french = convertdate.french_republican
+        for year in (3, 4, 7, 11, 12):
+            self.assertEqual(FrenchDate(year, "COMP", 5).key()[0],
+                             french.to_jd(year, 13, 5))
+            if french.leap(year):
+                expect = french.to_jd(year, 13, 6)
+            else:
+                expect = french.to_jd(year + 1, 1, 1) - 1
+            self.assertEqual(FrenchDate(year, "COMP", 6).key()[0], expect)
+            # missing day means last day of COMP
+            self.assertEqual(FrenchDate(year, "COMP").key()[0],
+                             french.to_jd(year, 13, 5))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,108 @@
+"""Unit tests for ged4py.date module.
+"""
+
+import random
+import unittest
+
+from ged4py.calendar import CalendarDate
+from ged4py.date import DATES, DateValue, DateValuePhrase
+
+
+def _regex_parse(datestr):
+    """Reference parser, tries every pattern in DATES in order (this is how
+    DateValue.parse worked before dispatching on leading keyword).
+    """
+    if datestr:
+        datestr = datestr.strip()
+    if not datestr:
+        return DateValuePhrase(None)
+    for regex, klass in DATES:
+        m = regex.match(datestr)
+        if m is not None:
+            groups = {}
+            for key, val in m.groupdict().items():
+                if key != 'phrase':
+                    val = CalendarDate.parse(val)
+                groups[key] = val
+            return klass(**groups)
+    return DateValuePhrase(datestr)
+
+
+_KEYWORDS = ["FROM", "TO", "BET", "AND", "BEF", "AFT", "ABT", "CAL", "EST",
+             "INT", "from", "Bet", "abt", "BEF.", "ABOUT", "FROMAGE", "TOO",
+             "(", ")", "(x y)", ""]
+_MONTHS = ["JAN", "feb", "VEND", "TSH", "ADS", "XYZ", "COMP", "MAR", "dec",
+           "BET", "INT"]
+_CALENDARS = ["", "@#DJULIAN@ ", "@#DHEBREW@ ", "@#DFRENCH R@ ",
+              "@#DGREGORIAN@ ", "@#DROMAN@ ", "@#DUNKNOWN@ "]
+_ODD = ["", " ", None, "(...)", "()", "((a))", "1", "@#DJULIAN@", "TO", "ABT",
+        "12 MAR 1890 ", " 12 mar 1890"]
+
+
+def _make_date(rng):
+    """Make random <DATE> string, valid or not.
+    """
+    parts = [rng.choice(_CALENDARS)]
+    r = rng.random()
+    if r < .3:
+        parts.append("%d %s " % (rng.randint(0, 40), rng.choice(_MONTHS)))
+    elif r < .5:
+        parts.append(rng.choice(_MONTHS) + " ")
+    year = str(rng.randint(1, 6000))
+    if rng.random() < .1:
+        year += "/" + str(rng.randint(0, 99)).zfill(rng.choice([1, 2, 4]))
+    if rng.random() < .05:
+        year += rng.choice([" B.C.", "B.C.", " BC"])
+    parts.append(year)
+    return "".join(parts)
+
+
+def _make_date_value(rng):
+    """Make random <DATE_VALUE> string, valid or not.
+    """
+    r = rng.random()
+    space = rng.choice([" ", "  ", "\t", " \t "])
+    if r < .15:
+        return _make_date(rng)
+    if r < .7:
+        value = rng.choice(_KEYWORDS) + space + _make_date(rng)
+        if rng.random() < .4:
+            value += space + rng.choice(_KEYWORDS) + space + _make_date(rng)
+        return value
+    if r < .8:
+        return "INT" + space + _make_date(rng) + space + "(phrase)"
+    if r < .9:
+        return " ".join(rng.choice(_KEYWORDS + _MONTHS + [_make_date(rng)])
+                        for _ in range(rng.randint(1, 4)))
+    return rng.choice(_ODD)
+
+
+def _result(parse, datestr):
+    """Return comparable result of parsing, or exception.
+    """
+    try:
+        value = parse(datestr)
+    except Exception as exc:
+        return ("exception", type(exc).__name__, str(exc))
+    return (type(value).__name__, repr(value), str(value),
+            tuple((type(date).__name__, str(date), date.key()) for date in value.key()))
+
+
+class TestDateValueParse(unittest.TestCase):
+    """Tests for DateValue.parse method."""
+
+    def test_differential(self):
+        """Parser gives the same results as trying every pattern in turn."""
+        rng = random.Random(7)
+        kinds = set()
+        for _ in range(20000):
+            datestr = _make_date_value(rng)
+            expected = _result(_regex_parse, datestr)
+            self.assertEqual(_result(DateValue.parse, datestr), expected, datestr)
+            kinds.add(expected[0])
+        # make sure that corpus covers all kinds of dates and errors
+        self.assertEqual(len(kinds), len(DATES) + 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,47 @@
+"""Unit tests for ged4py.graph module.
+"""
+
+import unittest
+
+from ged4py.graph import FamilyGraph
+
+
+class TestFamilyGraph(unittest.TestCase):
+    """Tests for FamilyGraph class."""
+
+    def test_generation_depth(self):
+        """Generation numbers and topological order."""
+        # 0 and 1 are parents of 2 and 3, 2 and 4 are parents of 5
+        graph = FamilyGraph(["@I{}@".format(i) for i in range(6)],
+                            [("@F1@", 0, 1, [2, 3]), ("@F2@", 2, 4, [5])])
+        self.assertEqual(list(graph.generation_depth()), [0, 0, 1, 1, 0, 2])
+        position = {node: i for i, node in enumerate(graph.topological_order())}
+        for node in range(6):
+            for parent in graph.parents(node):
+                self.assertLess(position[parent], position[node])
+        self.assertEqual(graph.ancestors(5), {2: 1, 4: 1, 0: 2, 1: 2})
+
+    def test_cycle(self):
+        """Individuals in cycles and their descendants get -1."""
+        # 1 and 2 are parents of each other, 1 and 3 are parents of 4,
+        # 4 is parent of 5, 0 and 3 are unrelated to the cycle
+        graph = FamilyGraph(["@I{}@".format(i) for i in range(6)],
+                            [("@F1@", 2, -1, [1]), ("@F2@", 1, -1, [2]),
+                             ("@F3@", 1, 3, [4]), ("@F4@", 4, -1, [5]),
+                             ("@F5@", 0, -1, [3])])
+        depth = graph.generation_depth()
+        self.assertEqual(depth[1], -1)
+        self.assertEqual(depth[2], -1)
+        # descendants of the cycle
+        self.assertEqual(depth[4], -1)
+        self.assertEqual(depth[5], -1)
+        # not related to the cycle
+        self.assertEqual(depth[0], 0)
+        self.assertEqual(depth[3], 1)
+        order = list(graph.topological_order())
+        self.assertEqual(sorted(order), list(range(6)))
+        self.assertEqual(set(order[-4:]), {1, 2, 4, 5})
+
+
+if __name__ == "__main__":
+    unittest.main()
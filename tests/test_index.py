@@ -0,0 +1,67 @@
+"""Unit tests for ged4py.index module.
+"""
+
+import io
+import unittest
+
+from ged4py.index import Citation, CitationIndex
+from ged4py.parser import GedcomReader
+
+
+def _make_file(lines):
+    """Make in-memory GEDCOM file from a list of lines.
+    """
+    data = "\n".join(["0 HEAD", "1 CHAR UTF-8"] + lines + ["0 TRLR", ""])
+    return io.BytesIO(data.encode("utf-8"))
+
+
+class TestCitationIndex(unittest.TestCase):
+    """Tests for CitationIndex class."""
+
+    def test_document_order(self):
+        """Citations are returned in document order."""
+        lines = [
+            "0 @I1@ INDI",
+            "1 BIRT",
+            "2 DATE 1 JAN 1900",
+            "2 SOUR @S1@",
+            "3 PAGE p. 1",
+            "2 SOUR @S1@",
+            "3 PAGE p. 2",
+            "3 DATA",
+            "4 TEXT text",
+            "2 NOTE",
+            "3 SOUR @S1@",
+            "4 PAGE p. 3",
+            "2 SOUR @S1@",
+            "3 PAGE p. 4",
+            "1 DEAT Y",
+            "1 RESI",
+            "2 PLAC Somewhere",
+            "1 SOUR @S1@",
+            "2 PAGE p. 5",
+            "1 OCCU Smith",
+            "0 @I2@ INDI",
+            "1 BURI",
+            "2 SOUR @S1@",
+            "3 PAGE p. 6",
+            "3 QUAY 3",
+            "0 @S1@ SOUR",
+            "1 TITL Source",
+        ]
+        with GedcomReader(_make_file(lines)) as reader:
+            index = CitationIndex.from_reader(reader)
+
+        pages = [citation.page for citation in index.citations("@S1@")]
+        self.assertEqual(pages, ["p. 1", "p. 2", "p. 3", "p. 4", "p. 5", "p. 6"])
+        pages = [citation.page for citation in index.cited_by("@I1@")]
+        self.assertEqual(pages, ["p. 1", "p. 2", "p. 3", "p. 4", "p. 5"])
+        self.assertEqual(index.cited_by("@I2@"),
+                         [Citation("@S1@", "@I2@", "BURI", "p. 6", "3")])
+        self.assertEqual(index.unsourced(),
+                         [("@I1@", "DEAT"), ("@I1@", "RESI"), ("@I1@", "OCCU")])
+        self.assertEqual(index.n_facts, 5)
+
+
+if __name__ == "__main__":
+    unittest.main()
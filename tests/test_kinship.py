@@ -0,0 +1,47 @@
+"""Unit tests for ged4py.kinship module.
+"""
+
+import unittest
+
+from ged4py.graph import FamilyGraph
+from ged4py.kinship import KinshipCalculator
+
+
+class TestKinshipCalculator(unittest.TestCase):
+    """Tests for KinshipCalculator class."""
+
+    def test_kinship(self):
+        """Kinship of a simple pedigree."""
+        # 0 and 1 are parents of 2 and 3, 2 and 4 are parents of 5
+        graph = FamilyGraph(["@I{}@".format(i) for i in range(6)],
+                            [("@F1@", 0, 1, [2, 3]), ("@F2@", 2, 4, [5])])
+        calc = KinshipCalculator(graph)
+        self.assertEqual(calc.kinship(0, 0), 0.5)
+        self.assertEqual(calc.kinship(0, 1), 0.)
+        self.assertEqual(calc.kinship(0, 2), 0.25)
+        self.assertEqual(calc.kinship(2, 3), 0.25)
+        self.assertEqual(calc.kinship(3, 5), 0.125)
+        self.assertEqual(calc.kinships(3), {0: 0.25, 1: 0.25, 2: 0.25, 3: 0.5, 5: 0.125})
+
+    def test_kinship_cycle(self):
+        """Parent cycle must not make kinship loop forever."""
+        # 1 and 2 are parents of each other and parents of 0, 3 is unrelated
+        graph = FamilyGraph(["@I{}@".format(i) for i in range(4)],
+                            [("@F1@", 2, -1, [1]), ("@F2@", 1, -1, [2]),
+                             ("@F3@", 1, 2, [0])])
+        self.assertEqual(list(graph.generation_depth()), [-1, -1, -1, 0])
+        calc = KinshipCalculator(graph)
+        # individuals in and below the cycle are treated as founders
+        self.assertEqual(calc.kinship(0, 1), 0.)
+        self.assertEqual(calc.kinship(2, 0), 0.)
+        self.assertEqual(calc.kinship(1, 2), 0.)
+        self.assertEqual(calc.kinship(0, 0), 0.5)
+        self.assertEqual(calc.kinship(0, 3), 0.)
+        self.assertEqual(calc.kinships(1), {1: 0.5})
+        self.assertEqual(calc.kinships(3), {3: 0.5})
+        # relationships still use parent links
+        self.assertEqual(calc.relationship(0, 1), "parent")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,214 @@
+"""Unit tests for ged4py.model module.
+"""
+
+import io
+import random
+import unittest
+from unittest import mock
+
+from ged4py import model
+from ged4py.date import DateValue
+from ged4py.model import Pointer
+from ged4py.parser import GedcomReader
+
+
+def _ref_sub_tag(record, path, follow=True):
+    """Reference implementation of Record.sub_tag, scans sub-records
+    without tag index (this is how it worked before the index was added).
+    """
+    if not record.sub_records:
+        return None
+    head, _, tail = path.partition('/')
+    for rec in record.sub_records:
+        if rec.tag != head:
+            continue
+        if follow and isinstance(rec, Pointer):
+            rec = rec.ref
+        if rec is not None:
+            if tail:
+                sub_tag = _ref_sub_tag(rec, tail, follow=follow)
+                if sub_tag:
+                    return sub_tag
+            else:
+                return rec
+    return None
+
+
+def _ref_sub_tags(record, *tags, follow=True):
+    """Reference implementation of Record.sub_tags, matches every path
+    against every sub-record.
+    """
+    def _sub_tags(record, tag_matches, my_tag):
+        for rec in record.sub_records:
+            sub_tag = my_tag + [rec.tag]
+            for m in tag_matches:
+                if m[:len(sub_tag)] == sub_tag:
+                    if follow and isinstance(rec, Pointer):
+                        rec = rec.ref
+                    if len(sub_tag) == len(m):
+                        yield rec
+                    else:
+                        yield from _sub_tags(rec, tag_matches, sub_tag)
+                    break
+
+    if not tags:
+        records = list(record.sub_records)
+        if follow:
+            records = [rec.ref if isinstance(rec, Pointer) else rec for rec in records]
+        return records
+    return list(_sub_tags(record, [tag.split("/") for tag in tags if tag], []))
+
+
+_TAGS = ["A", "B", "C", "P"]
+_PATHS = ["", "A", "A/", "A//", "/A", "A/B", "B/A", "A/B/C", "P", "P/A",
+          "P/A/B", "A/P/B", "C/P", "B/A/C/A"]
+
+
+def _make_lines(rng, level, n_targets, wide):
+    """Make random sub-records, "P" records are pointers to level 0 records
+    which have sub-records themselves.
+    """
+    lines = []
+    count = rng.randint(17, 40) if wide and rng.random() < .5 else rng.randint(0, 5)
+    for _ in range(count):
+        tag = rng.choice(_TAGS)
+        if tag == "P":
+            lines.append("{} P @R{}@".format(level, rng.randint(1, n_targets)))
+        else:
+            lines.append("{} {} {}".format(level, tag, rng.randint(0, 9)))
+            if level < 4 and rng.random() < .5:
+                lines += _make_lines(rng, level + 1, n_targets, wide and level < 2)
+    return lines
+
+
+class TestSubTags(unittest.TestCase):
+    """Tests for sub_tag and sub_tags methods."""
+
+    def test_differential(self):
+        """Results are the same as from scanning implementation, for narrow
+        records and for records larger than _TAG_INDEX_MIN_SIZE which use
+        tag index.
+        """
+        rng = random.Random(4)
+        n_targets = 5
+        lines = ["0 HEAD"]
+        for i in range(1, n_targets + 1):
+            lines += ["0 @R{}@ REC".format(i)] + _make_lines(rng, 1, n_targets, True)
+        for i in range(200):
+            lines += ["0 @X{}@ REC".format(i)] + _make_lines(rng, 1, n_targets, i % 2 == 0)
+        lines.append("0 TRLR")
+        data = ("\n".join(lines) + "\n").encode()
+
+        n_wide = 0
+        with GedcomReader(io.BytesIO(data), record_cache_size=1000) as reader:
+            for record in reader.records0("REC"):
+                n_wide += len(record.sub_records) > model._TAG_INDEX_MIN_SIZE
+                for follow in (True, False):
+                    for path in _PATHS:
+                        self.assertIs(record.sub_tag(path, follow),
+                                      _ref_sub_tag(record, path, follow), path)
+                    for _ in range(5):
+                        tags = rng.sample(_PATHS, rng.randint(0, 3))
+                        self.assertEqual(
+                            [id(rec) for rec in record.sub_tags(*tags, follow=follow)],
+                            [id(rec) for rec in _ref_sub_tags(record, *tags, follow=follow)],
+                            tags)
+
+                # index is updated when sub-records are added
+                new = model.make_record(1, None, "A", None, [], 0, model.Dialect.DEFAULT)
+                record.sub_records.append(new)
+                self.assertEqual([id(rec) for rec in record.sub_tags("A")],
+                                 [id(rec) for rec in _ref_sub_tags(record, "A")])
+                self.assertIs(record.sub_tags("A")[-1], new)
+        # make sure that both code paths are used
+        self.assertGreater(n_wide, 10)
+
+
+_DATES_GED = b"""\
+0 HEAD
+1 CHAR ASCII
+0 @I1@ INDI
+1 BIRT
+2 DATE ABT 1900
+1 DEAT
+2 DATE BET 1 JAN 1950 AND @#DJULIAN@ 3 FEB 1951
+1 BURI
+2 DATE INT 1960 (a rather long phrase for the date value)
+1 CHR
+2 DATE (phrase only)
+1 EVEN
+2 DATE not a date at all
+0 TRLR
+"""
+
+# str() of each DATE record as printed by the version which parsed dates
+# in freeze()
+_DATES_STR = [
+    "Date(level=2, tag=DATE, value=DateValueAbout(date=1900), offset=39, #subrec=0)",
+    "Date(level=2, tag=DATE, value=DateValueRange(date1=1 JAN 1950, "
+    "date2=@#DJULIAN@ 3 FEB 1951), offset=62, #subrec=0)",
+    "Date(level=2, tag=DATE, value=DateValueInterpreted(date=1960, "
+    "phrase=a rather long phrase for the date value), offset=117, #subrec=0)",
+    "Date(level=2, tag=DATE, value=DateValuePhrase(phrase=phrase only), offset=181, #subrec=0)",
+    "Date(level=2, tag=DATE, value=DateValuePhrase(phrase=not a date at all), "
+    "offset=209, #subrec=0)",
+]
+
+_DATES_RAW = [
+    "ABT 1900",
+    "BET 1 JAN 1950 AND @#DJULIAN@ 3 FEB 1951",
+    "INT 1960 (a rather long phrase for the date value)",
+    "(phrase only)",
+    "not a date at all",
+]
+
+
+class TestDate(unittest.TestCase):
+    """Tests for Date class."""
+
+    def _dates(self, reader):
+        indi = next(reader.records0("INDI"))
+        return [rec.sub_tag("DATE") for rec in indi.sub_records]
+
+    def test_lazy_value(self):
+        """Value is parsed on first access and then reused."""
+        parse = DateValue.parse
+        with GedcomReader(io.BytesIO(_DATES_GED)) as reader, \
+                mock.patch.object(DateValue, "parse", side_effect=parse) as mock_parse:
+            dates = self._dates(reader)
+            self.assertEqual(mock_parse.call_count, 0)
+            for i, (date, raw) in enumerate(zip(dates, _DATES_RAW)):
+                self.assertEqual(date.raw_value, raw)
+                self.assertEqual(mock_parse.call_count, i)
+                value = date.value
+                self.assertIsInstance(value, DateValue)
+                self.assertEqual(mock_parse.call_count, i + 1)
+                self.assertIs(date.value, value)
+                self.assertEqual(mock_parse.call_count, i + 1)
+                self.assertEqual(value, parse(raw))
+                # raw value is not changed by parsing
+                self.assertEqual(date.raw_value, raw)
+
+    def test_str(self):
+        """str() and repr() are the same as before lazy parsing."""
+        with GedcomReader(io.BytesIO(_DATES_GED)) as reader:
+            dates = self._dates(reader)
+            self.assertEqual([str(date) for date in dates], _DATES_STR)
+            self.assertEqual([repr(date) for date in dates], _DATES_STR)
+            self.assertEqual([date.raw_value for date in dates], _DATES_RAW)
+
+    def test_assign(self):
+        """Assigning DateValue or string to value."""
+        date = model.make_record(2, None, "DATE", "ABT 1900", [], 0, model.Dialect.DEFAULT)
+        date.freeze()
+        value = DateValue.parse("1 JAN 2000")
+        date.value = value
+        self.assertIs(date.value, value)
+        self.assertIsNone(date.raw_value)
+        date.value = "AFT 1800"
+        self.assertEqual(date.raw_value, "AFT 1800")
+        self.assertEqual(date.value, DateValue.parse("AFT 1800"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,50 @@
+"""Unit tests for ged4py.detail.name module.
+"""
+
+import unittest
+
+from ged4py.detail.name import (parse_name_altree, parse_name_ancestris,
+                                parse_name_myher, split_name)
+from ged4py.model import Dialect, make_record
+
+
+def _name(value, dialect, **sub_values):
+    """Make NAME record with sub-records, without freezing it.
+    """
+    sub_records = [make_record(2, None, tag, sub_value, [], 0, dialect).freeze()
+                   for tag, sub_value in sub_values.items()]
+    return make_record(1, None, "NAME", value, sub_records, 0, dialect)
+
+
+class TestParseName(unittest.TestCase):
+    """Tests for name parsing functions."""
+
+    def test_split_name(self):
+        self.assertEqual(split_name("First /Last/"), ("First", "Last", ""))
+        self.assertEqual(split_name("/Last/ First"), ("", "Last", "First"))
+        self.assertEqual(split_name("First /Last/ Jr."), ("First", "Last", "Jr."))
+        self.assertEqual(split_name("First Jr."), ("First Jr.", "", ""))
+
+    def test_dialects(self):
+        """Parsers use sub-records of their dialects, and results are
+        memoized on NAME value and those sub-record values.
+        """
+        cases = [
+            (parse_name_altree, Dialect.ALTREE, "Jane /Smith (Ivanova)/",
+             {"SURN": "Ivanova"}, ("Jane", "Smith", "", "Ivanova")),
+            (parse_name_myher, Dialect.MYHERITAGE, "Jane /Ivanova/",
+             {"_MARNM": "Smith"}, ("Jane", "Smith", "", "Ivanova")),
+            (parse_name_ancestris, Dialect.ANCESTRIS, "Jane /Smith/",
+             {"SURN": "Ivanova"}, ("Jane", "Smith", "")),
+        ]
+        for parse, dialect, value, sub_values, expected in cases:
+            with self.subTest(dialect=dialect):
+                result = parse(_name(value, dialect, **sub_values))
+                self.assertEqual(result, expected)
+                self.assertIs(parse(_name(value, dialect, **sub_values)), result)
+                # without sub-records
+                self.assertEqual(parse(_name(value, dialect)), split_name(value))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,34 @@
+"""Unit tests for ged4py.packed module.
+"""
+
+import unittest
+
+from ged4py.date import DateValue
+from ged4py.packed import KIND_BITS, pack_key, unpack_key
+
+_DATES = ["1 JAN 1900", "JAN 1900", "1900", "ABT 1900", "BEF 1900", "AFT 1900",
+          "BET 1900 AND 1902", "FROM 1900 TO 1903", "FROM 1900", "TO 1900",
+          "CAL 1 FEB 1900", "EST 1899", "INT 1900 (phrase)", "(phrase)", "",
+          "@#DJULIAN@ 20 DEC 1899", "@#DHEBREW@ 1 TSH 5660",
+          "@#DFRENCH R@ 1 VEND 8", "1 JAN 1900/01", "100 B.C."]
+
+
+class TestPackKey(unittest.TestCase):
+    """Tests for pack_key and unpack_key."""
+
+    def test_ordering(self):
+        """Packed keys order and compare like DateValue instances."""
+        values = [DateValue.parse(datestr) for datestr in _DATES]
+        for value in values:
+            key1, key2, kind = unpack_key(pack_key(value))
+            self.assertEqual((key1, key2), value.ordering_key())
+            self.assertIs(kind, value.kind)
+            for other in values:
+                self.assertEqual(pack_key(value) >> KIND_BITS < pack_key(other) >> KIND_BITS,
+                                 value < other)
+                self.assertEqual(pack_key(value) >> KIND_BITS == pack_key(other) >> KIND_BITS,
+                                 value == other)
+
+
+if __name__ == "__main__":
+    unittest.main()
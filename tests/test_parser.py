@@ -0,0 +1,83 @@
+"""Unit tests for ged4py.parser module.
+"""
+
+import io
+import unittest
+
+from ged4py.parser import GedcomReader
+
+
+def _make_data(size):
+    """Make GEDCOM data with individuals and notes of various length.
+    """
+    lines = ["0 HEAD", "1 CHAR UTF-8"]
+    for i in range(1, size + 1):
+        lines += ["0 @I{}@ INDI".format(i),
+                  "1 NAME Name{} /Surname/".format(i),
+                  "1 NOTE " + "x" * (i % 7),
+                  "2 CONT line"]
+    lines.append("0 TRLR")
+    return ("\n".join(lines) + "\n").encode("utf-8")
+
+
+class TestResolve(unittest.TestCase):
+    """Tests for resolve_all and prefetch."""
+
+    def setUp(self):
+        self.data = _make_data(100)
+        self.reads = []
+
+    def _reader(self, **kwargs):
+        """Make reader which counts file reads made after index is built.
+        """
+        reader = GedcomReader(io.BytesIO(self.data), **kwargs)
+        reader.index0
+        read_at = reader._source.read_at
+
+        def counting_read_at(offset, size):
+            self.reads.append((offset, size))
+            return read_at(offset, size)
+
+        reader._source.read_at = counting_read_at
+        return reader
+
+    def test_resolve_all(self):
+        """Adjacent records are read at once, records are cached."""
+        # three runs of adjacent records, in random order, with repeats and
+        # unknown reference ID
+        xref_ids = (["@I{}@".format(i) for i in (12, 3, 4, 5, 11, 10, 50)] +
+                    ["@I3@", "@X1@", "@I12@"])
+        with self._reader() as reader:
+            records = reader.resolve_all(xref_ids)
+            self.assertEqual(len(self.reads), 3)
+            self.assertEqual([None if record is None else record.xref_id for record in records],
+                             [None if xref_id == "@X1@" else xref_id for xref_id in xref_ids])
+            self.assertIs(records[1], records[7])
+            for record in records:
+                if record is not None:
+                    self.assertIs(reader.read_xref(record.xref_id), record)
+                    expected = reader.read_record(reader.xref0[record.xref_id][0])
+                    self.assertEqual(str(record.sub_tag("NAME").value),
+                                     str(expected.sub_tag("NAME").value))
+                    self.assertEqual(record.sub_tag_value("NOTE"), expected.sub_tag_value("NOTE"))
+            # everything is cached now
+            count = len(self.reads)
+            self.assertEqual(reader.resolve_all(xref_ids), records)
+            self.assertEqual(len(self.reads), count)
+
+    def test_prefetch(self):
+        """Prefetch does not evict its own records from cache."""
+        xref_ids = ["@I{}@".format(i) for i in range(1, 21)]
+        with self._reader(record_cache_size=8) as reader:
+            with self.assertLogs("ged4py.parser", "WARNING"):
+                reader.prefetch(xref_ids)
+            count = len(self.reads)
+            for xref_id in xref_ids[:8]:
+                reader.read_xref(xref_id)
+            self.assertEqual(len(self.reads), count)
+            reader.read_xref(xref_ids[8])
+            self.assertEqual(len(self.reads), count + 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
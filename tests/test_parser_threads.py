@@ -0,0 +1,152 @@
+"""Stress tests for sharing ged4py.parser.GedcomReader between threads.
+"""
+
+import io
+import os
+import random
+import tempfile
+import threading
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+from ged4py.model import Pointer
+from ged4py.parser import GedcomReader
+
+_N_THREADS = 16
+
+
+def _make_data(size=400, seed=1):
+    """Make GEDCOM file data with individuals, families and notes.
+    """
+    rng = random.Random(seed)
+    lines = ["0 HEAD", "1 CHAR UTF-8"]
+    families = []
+    for i in range(1, size + 1):
+        lines += ["0 @I{}@ INDI".format(i),
+                  "1 NAME Name{} /Surname{}/".format(i, i % 17),
+                  "1 BIRT",
+                  "2 DATE {} JAN {}".format(rng.randint(1, 28), rng.randint(1700, 1950))]
+        if i > 2:
+            lines.append("1 FAMC @F{}@".format(i))
+            families.append((i, rng.randint(1, i - 1), rng.randint(1, i - 1)))
+        if rng.random() < .3:
+            lines += ["1 NOTE note " + "x" * rng.randint(0, 300),
+                      "2 CONT second line",
+                      "2 CONC  continued"]
+    for family, husband, wife in families:
+        lines += ["0 @F{}@ FAM".format(family),
+                  "1 HUSB @I{}@".format(husband),
+                  "1 WIFE @I{}@".format(wife),
+                  "1 CHIL @I{}@".format(family)]
+    lines.append("0 TRLR")
+    return ("\n".join(lines) + "\n").encode("utf-8")
+
+
+def _dump(record):
+    """Return nested record contents as a list of tuples.
+    """
+    result = []
+    stack = [record]
+    while stack:
+        rec = stack.pop()
+        result.append((rec.level, rec.xref_id, rec.tag, str(rec.value)))
+        stack += reversed(rec.sub_records or [])
+    return result
+
+
+class TestReaderThreads(unittest.TestCase):
+    """Tests for reading records from many threads."""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.data = _make_data()
+        with GedcomReader(io.BytesIO(cls.data)) as reader:
+            cls.index0 = list(reader.index0)
+            cls.xref0 = dict(reader.xref0)
+            cls.records = {offset: _dump(reader.read_record(offset))
+                           for offset, _ in reader.index0}
+        fd, cls.path = tempfile.mkstemp(suffix=".ged")
+        with os.fdopen(fd, "wb") as file:
+            file.write(cls.data)
+
+    @classmethod
+    def tearDownClass(cls):
+        os.unlink(cls.path)
+
+    def _sources(self):
+        """Yield (name, source) for file name and in-memory file.
+        """
+        yield "file", self.path
+        yield "bytesio", io.BytesIO(self.data)
+
+    def _stress(self, reader):
+        """Read all records twice in random order from many threads, also
+        resolving pointers, and return number of mismatches.
+        """
+        offsets = [offset for offset, _ in self.index0] * 2
+        random.Random(1).shuffle(offsets)
+
+        def read(offset):
+            record = reader.read_record(offset)
+            errors = int(_dump(record) != self.records[offset])
+            for rec in record.sub_records or ():
+                if isinstance(rec, Pointer):
+                    target = rec.ref
+                    if target is None or target.xref_id != rec.value:
+                        errors += 1
+                    elif _dump(target) != self.records[self.xref0[rec.value][0]]:
+                        errors += 1
+            return errors
+
+        with ThreadPoolExecutor(_N_THREADS) as executor:
+            return sum(executor.map(read, offsets, chunksize=16))
+
+    def test_first_use(self):
+        """Index is built once and is the same for all threads which
+        access it first at the same time.
+        """
+        for name, source in self._sources():
+            for _ in range(5):
+                if isinstance(source, io.BytesIO):
+                    source = io.BytesIO(self.data)
+                with GedcomReader(source) as reader:
+                    barrier = threading.Barrier(_N_THREADS)
+
+                    def first_use(i):
+                        barrier.wait()
+                        if i % 2:
+                            return reader.xref0, reader.index0
+                        return reader.index0, reader.xref0
+
+                    with ThreadPoolExecutor(_N_THREADS) as executor:
+                        results = list(executor.map(first_use, range(_N_THREADS)))
+                    indices = [result[0] if i % 2 == 0 else result[1]
+                               for i, result in enumerate(results)]
+                    xrefs = [result[1] if i % 2 == 0 else result[0]
+                             for i, result in enumerate(results)]
+                    with self.subTest(source=name):
+                        self.assertTrue(all(index is indices[0] for index in indices))
+                        self.assertTrue(all(xref0 is xrefs[0] for xref0 in xrefs))
+                        self.assertEqual(indices[0], self.index0)
+                        self.assertEqual(xrefs[0], self.xref0)
+
+    def test_read_record(self):
+        """Records and pointers read from many threads are correct."""
+        for name, source in self._sources():
+            # small cache makes threads evict each other's records
+            with GedcomReader(source, record_cache_size=8) as reader:
+                with self.subTest(source=name):
+                    self.assertEqual(self._stress(reader), 0)
+
+    def test_read_record_cold(self):
+        """Records are read correctly when index is built by the first
+        thread that reads a record.
+        """
+        for name, source in self._sources():
+            with GedcomReader(source) as reader:
+                with self.subTest(source=name):
+                    self.assertEqual(self._stress(reader), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
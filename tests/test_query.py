@@ -0,0 +1,64 @@
+"""Unit tests for ged4py.query module.
+"""
+
+import io
+import unittest
+from unittest import mock
+
+from ged4py.date import DateValue
+from ged4py.parser import GedcomReader
+from ged4py.query import Query, Selector
+
+
+def _make_file(lines):
+    """Make in-memory GEDCOM file from a list of lines.
+    """
+    data = "\n".join(["0 HEAD", "1 CHAR UTF-8"] + lines + ["0 TRLR", ""])
+    return io.BytesIO(data.encode("utf-8"))
+
+
+_LINES = [
+    "0 @I1@ INDI",
+    "1 NAME John /Smith/",
+    "1 SEX M",
+    "1 BIRT",
+    "2 DATE ABT 1900",
+    "0 @I2@ INDI",
+    "1 NAME Mary /Smith/",
+    "1 SEX F",
+    "1 BIRT",
+    "2 DATE 1 JAN 1901",
+    "2 PLAC Leeds",
+]
+
+
+class TestQuery(unittest.TestCase):
+    """Tests for Selector and Query classes."""
+
+    def _run(self, selectors):
+        with GedcomReader(_make_file(_LINES)) as reader:
+            return [(record.xref_id, [[str(rec.value) for rec in recs] for recs in results])
+                    for record, results in Query(selectors).run(reader)]
+
+    def test_query(self):
+        """Selectors with and without predicates."""
+        self.assertEqual(self._run(["INDI[SEX=\"F\"]/BIRT/PLAC", "INDI[!BIRT/PLAC]/SEX"]),
+                         [("@I1@", [[], ["M"]]), ("@I2@", [["Leeds"], []])])
+        self.assertEqual(str(Selector('INDI[SEX!="F"]/BIRT')), 'INDI[SEX!="F"]/BIRT')
+
+    def test_date_predicate(self):
+        """DATE predicates compare original strings without parsing dates."""
+        with mock.patch.object(DateValue, "parse", side_effect=AssertionError("date parsed")):
+            result = self._run(['INDI[BIRT/DATE="ABT 1900"]/SEX',
+                                'INDI[BIRT/DATE!="ABT 1900"]/SEX'])
+        self.assertEqual(result, [("@I1@", [["M"], []]), ("@I2@", [[], ["F"]])])
+
+    def test_name_predicate(self):
+        """NAME predicates compare original strings, not name tuples."""
+        self.assertEqual(self._run(['INDI[NAME="Mary /Smith/"]/SEX']),
+                         [("@I2@", [["F"]])])
+        self.assertEqual(self._run(["INDI[NAME=\"('Mary', 'Smith', '')\"]/SEX"]), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
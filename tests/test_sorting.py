@@ -0,0 +1,58 @@
+"""Unit tests for ged4py.sorting module.
+"""
+
+import io
+import unittest
+
+from ged4py.parser import GedcomReader
+from ged4py.sorting import sort_individuals, top_individuals
+
+_LINES = [
+    "0 HEAD",
+    "1 CHAR UTF-8",
+    "0 @I1@ INDI",
+    "1 NAME John /Smith/",
+    "1 BIRT",
+    "2 DATE ABT 1900",
+    "0 @I2@ INDI",
+    "1 NAME Mary /Brown/",
+    "1 BIRT",
+    "2 DATE @#DJULIAN@ 20 DEC 1898",
+    "0 @I3@ INDI",
+    "1 NAME Anne /Smith/",
+    "0 @I4@ INDI",
+    "1 NAME Paul /Adams/",
+    "1 BIRT",
+    "2 DATE BET 1890 AND 1910",
+    "0 TRLR",
+]
+
+
+class TestSorting(unittest.TestCase):
+    """Tests for sorting helpers."""
+
+    def setUp(self):
+        data = ("\n".join(_LINES) + "\n").encode("utf-8")
+        with GedcomReader(io.BytesIO(data)) as reader:
+            self.records = list(reader.records0("INDI"))
+
+    def _ids(self, records):
+        return [record.xref_id for record in records]
+
+    def test_by_date(self):
+        """Sorting by event date, records without date are last."""
+        self.assertEqual(self._ids(sort_individuals(self.records, by="BIRT")),
+                         ["@I4@", "@I2@", "@I1@", "@I3@"])
+        self.assertEqual(self._ids(top_individuals(self.records, 2, by="BIRT")),
+                         ["@I4@", "@I2@"])
+        self.assertEqual(self._ids(top_individuals(self.records, 2, by="BIRT", reverse=True)),
+                         ["@I3@", "@I1@"])
+
+    def test_by_name(self):
+        """Sorting by name, surname first by default."""
+        self.assertEqual(self._ids(sort_individuals(self.records)),
+                         ["@I4@", "@I2@", "@I3@", "@I1@"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,117 @@
+"""Unit tests for ged4py.subset module.
+"""
+
+import io
+import unittest
+
+from ged4py.parser import GedcomReader
+from ged4py.subset import closure, write_subset
+
+_LINES = [
+    "0 HEAD",
+    "1 SOUR APP",
+    "1 CHAR UTF-8",
+    "1 SUBM @U1@",
+    "0 @I1@ INDI",
+    "1 NAME Jöhn /Smith/",
+    "1 FAMS @F1@",
+    "1 SOUR @S1@",
+    "0 @I2@ INDI",
+    "1 NAME Mary /Brown/",
+    "1 FAMS @F1@",
+    "0 @I3@ INDI",
+    "1 NAME Anne /Smith/",
+    "1 FAMC @F1@",
+    "1 NOTE @N1@",
+    "0 @F1@ FAM",
+    "1 HUSB @I1@",
+    "1 WIFE @I2@",
+    "1 CHIL @I3@",
+    "2 _FREL Natural",
+    "0 @S1@ SOUR",
+    "1 TITL Census",
+    "0 @N1@ NOTE Note",
+    "0 @U1@ SUBM",
+    "1 NAME Submitter",
+    "0 TRLR",
+]
+
+
+class TestSubset(unittest.TestCase):
+    """Tests for closure and write_subset."""
+
+    def setUp(self):
+        self.data = ("\n".join(_LINES) + "\n").encode("utf-8")
+
+    def test_encoding(self):
+        """Reader exposes codec used for decoding."""
+        with GedcomReader(io.BytesIO(self.data)) as reader:
+            self.assertEqual(reader.encoding, "utf-8")
+            self.assertEqual(reader.errors, "strict")
+        with GedcomReader(io.BytesIO(self.data), encoding="latin1", errors="replace") as reader:
+            self.assertEqual(reader.encoding, "latin1")
+            self.assertEqual(reader.errors, "replace")
+
+    def test_closure(self):
+        with GedcomReader(io.BytesIO(self.data)) as reader:
+            self.assertEqual(closure(reader, ["@I1@", "@I2@"]), {"@I1@", "@I2@", "@F1@", "@S1@"})
+            self.assertEqual(closure(reader, ["@I3@"]), {"@I3@", "@N1@"})
+            with self.assertRaises(ValueError):
+                closure(reader, ["@S1@"])
+
+    def test_write_subset(self):
+        """Pointers outside of subset are removed with their sub-records."""
+        output = io.BytesIO()
+        with GedcomReader(io.BytesIO(self.data)) as reader:
+            count = write_subset(reader, ["@I1@", "@I3@"], output)
+        self.assertEqual(count, 6)
+        self.assertEqual(output.getvalue().decode("utf-8").splitlines(), [
+            "0 HEAD",
+            "1 SOUR ged4py",
+            "1 CHAR UTF-8",
+            "1 SUBM @U1@",
+            "0 @I1@ INDI",
+            "1 NAME Jöhn /Smith/",
+            "1 FAMS @F1@",
+            "1 SOUR @S1@",
+            "0 @I3@ INDI",
+            "1 NAME Anne /Smith/",
+            "1 FAMC @F1@",
+            "1 NOTE @N1@",
+            "0 @F1@ FAM",
+            "1 HUSB @I1@",
+            "1 CHIL @I3@",
+            "2 _FREL Natural",
+            "0 @S1@ SOUR",
+            "1 TITL Census",
+            "0 @N1@ NOTE Note",
+            "0 @U1@ SUBM",
+            "1 NAME Submitter",
+            "0 TRLR",
+        ])
+
+    def test_no_final_newline(self):
+        """Trailer is written on its own line if input has no final line
+        break.
+        """
+        cases = [
+            (b"0 HEAD\n1 CHAR UTF-8\n0 @I1@ INDI\n1 NAME A /B/", ["@I1@"]),
+            (b"0 HEAD\r\n1 CHAR UTF-8\r\n0 @I1@ INDI\r\n1 NAME A /B/", ["@I1@"]),
+            # last record is pruned
+            (b"0 HEAD\n0 @I1@ INDI\n1 NAME A /B/\n1 FAMS @F1@\n0 @I2@ INDI\n"
+             b"0 @F1@ FAM\n1 HUSB @I1@\n1 WIFE @I2@\n0 @I3@ INDI\n1 FAMS @F1@", ["@I3@"]),
+        ]
+        for data, xref_ids in cases:
+            output = io.BytesIO()
+            with GedcomReader(io.BytesIO(data)) as reader:
+                write_subset(reader, xref_ids, output)
+            lines = output.getvalue().splitlines()
+            with self.subTest(data=data):
+                self.assertEqual(lines[-1], b"0 TRLR")
+                self.assertTrue(lines[-2].startswith((b"1 NAME", b"0 @I3@")))
+                with GedcomReader(io.BytesIO(output.getvalue())) as reader:
+                    self.assertEqual([tag for _, tag in reader.index0][-1], "TRLR")
+
+
+if __name__ == "__main__":
+    unittest.main()
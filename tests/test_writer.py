@@ -0,0 +1,102 @@
+"""Unit tests for ged4py.writer module.
+"""
+
+import io
+import unittest
+
+from ged4py.date import DateValue
+from ged4py.parser import GedcomReader
+from ged4py.writer import GedcomWriter
+
+
+def _make_file(lines):
+    """Make in-memory GEDCOM file from a list of lines.
+    """
+    data = "\n".join(["0 HEAD", "1 CHAR UTF-8"] + lines + ["0 TRLR", ""])
+    return io.BytesIO(data.encode("utf-8"))
+
+
+def _write(records):
+    """Write records to memory and return output as string.
+    """
+    output = io.BytesIO()
+    with GedcomWriter(output) as writer:
+        writer.write_records(records)
+    return output.getvalue().decode("utf-8")
+
+
+class TestGedcomWriter(unittest.TestCase):
+    """Tests for GedcomWriter class."""
+
+    def test_round_trip(self):
+        """Unmodified records are written back with original values."""
+        lines = [
+            "0 @I1@ INDI",
+            "1 NAME John  /Smith/",
+            "2 GIVN John",
+            "1 BIRT",
+            "2 DATE ABT 1 JAN 1900",
+            "2 PLAC Somewhere",
+            "1 NOTE Line one",
+            "2 CONT line two",
+        ]
+        with GedcomReader(_make_file(lines)) as reader:
+            output = _write(reader.records0("INDI"))
+        self.assertEqual(output, "\n".join(lines) + "\n")
+
+    def test_empty_values(self):
+        """Records without value are written without value."""
+        lines = [
+            "0 @I1@ INDI",
+            "1 NAME",
+            "1 NAME ",
+            "1 BIRT",
+            "2 DATE",
+            "2 DATE ",
+            "2 PLAC",
+            "2 PLAC ",
+        ]
+        with GedcomReader(_make_file(lines)) as reader:
+            record = next(reader.records0("INDI"))
+            output = _write([record])
+            self.assertEqual(output, "\n".join(lines) + "\n")
+
+            # empty values assigned by client
+            record.sub_tag("NAME").value = ("", "", "")
+            record.sub_tag("BIRT/DATE").value = DateValue.parse("")
+            output = _write([record])
+            self.assertEqual(output.splitlines()[1], "1 NAME")
+            self.assertEqual(output.splitlines()[4], "2 DATE")
+
+        output = _write([{"tag": "NOTE", "value": None},
+                         {"tag": "NOTE", "value": ""},
+                         {"tag": "NOTE", "value": "\ntext"}])
+        self.assertEqual(output, "0 NOTE\n0 NOTE \n0 NOTE\n1 CONT text\n")
+
+    def test_modified(self):
+        """Modified NAME and DATE records are written with new values."""
+        lines = [
+            "0 @I1@ INDI",
+            "1 NAME John /Smith/",
+            "1 BIRT",
+            "2 DATE 1 JAN 1900",
+        ]
+        with GedcomReader(_make_file(lines)) as reader:
+            record = next(reader.records0("INDI"))
+            name = record.sub_tag("NAME")
+            self.assertEqual(name.raw_value, "John /Smith/")
+            name.value = ("Jane", "Doe", "")
+            self.assertIsNone(name.raw_value)
+            record.sub_tag("BIRT/DATE").value = DateValue.parse("2 FEB 1901")
+            output = _write([record])
+        self.assertEqual(output, "0 @I1@ INDI\n1 NAME Jane /Doe/\n1 BIRT\n2 DATE 2 FEB 1901\n")
+
+        # written record is read back with new values
+        with GedcomReader(_make_file(output.splitlines())) as reader:
+            record = next(reader.records0("INDI"))
+            self.assertEqual(record.sub_tag("NAME").value, ("Jane", "Doe", ""))
+            self.assertEqual(str(record.sub_tag("BIRT/DATE").value), "2 FEB 1901")
+
+
+if __name__ == "__main__":
+    unittest.main()